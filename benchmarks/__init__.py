@@ -0,0 +1,6 @@
+''' Benchmarks of martepy on synthetic applications and logs, each a module printing a table
+of timings. They are not collected by pytest, run them from the repository root with:
+
+python -m benchmarks                      list the benchmarks
+python -m benchmarks <name> [arguments]   run one, e.g. python -m benchmarks reader 1000
+'''
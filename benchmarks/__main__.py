@@ -0,0 +1,24 @@
+''' Run a benchmark by name, passing it the remaining arguments, or list the benchmarks '''
+import os
+import pkgutil
+import runpy
+import sys
+
+def benchmarks():
+    ''' Return the names of the benchmark modules '''
+    directory = os.path.dirname(os.path.abspath(__file__))
+    return sorted(module.name for module in pkgutil.iter_modules([directory])
+                  if not module.name.startswith('_'))
+
+def main(arguments):
+    ''' Run the benchmark named by the first argument as its module would be run '''
+    names = benchmarks()
+    if not arguments or arguments[0] not in names:
+        print('usage: python -m benchmarks <name> [arguments], the benchmarks are:')
+        print('\n'.join(f'  {name}' for name in names))
+        return
+    sys.argv = [f'benchmarks.{arguments[0]}'] + arguments[1:]
+    runpy.run_module(f'benchmarks.{arguments[0]}', run_name='__main__', alter_sys=True)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
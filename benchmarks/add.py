@@ -0,0 +1,57 @@
+''' Benchmark of adding functions to an application: the NonDuplicatingList before,
+comparing each new function with every function already added, against the indexed one
+which only compares functions of the same name.
+
+Run from the repository root with: python -m benchmarks add [functions...]
+'''
+import sys
+import time
+
+from martepy.functions.extra_functions import NonDuplicatingList
+from martepy.marte2.gams.iogam import IOGAM
+
+SIZES = (100, 500, 5000, 20000)
+SCANNING_LIMIT = 500
+
+class ScanningList(list):
+    ''' The NonDuplicatingList before, scanning all items on append '''
+    def append(self, item):
+        if not any(item == list_item for list_item in self):
+            super().append(item)
+
+    def __iadd__(self, other):
+        for item in other:
+            self.append(item)
+        return self
+
+def syntheticFunctions(count):
+    ''' Return count IOGAMs, each with one input and one output signal '''
+    return [IOGAM(f'GAM{index}',
+                  [(f'In{index}', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'float64'}})],
+                  [(f'Out{index}', {'MARTeConfig': {'DataSource': 'DDB1', 'Type': 'float64'}})])
+            for index in range(count)]
+
+def timeAdd(list_class, functions):
+    ''' Return the time taken to add the functions, twice, to a list_class '''
+    start = time.perf_counter()
+    added = list_class()
+    added += functions
+    added += functions
+    elapsed = time.perf_counter() - start
+    assert len(added) == len(functions)
+    return elapsed
+
+def main(sizes=SIZES):
+    ''' Print a table of the time to add each number of functions '''
+    print(f'{"functions":>10} {"scanning (s)":>13} {"indexed (s)":>12} {"speedup":>8}')
+    for size in sizes:
+        functions = syntheticFunctions(size)
+        new = timeAdd(NonDuplicatingList, functions)
+        if size <= SCANNING_LIMIT:
+            old = timeAdd(ScanningList, functions)
+            print(f'{size:>10} {old:>13.3f} {new:>12.4f} {old / new:>7.0f}x')
+        else:
+            print(f'{size:>10} {"-":>13} {new:>12.4f} {"-":>8}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,61 @@
+''' Benchmark of converting synthetic MARTe2 FileWriter binary logs of increasing size to CSV,
+comparing converting one row at a time with RowInterpreter.binToCsvRow against Bin2CSV,
+which converts blocks of rows read through a memory map.
+
+Run from the repository root with: python -m benchmarks bin2csv [rows...]
+'''
+import os
+import random
+import sys
+import tempfile
+import time
+
+from martepy.functions.bin2csv import Bin2CSV, SignalDescriptor, standard_type_descriptors
+from tests.functions.binary_logs import randomValue, writeBinary
+
+ROWS = (10000, 100000, 1000000)
+TYPES = {type_descr.name: type_descr for type_descr in standard_type_descriptors.values()}
+SIGNALS = [SignalDescriptor('Counter', TYPES['uint32'], 1),
+           SignalDescriptor('Time', TYPES['uint64'], 1),
+           SignalDescriptor('Position', TYPES['float64'], 3),
+           SignalDescriptor('Current', TYPES['float32'], 4),
+           SignalDescriptor('Status', TYPES['uint8'], 1),
+           SignalDescriptor('Error', TYPES['int32'], 1)]
+
+def rowByRow(converter):
+    ''' Convert the binary file of converter to CSV one row at a time '''
+    with open(converter.bin_path, 'rb') as fin:
+        interpreter = converter.interpreterClass()(*converter.readHeader(fin))
+        with open(converter.csv_path, 'w', encoding='utf-8') as fout:
+            fout.write(interpreter.headerRow())
+            while True:
+                raw_row = fin.read(interpreter.rowSize())
+                if len(raw_row) < interpreter.rowSize():
+                    break
+                fout.write(interpreter.binToCsvRow(raw_row))
+
+def main(sizes=ROWS):
+    ''' Print the conversion time and throughput of each size in both CSV formats '''
+    random.seed(1)
+    row = [randomValue(signal.type_descr) for signal in SIGNALS for _ in range(signal.elements)]
+    print(f'{"rows":>8} {"MB":>7} {"format":>9} {"row by row (s)":>15} {"Bin2CSV (s)":>12} '
+          f'{"MB/s":>7} {"speedup":>8}')
+    with tempfile.TemporaryDirectory() as directory:
+        bin_path = os.path.join(directory, 'log.bin')
+        for size in sizes:
+            writeBinary(bin_path, SIGNALS, [row] * size)
+            megabytes = os.path.getsize(bin_path) / 1e6
+            for marte2_csv in (True, False):
+                converter = Bin2CSV(bin_path, os.path.join(directory, 'log.csv'), marte2_csv)
+                start = time.perf_counter()
+                rowByRow(converter)
+                old = time.perf_counter() - start
+                start = time.perf_counter()
+                converter.main()
+                new = time.perf_counter() - start
+                name = 'MARTe2' if marte2_csv else 'standard'
+                print(f'{size:>8} {megabytes:>7.1f} {name:>9} {old:>15.3f} {new:>12.3f} '
+                      f'{megabytes / new:>7.1f} {old / new:>7.2f}x')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or ROWS)
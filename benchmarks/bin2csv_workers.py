@@ -0,0 +1,35 @@
+''' Benchmark of converting a synthetic MARTe2 FileWriter binary log to CSV with Bin2CSV in
+the calling process and split between worker processes.
+
+Run from the repository root with: python -m benchmarks bin2csv_workers [workers...]
+'''
+import os
+import random
+import sys
+import tempfile
+import time
+
+from martepy.functions.bin2csv import Bin2CSV
+from benchmarks.bin2csv import SIGNALS
+from tests.functions.binary_logs import randomValue, writeBinary
+
+ROWS = 1000000
+WORKERS = (1, 2, 4, 8)
+
+def main(workers=WORKERS, rows=ROWS):
+    ''' Print the conversion time with each number of workers '''
+    random.seed(1)
+    row = [randomValue(signal.type_descr) for signal in SIGNALS for _ in range(signal.elements)]
+    with tempfile.TemporaryDirectory() as directory:
+        bin_path = os.path.join(directory, 'log.bin')
+        writeBinary(bin_path, SIGNALS, [row] * rows)
+        print(f'{rows} rows, {os.path.getsize(bin_path) / 1e6:.1f} MB, {os.cpu_count()} CPUs')
+        print(f'{"workers":>8} {"Bin2CSV (s)":>12}')
+        for count in workers:
+            converter = Bin2CSV(bin_path, os.path.join(directory, 'log.csv'), workers=count)
+            start = time.perf_counter()
+            converter.main()
+            print(f'{count:>8} {time.perf_counter() - start:>12.3f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or WORKERS)
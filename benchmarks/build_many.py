@@ -0,0 +1,40 @@
+''' Benchmark of buildMany generating the simulations of many variants of a synthetic
+application, see missing_signals.py, one at a time and in worker processes. Each variant
+runs for a different number of cycles. Prints the total time and the slowest variant with each
+number of workers.
+
+Run from the repository root with: python -m benchmarks build_many [workers...]
+'''
+import os
+import sys
+import tempfile
+import time
+
+from martepy.frameworks.simulation_frameworkv2 import buildMany
+from benchmarks.missing_signals import multiStateApplication
+
+WORKERS = (1, 2, 4)
+VARIANTS = 32
+SIGNALS = 500
+
+def main(workers=WORKERS, variants=VARIANTS, signals=SIGNALS):
+    ''' Print the time to build every variant with each number of workers '''
+    apps = []
+    for variant in range(variants):
+        app = multiStateApplication(signals)
+        app.config['timefrequency'] = 100 + variant
+        apps.append(app)
+    print(f'{variants} variants of {signals} signals, {os.cpu_count()} CPUs')
+    print(f'{"workers":>8} {"total (s)":>10} {"slowest (s)":>12}')
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f'variant{index}.cfg') for index in range(variants)]
+        for count in workers:
+            start = time.perf_counter()
+            results = buildMany(apps, paths, workers=count)
+            total = time.perf_counter() - start
+            assert all(result.error is None for result in results)
+            print(f'{count:>8} {total:>10.3f} '
+                  f'{max(result.seconds for result in results):>12.3f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or WORKERS)
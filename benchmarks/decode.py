@@ -0,0 +1,68 @@
+''' Benchmark of the row decoders of RowInterpreter on a synthetic log of every type in
+standard_type_descriptors, as generated in tests/functions/test_bin2csv.py: unpacking each row
+with struct.unpack and its format string as before, with the compiled struct (binToCsvRow),
+with struct.iter_unpack over the whole buffer (binToCsvRows) and with NumPy (blockToCsvRows).
+Every decoder is checked to give the same CSV.
+
+Run from the repository root with: python -m benchmarks decode [rows...]
+'''
+import random
+import struct
+import sys
+import time
+
+import numpy as np
+
+from martepy.functions.bin2csv import (RowInterpreter, SignalDescriptor,
+                                       standard_type_descriptors)
+from tests.functions.binary_logs import randomValue
+
+ROWS = (10000, 100000)
+SIGNALS = [SignalDescriptor(f'S{type_descr.name}{elements}', type_descr, elements)
+           for type_descr in standard_type_descriptors.values() for elements in (1, 3)]
+
+def formatString(interpreter, binary_data):
+    ''' Convert each row unpacking it with struct.unpack and the row format string '''
+    row_format, size = interpreter.rowFormat(), interpreter.rowSize()
+    return ''.join(interpreter.valuesToCsvRow(interpreter._decodeChars( # pylint: disable=W0212
+        struct.unpack(row_format, binary_data[start:start + size])))
+                   for start in range(0, len(binary_data), size))
+
+def compiledStruct(interpreter, binary_data):
+    ''' Convert each row with binToCsvRow '''
+    size = interpreter.rowSize()
+    return ''.join(interpreter.binToCsvRow(binary_data[start:start + size])
+                   for start in range(0, len(binary_data), size))
+
+def iterUnpack(interpreter, binary_data):
+    ''' Convert every row at once with binToCsvRows '''
+    return interpreter.binToCsvRows(binary_data)
+
+def numpyBlock(interpreter, binary_data):
+    ''' Convert every row at once with blockToCsvRows '''
+    return interpreter.blockToCsvRows(np.frombuffer(binary_data, interpreter.rowDtype()))
+
+DECODERS = (('struct.unpack', formatString), ('Struct', compiledStruct),
+            ('iter_unpack', iterUnpack), ('NumPy', numpyBlock))
+
+def main(sizes=ROWS):
+    ''' Print the time each decoder takes for each size of log '''
+    random.seed(1)
+    interpreter = RowInterpreter(*SIGNALS)
+    print(f'{"rows":>8} ' + ' '.join(f'{name + " (s)":>17}' for name, _ in DECODERS))
+    for size in sizes:
+        rows = [struct.pack(interpreter.rowFormat(), *[
+            randomValue(signal.type_descr) for signal in SIGNALS
+            for _ in range(signal.elements)]) for _ in range(min(size, 1000))]
+        binary_data = b''.join(rows[index % len(rows)] for index in range(size))
+        times, expected = [], None
+        for _, decoder in DECODERS:
+            start = time.perf_counter()
+            text = decoder(interpreter, binary_data)
+            times.append(time.perf_counter() - start)
+            assert expected is None or text == expected
+            expected = text
+        print(f'{size:>8} ' + ' '.join(f'{seconds:>17.3f}' for seconds in times))
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or ROWS)
@@ -0,0 +1,46 @@
+''' Benchmark of re-exporting synthetic applications of increasing size after editing one
+GAM, comparing sanitize and removeUnused checking everything again, as after markDirty(),
+against only re-checking the edited GAM, and against the whole of writeToConfig.
+
+Run from the repository root with: python -m benchmarks export [signals...]
+'''
+import sys
+import time
+
+from benchmarks.validation import syntheticApplication
+
+SIGNALS = (1000, 5000, 20000, 50000)
+REPEATS = 5
+
+def timeIt(func, repeats=REPEATS):
+    ''' Return the best wall clock time of calling func '''
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(sizes=SIGNALS):
+    ''' Print the time to clean up each size before exporting it again '''
+    print(f'{"signals":>8} {"full (s)":>10} {"one GAM (s)":>12} {"unchanged (s)":>14} '
+          f'{"writeToConfig (s)":>18}')
+    for size in sizes:
+        app = syntheticApplication(size)
+        app.writeToConfig()
+        gam = app.functions[len(app.functions) // 2]
+
+        def full():
+            app.markDirty()
+            app.removeUnused()
+
+        def edited():
+            gam.output_signals[0][1]['MARTeConfig']['Type'] = 'uint32'
+            app.markDirty(gam)
+            app.removeUnused()
+
+        print(f'{size:>8} {timeIt(full):>10.4f} {timeIt(edited):>12.4f} '
+              f'{timeIt(app.removeUnused):>14.4f} {timeIt(app.writeToConfig, 1):>18.3f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
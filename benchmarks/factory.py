@@ -0,0 +1,45 @@
+''' Benchmark of plugin loading: the time to construct MARTe2Application objects, each of
+whose Factory extends the shared factory of the GAM, DataSource and object plugins, and
+how many plugin modules a fresh interpreter has imported after reading an application.
+
+Run from the repository root with: python -m benchmarks factory [applications]
+'''
+import subprocess
+import sys
+import time
+
+from martepy.marte2.generic_application import MARTe2Application
+
+APPLICATIONS = 1000
+
+COUNT_SCRIPT = '''
+import sys
+from martepy.marte2.reader import readApplication
+readApplication(sys.argv[1])
+print(len([name for name in sys.modules if name.startswith(('martepy.marte2.gams.',
+      'martepy.marte2.datasources.', 'martepy.marte2.interfaces.'))]))
+'''
+
+def constructionTime(applications):
+    ''' Return the time taken to construct the given number of applications '''
+    start = time.perf_counter()
+    for _ in range(applications):
+        MARTe2Application()
+    return time.perf_counter() - start
+
+def importedPlugins(cfg_file):
+    ''' Return how many plugin modules a new interpreter imports to read cfg_file '''
+    result = subprocess.run([sys.executable, '-c', COUNT_SCRIPT, cfg_file],
+                            capture_output=True, text=True, check=True)
+    return int(result.stdout)
+
+def main(applications=APPLICATIONS):
+    ''' Print the construction time and the plugin modules imported '''
+    total = constructionTime(applications)
+    print(f'{applications} applications constructed in {total:.3f}s '
+          f'({total / applications * 1e6:.0f}us each)')
+    print(f'plugin modules imported to read RTApp-2-10.cfg: '
+          f'{importedPlugins("tests/marte2/RTApp-2-10.cfg")}')
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:2]])
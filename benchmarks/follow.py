@@ -0,0 +1,62 @@
+''' Benchmark of following a synthetic MARTe2 FileWriter binary log as it is written, printing
+how long appended rows take to be yielded by BinaryLogFollower against reconverting the whole
+log with Bin2CSV each time, which grows with the size of the log.
+
+Run from the repository root with: python -m benchmarks follow [rows...]
+'''
+import os
+import random
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+from martepy.functions.bin2csv import Bin2CSV, BinaryLogFollower, RowInterpreter
+from benchmarks.bin2csv import SIGNALS
+from tests.functions.binary_logs import randomValue, writeBinary
+
+ROWS = (10000, 100000, 1000000)
+APPENDS = 20
+APPEND_ROWS = 100
+POLL_INTERVAL = 0.01
+
+def main(sizes=ROWS):
+    ''' Print the latency of following and of reconverting each size of log '''
+    random.seed(1)
+    row = [randomValue(signal.type_descr) for signal in SIGNALS for _ in range(signal.elements)]
+    block = struct.pack(RowInterpreter(*SIGNALS).rowFormat(), *row) * APPEND_ROWS
+    print(f'{"rows":>8} {"follow latency (ms)":>20} {"reconvert (ms)":>15}')
+    with tempfile.TemporaryDirectory() as directory:
+        bin_path = os.path.join(directory, 'log.bin')
+        for size in sizes:
+            writeBinary(bin_path, SIGNALS, [row] * size)
+            written = []
+
+            def append():
+                with open(bin_path, 'ab') as binfile:
+                    for _ in range(APPENDS):
+                        time.sleep(POLL_INTERVAL * 5)
+                        written.append(time.perf_counter())
+                        binfile.write(block)
+                        binfile.flush()
+
+            writer = threading.Thread(target=append)
+            latencies = []
+            received = 0
+            for rows in BinaryLogFollower(bin_path, POLL_INTERVAL, POLL_INTERVAL * 20):
+                received += len(rows)
+                if received == size:
+                    writer.start()
+                elif received > size and (received - size) % APPEND_ROWS == 0:
+                    latencies.append(time.perf_counter() - written[len(latencies)])
+            writer.join()
+            start = time.perf_counter()
+            Bin2CSV(bin_path, os.path.join(directory, 'log.csv')).main()
+            reconvert = time.perf_counter() - start
+            print(f'{size:>8} {statistics.median(latencies) * 1e3:>20.1f} '
+                  f'{reconvert * 1e3:>15.1f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or ROWS)
@@ -0,0 +1,37 @@
+''' Benchmark of the time taken to import the reader, measured with python -X importtime in
+a fresh interpreter each time, and of how much of that is spent importing Qt.
+
+Run from the repository root with: python -m benchmarks imports [module] [repeats]
+'''
+import subprocess
+import sys
+
+MODULE = 'martepy.marte2.reader'
+QT_PACKAGES = ('PyQt5', 'qtpy', 'nodeeditor')
+
+def importTimes(module):
+    ''' Import module in a new interpreter and return the cumulative import time in seconds
+    of the module and of the Qt modules it loaded '''
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    total = qt_time = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if name == module:
+            total = int(cumulative) / 1e6
+        elif name.split('.')[0] in QT_PACKAGES:
+            # Summing the time of each Qt module itself counts nested Qt imports once
+            qt_time += int(self_time) / 1e6
+    return total, qt_time
+
+def main(module=MODULE, repeats=5):
+    ''' Print the best import time of module over repeats fresh interpreters '''
+    best = min(importTimes(module) for _ in range(repeats))
+    print(f'{"module":>25} {"import (s)":>11} {"of which Qt (s)":>16}')
+    print(f'{module:>25} {best[0]:>11.3f} {best[1]:>16.3f}')
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(a) for a in sys.argv[2:3]])
@@ -0,0 +1,43 @@
+''' Benchmark of building the simulation of synthetic applications of increasing size again
+with the same SimulationGenerator after editing one of their states, against building it with
+a new generator. Renaming a function reuses the constants of every state, whereas adding a
+logged signal rebuilds those of every state but the one producing it.
+
+Run from the repository root with: python -m benchmarks incremental [signals...]
+'''
+import sys
+import time
+
+from martepy.frameworks.simulation_frameworkv2 import SimulationGenerator
+from benchmarks.missing_signals import multiStateApplication
+from benchmarks.validation import signal
+
+SIGNALS = (1000, 2000, 4000, 8000)
+STATES = 16
+
+def timedBuild(generator, app):
+    ''' Return how long reconfiguring generator with app and building its simulation took '''
+    start = time.perf_counter()
+    generator.configure(app)
+    generator.build()
+    return time.perf_counter() - start
+
+def main(sizes=SIGNALS):
+    ''' Print the time to build each size afresh and again after each edit '''
+    print(f'{"signals":>8} {"edit":>7} {"new (s)":>8} {"again (s)":>10} {"speedup":>8}')
+    for size in sizes:
+        app = multiStateApplication(size, STATES)
+        generator = SimulationGenerator(app)
+        generator.build()
+        function = app.states[-1].threads.objects[0].functions[0]
+        for edit in ('rename', 'signal'):
+            if edit == 'rename':
+                function.configuration_name += 'Edited'
+            else:
+                function.output_signals.append(signal('Extra'))
+            again = timedBuild(generator, app)
+            new = timedBuild(SimulationGenerator(app, configure=False), app)
+            print(f'{size:>8} {edit:>7} {new:>8.3f} {again:>10.3f} {new / again:>7.2f}x')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
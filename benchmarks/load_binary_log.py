@@ -0,0 +1,49 @@
+''' Benchmark of querying synthetic MARTe2 FileWriter binary logs of increasing size with
+loadBinaryLog, against reading the whole file into memory first. Opening the log and reading
+a slice of one signal should take the same time whatever the size of the log.
+
+Run from the repository root with: python -m benchmarks load_binary_log [rows...]
+'''
+import os
+import sys
+import tempfile
+import time
+
+from martepy.functions.bin2csv import RowInterpreter, loadBinaryLog
+from benchmarks.bin2csv import SIGNALS
+from tests.functions.binary_logs import writeBinary
+
+ROWS = (100000, 1000000, 10000000)
+WRITE_ROWS = 100000
+
+def writeLog(path, rows):
+    ''' Write a log of SIGNALS with rows rows of zeros, a block at a time '''
+    writeBinary(path, SIGNALS, [])
+    row_size = RowInterpreter(*SIGNALS).rowSize()
+    block = bytes(WRITE_ROWS * row_size)
+    with open(path, 'ab') as binfile:
+        for start in range(0, rows, WRITE_ROWS):
+            binfile.write(block[:min(rows - start, WRITE_ROWS) * row_size])
+
+def main(sizes=ROWS):
+    ''' Print the time to read a slice of one signal from each size of log '''
+    print(f'{"rows":>9} {"MB":>7} {"query (ms)":>11} {"read all (ms)":>14}')
+    with tempfile.TemporaryDirectory() as directory:
+        bin_path = os.path.join(directory, 'log.bin')
+        for size in sizes:
+            writeLog(bin_path, size)
+            start = time.perf_counter()
+            log = loadBinaryLog(bin_path, ['Time', 'Position'])
+            middle = log['Position'][size // 2:size // 2 + 1000].copy()
+            query = time.perf_counter() - start
+            del log
+            start = time.perf_counter()
+            with open(bin_path, 'rb') as binfile:
+                everything = binfile.read()
+            read_all = time.perf_counter() - start
+            print(f'{size:>9} {len(everything) / 1e6:>7.1f} {query * 1e3:>11.2f} '
+                  f'{read_all * 1e3:>14.1f}')
+            del middle, everything
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or ROWS)
@@ -0,0 +1,71 @@
+''' Benchmark of converting a synthetic MARTe2 FileWriter binary log to CSV and to each
+columnar format, printing the time to write it, its size and the time to load every signal
+back. Formats whose optional library is not installed are skipped.
+
+Run from the repository root with: python -m benchmarks log_export [rows]
+'''
+import importlib
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from martepy.functions.bin2csv import Bin2CSV
+from martepy.functions.log_export import exportBinaryLog
+from benchmarks.bin2csv import SIGNALS
+from tests.functions.binary_logs import randomValue, writeBinary
+
+ROWS = 1000000
+
+def loadCsv(path):
+    ''' Load every column of a standard CSV file '''
+    return np.loadtxt(path, delimiter=',', comments='#')
+
+def loadNpz(path):
+    ''' Load every signal of an npz archive '''
+    with np.load(path) as archive:
+        return {name: archive[name] for name in archive.files}
+
+def loadParquet(path):
+    ''' Load every signal of a Parquet file '''
+    return importlib.import_module('pyarrow.parquet').read_table(path)
+
+def loadHdf5(path):
+    ''' Load every signal of an HDF5 file '''
+    with importlib.import_module('h5py').File(path, 'r') as hdf5_file:
+        return {name: hdf5_file[name][()] for name in hdf5_file}
+
+FORMATS = (('csv', None, loadCsv), ('npz', None, loadNpz),
+           ('parquet', 'pyarrow', loadParquet), ('h5', 'h5py', loadHdf5))
+
+def main(rows=ROWS):
+    ''' Print the write time, size and load time of each format '''
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as directory:
+        bin_path = os.path.join(directory, 'log.bin')
+        writeBinary(bin_path, SIGNALS, [[randomValue(signal.type_descr) for signal in SIGNALS
+                                         for _ in range(signal.elements)] for _ in range(rows)])
+        print(f'{rows} rows, binary log {os.path.getsize(bin_path) / 1e6:.1f} MB')
+        print(f'{"format":>8} {"write (s)":>10} {"MB":>7} {"load (s)":>9}')
+        for extension, module, load in FORMATS:
+            if module and importlib.util.find_spec(module) is None:
+                print(f'{extension:>8} {module} is not installed')
+                continue
+            out_path = os.path.join(directory, f'log.{extension}')
+            start = time.perf_counter()
+            if extension == 'csv':
+                Bin2CSV(bin_path, out_path, marte2_csv=False).main()
+            else:
+                exportBinaryLog(bin_path, out_path)
+            write = time.perf_counter() - start
+            start = time.perf_counter()
+            load(out_path)
+            print(f'{extension:>8} {write:>10.3f} {os.path.getsize(out_path) / 1e6:>7.1f} '
+                  f'{time.perf_counter() - start:>9.3f}')
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS)
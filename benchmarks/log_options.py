@@ -0,0 +1,50 @@
+''' Benchmark of what the simulation of synthetic applications of increasing size logs with
+every signal logged, as by default, against LogOptions logging a tenth of the signals every
+cycle and the rest every 10 cycles in binary. Prints the build time, the bytes each FileWriter
+stores per second of simulation and their memory for buffers.
+
+Run from the repository root with: python -m benchmarks log_options [signals...]
+'''
+import sys
+import time
+
+from martepy.frameworks.simulation_frameworkv2 import SimulationGenerator
+from martepy.functions.extra_functions import type_sizes
+from martepy.marte2.datasources.files.file_datasources import RFileWriter
+from martepy.marte2.generic_application import LogOptions
+from benchmarks.missing_signals import multiStateApplication
+
+SIGNALS = (1000, 2000, 4000, 8000)
+OPTIONS = LogOptions(decimation={'State*G*S[1-9]': 10}, fileformat='binary')
+
+def logCost(simulation):
+    ''' Return the bytes stored per second and buffered by the FileWriters of simulation '''
+    frequency = simulation.config['timefrequency']
+    stored = buffered = 0
+    for writer in simulation.additional_datasources:
+        if not isinstance(writer, RFileWriter):
+            continue
+        row_bytes = sum(type_sizes[signal[1]['MARTeConfig']['Type']] for signal in
+                        writer.input_signals)
+        every = int(writer.configuration_name.lstrip('+')[len('LoggingFileWriter'):] or 1)
+        stored += row_bytes * frequency / every
+        buffered += row_bytes * int(writer.numberofbuffers)
+    return stored, buffered
+
+def main(sizes=SIGNALS):
+    ''' Print the build time and logging cost of each size with and without the options '''
+    print(f'{"signals":>8} {"options":>8} {"build (s)":>10} {"MB/s":>8} {"buffers (MB)":>13}')
+    for size in sizes:
+        app = multiStateApplication(size)
+        for options in (None, OPTIONS):
+            generator = SimulationGenerator(app)
+            generator.log_options = options
+            start = time.perf_counter()
+            simulation = generator.build()
+            elapsed = time.perf_counter() - start
+            stored, buffered = logCost(simulation)
+            print(f'{size:>8} {"yes" if options else "no":>8} {elapsed:>10.3f} '
+                  f'{stored / 1e6:>8.2f} {buffered / 1e6:>13.1f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
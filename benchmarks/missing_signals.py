@@ -0,0 +1,59 @@
+''' Benchmark of SimulationGenerator.build on synthetic applications of increasing size whose
+states each run a different chain of IOGAMs, so every signal logged in one state is missing
+from the others and has to be given a constant there.
+
+Run from the repository root with: python -m benchmarks missing_signals [signals...]
+'''
+import sys
+import time
+
+from martepy.frameworks.simulation_frameworkv2 import SimulationGenerator
+from martepy.marte2.datasources import GAMDataSource, FileWriter
+from martepy.marte2.gams.iogam import IOGAM
+from martepy.marte2.generic_application import MARTe2Application
+from martepy.marte2.objects import (MARTe2RealTimeState, MARTe2RealTimeThread,
+                                    MARTe2ReferenceContainer)
+from benchmarks.validation import SIGNALS_PER_GAM, signal
+
+SIGNALS = (250, 500, 1000, 2000)
+STATES = 4
+
+def multiStateApplication(signals, states=STATES):
+    ''' Return an application whose states each run their own chain of IOGAMs, with the given
+    number of signals in total, the last GAM of each writing to a FileWriter '''
+    app = MARTe2Application()
+    ddb = GAMDataSource('DDB1')
+    app.additional_datasources = [ddb, FileWriter(configuration_name='Logger')]
+    app.functions = []
+    app.states = []
+    for state in range(states):
+        functions = []
+        previous = [f'State{state}Start{index}' for index in range(SIGNALS_PER_GAM)]
+        for gam in range(signals // SIGNALS_PER_GAM // states):
+            outputs = [f'State{state}G{gam}S{index}' for index in range(SIGNALS_PER_GAM)]
+            functions.append(IOGAM(f'State{state}GAM{gam}', [signal(name) for name in previous],
+                                   [signal(name) for name in outputs]))
+            previous = outputs
+        functions.append(IOGAM(f'State{state}Logger', [signal(name) for name in previous],
+                               [signal(name, 'Logger') for name in previous]))
+        app.functions += functions
+        app.states.append(MARTe2RealTimeState(
+            configuration_name=f'State{state}',
+            threads=MARTe2ReferenceContainer(configuration_name='Threads', objects=[
+                MARTe2RealTimeThread(configuration_name='Thread1', functions=functions)])))
+    ddb.output_signals = [output for function in app.functions
+                          for output in function.output_signals]
+    return app
+
+def main(sizes=SIGNALS):
+    ''' Print the build time of each size '''
+    print(f'{"signals":>8} {"build (s)":>10} {"us/signal":>10}')
+    for size in sizes:
+        generator = SimulationGenerator(multiStateApplication(size))
+        start = time.perf_counter()
+        generator.build()
+        elapsed = time.perf_counter() - start
+        print(f'{size:>8} {elapsed:>10.3f} {elapsed / size * 1e6:>10.1f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
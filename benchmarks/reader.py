@@ -0,0 +1,64 @@
+''' Benchmark comparing the line based reader.buildTree against
+parser.parseTree on synthetic configurations of increasing size.
+
+Run from the repository root with: python -m benchmarks reader [sizes...]
+'''
+import gc
+import sys
+import time
+
+from martepy.marte2.reader import buildTree
+from martepy.marte2.parser import parseTree
+
+SIZES = (1000, 10000, 100000)
+
+def syntheticConfig(objects):
+    ''' Build the text of an application with the given number of IOGAM objects,
+    each reading and writing one signal. '''
+    lines = ['$App = {', '    Class = RealTimeApplication', '    +Functions = {',
+             '        Class = ReferenceContainer']
+    for index in range(objects):
+        lines += [f'        +GAM{index} = {{',
+                  '            Class = IOGAM',
+                  '            InputSignals = {',
+                  f'                In{index} = {{',
+                  '                    DataSource = DDB0',
+                  '                    Type = float64',
+                  f'                    Alias = "Signal{index}" // read from DDB0',
+                  '                    NumberOfElements = 1',
+                  '                }',
+                  '            }',
+                  '            OutputSignals = {',
+                  f'                Out{index} = {{',
+                  '                    DataSource = DDB1',
+                  '                    Type = float64',
+                  '                }',
+                  '            }',
+                  '        }']
+    lines += ['    }', '}']
+    return '\n'.join(lines)
+
+def timeIt(func, content, repeats=3):
+    ''' Return the best wall clock time of parsing content with func '''
+    best = float('inf')
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(sizes=SIZES):
+    ''' Print a table of parse times for each size '''
+    print(f'{"objects":>10} {"lines":>10} {"buildTree (s)":>15} {"parseTree (s)":>15} '
+          f'{"speedup":>8}')
+    for size in sizes:
+        content = syntheticConfig(size)
+        repeats = 2 if size >= 100000 else 5
+        old = timeIt(buildTree, content, repeats)
+        new = timeIt(parseTree, content, repeats)
+        print(f'{size:>10} {content.count(chr(10)) + 1:>10} {old:>15.3f} {new:>15.3f} '
+              f'{old / new:>7.2f}x')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,98 @@
+''' Benchmark of writeToConfig on a synthetic application with many signals, writing the
+signal sections as before, by deep copying and normalizing each signal, against the
+current non copying normalization. The application is built consistent, so sanitize and
+removeUnused are skipped to time only the writing, their cost grows with the square of
+the number of functions.
+
+Run from the repository root with: python -m benchmarks signals [signals...]
+'''
+import copy
+import sys
+import time
+
+from martepy.functions.extra_functions import normalizeSignal
+from martepy.marte2.config_object import MARTe2ConfigObject
+from martepy.marte2.datasource import MARTe2DataSource
+from martepy.marte2.datasources import GAMDataSource, LinuxTimer
+from martepy.marte2.gams.iogam import IOGAM
+from martepy.marte2.generic_application import MARTe2Application
+from martepy.marte2.objects import (MARTe2GAMScheduler, MARTe2RealTimeState,
+                                    MARTe2RealTimeThread, MARTe2ReferenceContainer)
+
+SIGNALS = (2000, 20000)
+SIGNALS_PER_GAM = 10
+
+def copyingWriteSignals(defs, config_writer):
+    ''' The signal writing of MARTe2ConfigObject before, copying each signal '''
+    for signal_name, details in defs:
+        config_writer.startSection(signal_name)
+        signal_details = normalizeSignal(copy.deepcopy(details))
+        for key, value in signal_details['MARTeConfig'].items():
+            config_writer.writeNode(key, value)
+        config_writer.endSection(signal_name)
+
+def copyingDataSourceSignals(_, defs, config_writer):
+    ''' The signal writing of MARTe2DataSource before, filtering then copying each signal '''
+    copyingWriteSignals([(name, dict(details, **{'MARTeConfig': {
+        key: value for key, value in details['MARTeConfig'].items()
+        if key not in ('DataSource', 'Alias')}})) for name, details in defs], config_writer)
+
+def scalar(name):
+    ''' A float64 signal of DDB1 with its dimensions and default given '''
+    return (name, {'MARTeConfig': {'DataSource': 'DDB1', 'Type': 'float64',
+                                   'NumberOfDimensions': '1', 'NumberOfElements': '1',
+                                   'Default': '{0}'}})
+
+def syntheticApplication(signals):
+    ''' Return an application of a chain of IOGAMs, each reading the signals the previous
+    one writes, with the given number of signals in total '''
+    app = MARTe2Application()
+    app.sanitize = app.removeUnused = lambda: None
+    app.add(additional_datasources=[GAMDataSource('DDB1'), LinuxTimer('Timer')])
+    app.default_data_source = 'DDB1'
+    app.add(internals=[MARTe2GAMScheduler(timing_datasource_name='Timings')])
+    functions = [IOGAM('GAMTimer', [('Counter', {'MARTeConfig': {
+                                        'DataSource': 'Timer', 'Type': 'uint32'}})],
+                       [scalar('Counter')])]
+    previous = ['Counter']
+    for gam in range(signals // SIGNALS_PER_GAM):
+        names = [f'G{gam}S{index}' for index in range(SIGNALS_PER_GAM)]
+        functions.append(IOGAM(f'GAM{gam}', [scalar(name) for name in previous],
+                               [scalar(name) for name in names]))
+        previous = names
+    # Assigned rather than added, adding compares each function with all those before it
+    app.functions = functions
+    thread = MARTe2RealTimeThread(configuration_name='Thread1', cpu_mask=0x1,
+                                  functions=functions)
+    app.add(states=[MARTe2RealTimeState(configuration_name='State1',
+        threads=MARTe2ReferenceContainer(configuration_name='Threads', objects=[thread]))])
+    return app
+
+def timeWrite(app, repeats=3):
+    ''' Return the best time of writing app to a string, and the text written '''
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        text = app.writeToConfig()
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+def main(sizes=SIGNALS):
+    ''' Print a table of writeToConfig times before and after for each size '''
+    print(f'{"signals":>8} {"copying (s)":>12} {"current (s)":>12} {"speedup":>8}')
+    current = (MARTe2ConfigObject.__dict__['writeSignals'],
+               MARTe2DataSource.__dict__['writeSignals'])
+    for size in sizes:
+        app = syntheticApplication(size)
+        new, new_text = timeWrite(app)
+        MARTe2ConfigObject.writeSignals = staticmethod(copyingWriteSignals)
+        MARTe2DataSource.writeSignals = copyingDataSourceSignals
+        try:
+            old, old_text = timeWrite(app)
+        finally:
+            MARTe2ConfigObject.writeSignals, MARTe2DataSource.writeSignals = current
+        assert old_text == new_text
+        print(f'{size:>8} {old:>12.3f} {new:>12.3f} {old / new:>7.2f}x')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
@@ -0,0 +1,40 @@
+''' Benchmark of SimulationGenerator on synthetic applications of increasing size, see
+validation.py, comparing copying the whole application with copy.deepcopy against sharing
+the objects the simulation does not rewrite. Prints the time and peak memory
+allocated to reset the generator, which copies the application, and the time to build.
+
+Run from the repository root with: python -m benchmarks simulation [signals...]
+'''
+import sys
+import time
+import tracemalloc
+
+from martepy.frameworks.simulation_frameworkv2 import SimulationGenerator
+from benchmarks.validation import syntheticApplication
+
+SIGNALS = (500, 1000, 2000)
+
+def main(sizes=SIGNALS):
+    ''' Print the reset and build cost of each size with and without copy on write '''
+    print(f'{"signals":>8} {"copy":>9} {"reset (ms)":>11} {"reset peak (MB)":>16} '
+          f'{"build (s)":>10}')
+    for size in sizes:
+        app = syntheticApplication(size)
+        for copy_on_write in (False, True):
+            generator = SimulationGenerator(app, copy_on_write=copy_on_write)
+            tracemalloc.start()
+            start = time.perf_counter()
+            generator.reset()
+            reset = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            generator.configure()
+            start = time.perf_counter()
+            generator.build()
+            build = time.perf_counter() - start
+            name = 'on write' if copy_on_write else 'deepcopy'
+            print(f'{size:>8} {name:>9} {reset * 1e3:>11.1f} {peak / 1e6:>16.2f} '
+                  f'{build:>10.3f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
@@ -0,0 +1,73 @@
+''' Benchmark of the memory and time taken by TreeNode and CompactTreeNode trees, comparing
+concatenated against joined printing and scanned against indexed child lookup.
+
+Run from the repository root with: python -m benchmarks tree [sizes...]
+'''
+import gc
+import sys
+import time
+import tracemalloc
+
+from martepy.marte2.parser import parseTree, TreeNode, CompactTreeNode
+from benchmarks.reader import syntheticConfig
+
+SIZES = (1000, 10000, 100000)
+
+def concatenatedStr(node, level=0):
+    ''' The previous TreeNode.__str__ which built the string by repeated concatenation '''
+    result = "\t" * level + f"{node.name}\n"
+    for key, value in node.parameters.items():
+        result += "\t" * (level + 1) + f"{key} = {value}\n"
+    for child in node.children:
+        result += concatenatedStr(child, level + 1)
+    return result
+
+def scannedChild(node, name):
+    ''' The previous lookup of a child by scanning the children '''
+    for child in node.children:
+        if child.name == name:
+            return child
+    return None
+
+def timed(func, *args):
+    ''' Return the result and the wall clock time of func(*args) '''
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def treeMemory(content, node_class):
+    ''' Return the tree and the memory in MB it holds once built '''
+    gc.collect()
+    tracemalloc.start()
+    tree = parseTree(content, node_class)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, current / 1e6
+
+def lookups(tree, getter, objects):
+    ''' Look up every GAM of the application by name with getter '''
+    functions = getter(tree.children[0], '+Functions')
+    for index in range(objects):
+        getter(functions, f'+GAM{index}')
+
+def main(sizes=SIZES):
+    ''' Print tables of memory, printing and lookup times for each size '''
+    print(f'{"objects":>10} {"TreeNode (MB)":>14} {"Compact (MB)":>13} {"+= str (s)":>11} '
+          f'{"join str (s)":>13} {"scan (s)":>9} {"index (s)":>10}')
+    for size in sizes:
+        content = syntheticConfig(size)
+        tree = treeMemory(content, TreeNode)[1]
+        compact_tree, compact = treeMemory(content, CompactTreeNode)
+        old_text, old_str = timed(concatenatedStr, compact_tree)
+        new_text, new_str = timed(str, compact_tree)
+        assert old_text == new_text
+        # Scanning for each of the 100k GAMs takes minutes, so that is left out
+        scan = timed(lookups, compact_tree, scannedChild, size)[1] if size <= 10000 else None
+        index = timed(lookups, compact_tree, CompactTreeNode.getChild, size)[1]
+        scan_text = f'{scan:>9.3f}' if scan is not None else f'{"-":>9}'
+        print(f'{size:>10} {tree:>14.1f} {compact:>13.1f} {old_str:>11.3f} {new_str:>13.3f} '
+              f'{scan_text} {index:>10.4f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,63 @@
+''' Benchmark of MARTe2Application.onlyErrors on synthetic applications of increasing size,
+each a chain of IOGAMs run in several states with the signals they exchange declared on
+their GAMDataSource. The time per signal should stay roughly flat as the size grows.
+
+Run from the repository root with: python -m benchmarks validation [signals...]
+'''
+import sys
+import time
+
+from martepy.marte2.datasources import GAMDataSource, FileWriter
+from martepy.marte2.gams.iogam import IOGAM
+from martepy.marte2.generic_application import MARTe2Application
+from martepy.marte2.objects import (MARTe2RealTimeState, MARTe2RealTimeThread,
+                                    MARTe2ReferenceContainer)
+
+SIGNALS = (1000, 5000, 20000, 50000)
+SIGNALS_PER_GAM = 10
+STATES = 4
+
+def signal(name, datasource='DDB1'):
+    ''' A uint32 signal of the datasource '''
+    return (name, {'MARTeConfig': {'DataSource': datasource, 'Type': 'uint32'}})
+
+def syntheticApplication(signals, states=STATES):
+    ''' Return an application of a chain of IOGAMs, each reading the signals the previous
+    one writes, with the given number of signals in total and run in each state '''
+    app = MARTe2Application()
+    functions = []
+    previous = [f'Start{index}' for index in range(SIGNALS_PER_GAM)]
+    names = list(previous)
+    for gam in range(signals // SIGNALS_PER_GAM):
+        outputs = [f'G{gam}S{index}' for index in range(SIGNALS_PER_GAM)]
+        functions.append(IOGAM(f'GAM{gam}', [signal(name) for name in previous],
+                               [signal(name) for name in outputs]))
+        names += outputs
+        previous = outputs
+    functions.append(IOGAM('GAMLogger', [signal(name) for name in previous],
+                           [signal(name, 'Logger') for name in previous]))
+    ddb = GAMDataSource('DDB1')
+    ddb.input_signals = [signal(name) for name in names]
+    ddb.output_signals = [signal(name) for name in names]
+    # Assigned rather than added, adding compares each object with all those before it
+    app.additional_datasources = [ddb, FileWriter(configuration_name='Logger')]
+    app.functions = functions
+    app.states = [MARTe2RealTimeState(configuration_name=f'State{index}',
+                      threads=MARTe2ReferenceContainer(configuration_name='Threads', objects=[
+                          MARTe2RealTimeThread(configuration_name='Thread1',
+                                               functions=functions)]))
+                  for index in range(states)]
+    return app
+
+def main(sizes=SIGNALS):
+    ''' Print the validation time of each size '''
+    print(f'{"signals":>8} {"errors":>7} {"onlyErrors (s)":>15} {"us/signal":>10}')
+    for size in sizes:
+        app = syntheticApplication(size)
+        start = time.perf_counter()
+        errors = app.onlyErrors()
+        elapsed = time.perf_counter() - start
+        print(f'{size:>8} {len(errors):>7} {elapsed:>15.3f} {elapsed / size * 1e6:>10.2f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIGNALS)
@@ -0,0 +1,63 @@
+''' Benchmark of MARTe2Application.onlyErrors checking the functions of a many-state
+synthetic application serially and in worker processes. Each state runs its own chain of
+IOGAMs, so the number of functions grows with the number of states.
+
+Run from the repository root with: python -m benchmarks validation_workers [workers...]
+'''
+import os
+import sys
+import time
+
+from martepy.marte2.datasources import GAMDataSource
+from martepy.marte2.gams.iogam import IOGAM
+from martepy.marte2.generic_application import MARTe2Application
+from martepy.marte2.objects import (MARTe2RealTimeState, MARTe2RealTimeThread,
+                                    MARTe2ReferenceContainer)
+from benchmarks.validation import signal
+
+STATES = 32
+GAMS_PER_STATE = 500
+SIGNALS_PER_GAM = 10
+
+def manyStateApplication(states=STATES, gams=GAMS_PER_STATE):
+    ''' Return an application of states, each running a chain of gams IOGAMs which read the
+    signals the previous one writes '''
+    app = MARTe2Application()
+    functions = []
+    names = []
+    app.states = []
+    for state in range(states):
+        previous = [f'S{state}Start{index}' for index in range(SIGNALS_PER_GAM)]
+        names += previous
+        state_functions = []
+        for gam in range(gams):
+            outputs = [f'S{state}G{gam}S{index}' for index in range(SIGNALS_PER_GAM)]
+            state_functions.append(IOGAM(f'S{state}GAM{gam}', [signal(name) for name in previous],
+                                         [signal(name) for name in outputs]))
+            names += outputs
+            previous = outputs
+        functions += state_functions
+        app.states.append(MARTe2RealTimeState(configuration_name=f'State{state}',
+            threads=MARTe2ReferenceContainer(configuration_name='Threads', objects=[
+                MARTe2RealTimeThread(configuration_name='Thread1',
+                                     functions=state_functions)])))
+    ddb = GAMDataSource('DDB1')
+    ddb.input_signals = [signal(name) for name in names]
+    ddb.output_signals = [signal(name) for name in names]
+    app.additional_datasources = [ddb]
+    app.functions = functions
+    return app
+
+def main(workers=(1, 2, 4, 8)):
+    ''' Print the validation time with each number of workers '''
+    app = manyStateApplication()
+    print(f'{STATES} states, {len(app.functions)} functions, {os.cpu_count()} CPUs')
+    print(f'{"workers":>8} {"errors":>7} {"onlyErrors (s)":>15}')
+    for count in workers:
+        start = time.perf_counter()
+        errors = app.onlyErrors(workers=count)
+        elapsed = time.perf_counter() - start
+        print(f'{count:>8} {len(errors):>7} {elapsed:>15.3f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or (1, 2, 4, 8))
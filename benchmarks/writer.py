@@ -0,0 +1,78 @@
+''' Benchmark of writing large configurations: a StringConfigWriter building the text in
+memory, as before with the indentation rebuilt for every line, against a FileConfigWriter
+streaming it to a file. Reports the time and the peak memory traced while writing.
+
+Run from the repository root with: python -m benchmarks writer [sizes...]
+'''
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from martepy.marte2.configwriting import StringConfigWriter, FileConfigWriter
+from martepy.marte2.gams.iogam import IOGAM
+
+SIZES = (1000, 10000, 50000)
+
+class JoinPrefixWriter(StringConfigWriter):
+    ''' The string writer with the indentation joined again for every line '''
+    def getPrefix(self):
+        if self.tab < 0:
+            raise IndexError(f'Tab Error, tab is set to: {self.tab}')
+        return ''.join([self.tab_text]*self.tab)
+
+def syntheticFunctions(count):
+    ''' Return count IOGAMs, each with one input and one output signal '''
+    return [IOGAM(f'GAM{index}',
+                  [(f'In{index}', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'float64'}})],
+                  [(f'Out{index}', {'MARTeConfig': {'DataSource': 'DDB1', 'Type': 'float64'}})])
+            for index in range(count)]
+
+def writeFunctions(functions, out):
+    ''' Write the functions section of an application to out '''
+    out.startClass('$App', 'RealTimeApplication')
+    out.startClass('+Functions', 'ReferenceContainer')
+    for function in functions:
+        function.write(out)
+    out.endSection('+Functions')
+    out.endSection('$App')
+
+def toString(functions):
+    ''' Write the functions with the old string writer and return the text '''
+    out = JoinPrefixWriter()
+    writeFunctions(functions, out)
+    return str(out) + '\n'
+
+def toFile(functions, path):
+    ''' Stream the functions to the file at path '''
+    with FileConfigWriter(path) as out:
+        writeFunctions(functions, out)
+
+def measure(func, *args):
+    ''' Return the time taken and peak memory traced in MB calling func '''
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main(sizes=SIZES):
+    ''' Print a table of write times and peak memory for each size '''
+    print(f'{"functions":>10} {"string (s)":>11} {"file (s)":>9} {"speedup":>8} '
+          f'{"string MB":>10} {"file MB":>8}')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'out.cfg')
+        for size in sizes:
+            functions = syntheticFunctions(size)
+            old_time, old_peak = measure(toString, functions)
+            new_time, new_peak = measure(toFile, functions, path)
+            with open(path, 'r', encoding='utf-8') as written:
+                assert written.read() == toString(functions)
+            print(f'{size:>10} {old_time:>11.3f} {new_time:>9.3f} {old_time / new_time:>7.2f}x '
+                  f'{old_peak:>10.1f} {new_peak:>8.1f}')
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -11,6 +11,10 @@ a basic simulated version of your application. It will:
 - Among these constantGAMs it will add a State integer which will increment for each state.
 - When the function returns it will provide a dictionary of state name to state integer value.
 
+The simulation application shares with the original the functions, datasources and other
+objects it does not rewrite, only copying the IOGAMs whose signals it replaces and the function
+reading the timer, see SimulationGenerator.reset.
+
 Req:
 - It will support multi-layered types
 - It should support between threads using the RealTimeThreadAsyncBridge:
@@ -19,12 +23,22 @@ Req:
     - It will then create a AsyncBridge between the two threads to bring that 
       threads' signals into thread 0.
 """
+import contextlib
 import copy
+import hashlib
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List
 
 from martepy.functions.extra_functions import getname # pylint: disable=W0614
-from martepy.functions.gam_functions import (getAlias,
-                                             isMatchingSignal,
-                                             findSignalInFunctionList,
+from martepy.functions.gam_functions import (copySignal,
+                                             getAlias,
+                                             signalKey,
+                                             ProducerIndex,
+                                             UniqueNameAllocator,
                                              getKeyAttribute,
                                              setDatasource,
                                              addDimensions)
@@ -37,6 +51,7 @@ from martepy.marte2.datasources.files.reader import FileReader
 from martepy.frameworks.end_gam import EndGAM
 from martepy.marte2.datasources.async_bridge import AsyncBridge
 from martepy.marte2.datasources.rt_syncbridge import Synchronisation
+from martepy.marte2.factory import Factory, sharedFactory
 
 class SimulationGenerator():
     ''' This class is the simulation generator, it takes a pre-defined MARTe2Application instance,
@@ -46,10 +61,18 @@ class SimulationGenerator():
     *** It is a highly complex set of functions as it achieves a complex task - as a result, we've
     pylint disabled a few check regarding complex code but we're not exceeding those parameters
     too much and most of these have thorough commenting in. ***'''
-    def __init__(self, app, configure=True):
-        """Initialise our simulation generator object
+    def __init__(self, app, configure=True, copy_on_write=True):
+        """Initialise our simulation generator object, given copy_on_write=False the
+        simulation is built from a deep copy of the whole application and nothing is reused
+        from the previous build
         """
         self.original_app = app
+        self.copy_on_write = copy_on_write
+        # Which signals are logged and how, see LogOptions, by default all of them
+        self.log_options = None
+        # The constants given to each state for its missing signals in the last build, kept
+        # across configure so only the states whose missing signals changed are built again
+        self._state_cache = {}
         self.reset()
         self.constants_gam_source = GAMDataSource('+' + self.constants_ddb.lstrip('+'))
         self.state_constant_vals = {}
@@ -60,10 +83,12 @@ class SimulationGenerator():
             self.configure()
 
     def reset(self):
-        """Reset our application
+        """Reset our application, copying the original application. Objects the simulation
+        does not rewrite are shared with the original rather than copied, so edit a function
+        of the simulation application in place only if it is not in the original application.
         """
         # Reset CPU Configurator
-        self.simulation_app = copy.deepcopy(self.original_app)
+        self.simulation_app = self._copyApplication()
         self.simulation_app.types_used = []
         self.log_ddb = 'LogGAMSource'
         self.constants_ddb = 'ConstantGAMDatasource'
@@ -72,6 +97,55 @@ class SimulationGenerator():
         self.overridden_signal_names = []
         self.simulation_app.config['maxcycles'] = 500
 
+    @staticmethod
+    def _replacedDatasources(app):
+        ''' Return the datasources of an application bringing data from or taking it to the
+        outside world, which the simulation replaces '''
+        return [a for a in app.additional_datasources if not (
+            isinstance(a, (AsyncBridge, Synchronisation, FileReader,
+                           GAMDataSource, LinuxTimer, TimingDataSource)))]
+
+    def _rewrittenFunctions(self):
+        ''' Return the functions of the original application the simulation edits in place,
+        the IOGAMs with signals of replaced datasources and the functions reading the timer '''
+        app = self.original_app
+        replaced = {getname(a) for a in self._replacedDatasources(app)}
+        timers = {getname(a) for a in app.additional_datasources if isinstance(a, LinuxTimer)}
+        timers = timers or {'Timer'}
+        rewritten = []
+        for state in app.states:
+            for thread in state.threads.objects:
+                for function in thread.functions:
+                    inputs = {a[1]['MARTeConfig'].get('DataSource') for a in
+                              function.input_signals}
+                    outputs = {a[1]['MARTeConfig'].get('DataSource') for a in
+                               function.output_signals}
+                    if (isinstance(function, IOGAM) and (inputs | outputs) & replaced) or \
+                        inputs & timers:
+                        rewritten.append(function)
+        return rewritten
+
+    def _copyApplication(self):
+        ''' Return a copy of the original application to build the simulation in. Its lists,
+        states and threads are copied so functions can be added and removed, as are the
+        functions the simulation rewrites, but every other function and object is shared. '''
+        app = self.original_app
+        if not self.copy_on_write:
+            return copy.deepcopy(app)
+        # Objects of the application the simulation adds signals to are always copied
+        copied = {id(a) for a in [app.logging_iogam, app.loggingintoio, app.async_to_io,
+                                  app.filewriter, app.asyncbridge] + app.iogams + app.io_asyncs}
+        copied.update(id(a) for a in self._rewrittenFunctions())
+        shared = itertools.chain(
+            app.functions, (function for state in app.states for thread in state.threads.objects
+                            for function in thread.functions),
+            app.additional_datasources, app.externals, app.internals, app.objects,
+            [app.type_db, app.factory])
+        # deepcopy takes the objects in its memo as already copied, so they are shared, and
+        # copies each other object once however many times it is referenced
+        memo = {id(a): a for a in shared if id(a) not in copied}
+        return copy.deepcopy(app, memo)
+
     def configure(self, app=None):
         """This configures the simulation by iterating the application
         and looking for all datasources, for each one it then qualifies
@@ -104,9 +178,7 @@ class SimulationGenerator():
         self._internal_datasources += [self.misc_ddb, self.log_ddb, self.constants_ddb]
         self._internal_datasources += [a.configuration_name.replace('+','') for a in linux_timers]
         # Ensure we know what we removed
-        self.replaced_datasources = [a for a in self.original_app.additional_datasources if not (
-            isinstance(a, (AsyncBridge, Synchronisation, FileReader,
-                           GAMDataSource, LinuxTimer, TimingDataSource)))]
+        self.replaced_datasources = self._replacedDatasources(self.original_app)
 
     def _createGamSources(self):
         ''' Define the GAMSources that are used to partition signals '''
@@ -177,6 +249,28 @@ class SimulationGenerator():
 
         return timing_block
 
+    def _handleLogCounter(self, timer):
+        ''' When the log is decimated and no function outputs its cycle counter, have the
+        IOGAMs reading the timer also output the timer's Counter under that alias '''
+        if not self.log_options or not self.log_options.decimation:
+            return
+        counter = self.log_options.counter
+        if any(getAlias(output_signal) == counter for function in self.simulation_app.functions
+               for output_signal in function.output_signals):
+            return
+        timer_name = getname(timer)
+        # Each state has its own timing block, read the same way
+        timing_blocks = {id(function): function for state in self.simulation_app.states
+                         for thread in state.threads.objects[:1] for function in thread.functions
+                         if isinstance(function, IOGAM) and any(
+                             getKeyAttribute(signal, 'DataSource') == timer_name
+                             for signal in function.input_signals)}
+        for timing_block in timing_blocks.values():
+            timing_block.input_signals.append(('Counter', {'MARTeConfig': {
+                'DataSource': timer_name, 'Type': 'uint32'}}))
+            timing_block.output_signals.append((counter, {'MARTeConfig': {
+                'DataSource': self.gam_sources[0], 'Alias': counter, 'Type': 'uint32'}}))
+
     def _createEndStateSignals(self):
         ''' This function section creates the state signal and end-signal:
         Only works if a thread was created for this state '''
@@ -303,6 +397,8 @@ class SimulationGenerator():
 
         timing_block = self._handlerTimerIO(timer, freq)
 
+        self._handleLogCounter(timer)
+
         self.simulation_app.default_data_source = self.gam_sources[0]
 
         self._createEndStateSignals()
@@ -313,58 +409,9 @@ class SimulationGenerator():
         # and it's functions definitions.
         self.simulation_app.sanitize()
 
-        self.simulation_app.buildLog()
-
-        # Now we iterate through again and use a multitude of any's to check:
-        # Is there in this state, any thread, with an IOGAM, that is producing that
-        # required signal into our LogDDB
-        for state in self.simulation_app.states: # pylint: disable=R1702
-            missingsignals = ConstantGAM(f'+missingsignals{getname(state)}', [])
-            missingio = IOGAM(f'+missingiosignals{getname(state)}',[],[])
-            # This gets flagged up by pylint as unnecessary but is in fact very necessary!
-            # It delinks the pointer refs
-            total_signals = [a for a in self.simulation_app.logging_iogam.input_signals] # pylint: disable=R1721
-            total_signals += [a for a in self.simulation_app.async_to_io.input_signals] # pylint: disable=R1721
-            for signal in total_signals:
-                # This is a complicated if any setup, we're asking, is any signal of any function
-                # in any thread of our current state, matching our signal we are looking for
-                if len(state.threads.objects) > 0:
-                    # Is a used thread
-                    if not any(
-                        any(any(isMatchingSignal(output_signal, signal) for
-                                output_signal in function.output_signals) for
-                                function in thread.functions) for thread in state.threads.objects):
-                        # There is no producer for this signal within this state
-                        # use replace signal to create this signal in thread 0 for this state
-                        # We need to account for the fact that defaults must match if this was
-                        # produced by a constantGAM for the same datasource.
-                        # So we must therefore find the original producer of this signal
-                        producer = findSignalInFunctionList(signal, self.simulation_app.functions)
-
-                        default = 0
-                        if producer: # a Producer was found
-                            if 'Default' in producer[1]['MARTeConfig'].keys(): # It has a default
-                                default = getKeyAttribute(producer, 'Default')
-
-                        modsignal = copy.deepcopy(signal)
-                        # This next step might seem redundant but it was found
-                        # necessary during testing - we ensure we don't repeat the name in
-                        # our missing signals gam
-                        alias = getAlias(modsignal)
-                        unique_name = self.simulation_app.newUniqueName(alias)
-                        if not any(out_signal[0] == unique_name for
-                                   out_signal in missingsignals.output_signals):
-                            # Don't duplicate our work
-                            modsignal = (unique_name,modsignal[1])
-                            modsignal[1]['MARTeConfig']['Alias'] = unique_name
-                            setDatasource(modsignal, self.constants_ddb)
-                            self._replaceSignal(modsignal, missingsignals,
-                                                self.constants_ddb, self.simulation_app, default)
-                            missingio.input_signals += [modsignal]
-                            missingio.output_signals += [signal]
+        self.simulation_app.buildLog(self.log_options)
 
-            if len(missingsignals.output_signals) > 0:
-                state.threads.objects[0].functions += [missingsignals, missingio]
+        self._createMissingSignals()
 
         self.simulation_app.sanitize()
 
@@ -379,6 +426,97 @@ class SimulationGenerator():
                 self.simulation_app.add(externals=[empty_obj])
         return self.simulation_app
 
+    def _createMissingSignals(self):
+        ''' Give each state a constant for every logged signal which none of its threads
+        produce, so the log can be written whichever state we are in. The producers of each
+        state are gathered into a set once, and the original producers and unique names are
+        looked up from indexes kept up to date as functions are added. The constants of a
+        state are reused from the last build while the missing signals, their defaults and
+        the names of their constants are unchanged, see _missingSignalsKey. '''
+        producers = ProducerIndex(self.simulation_app.functions)
+        names = UniqueNameAllocator(self.simulation_app.functions)
+        # Copy the lists as we look through them
+        total_signals = list(self.simulation_app.logging_iogam.input_signals)
+        total_signals += self.simulation_app.async_to_io.input_signals
+        for state_index, state in enumerate(self.simulation_app.states):
+            if len(state.threads.objects) == 0:
+                continue
+            # What signals any function in any thread of our current state produces
+            produced = {signalKey(output_signal) for thread in state.threads.objects
+                        for function in thread.functions
+                        for output_signal in function.output_signals}
+            # The logged signals there is no producer for within this state, with the default
+            # of their original producer, as defaults must match if this was produced by a
+            # constantGAM for the same datasource
+            missing = []
+            for signal in total_signals:
+                if signalKey(signal) in produced:
+                    continue
+                producer = producers.find(signal)
+                default = 0
+                if producer: # a Producer was found
+                    if 'Default' in producer[1]['MARTeConfig'].keys(): # It has a default
+                        default = getKeyAttribute(producer, 'Default')
+                missing.append((signal, default))
+            key = self._missingSignalsKey(missing, names)
+            cached = self._state_cache.get((state_index, getname(state)))
+            if key is not None and cached is not None and cached[0] == key:
+                # Nothing this state's constants depend on changed since the last build
+                missingsignals, missingio = cached[1:]
+            else:
+                missingsignals, missingio = self._missingSignalsGams(state, missing, names)
+                if key is not None:
+                    self._state_cache[state_index, getname(state)] = (key, missingsignals,
+                                                                      missingio)
+            if len(missingsignals.output_signals) > 0:
+                if key is not None:
+                    # Copies, so editing this simulation leaves the cached functions and the
+                    # signals of an earlier build they hold as they were
+                    missingsignals, missingio = _copyGam(missingsignals), _copyGam(missingio)
+                state.threads.objects[0].functions += [missingsignals, missingio]
+
+    def _missingSignalsGams(self, state, missing, names):
+        ''' Return the ConstantGAM creating the missing signals of a state, as given by
+        _createMissingSignals, and the IOGAM writing them where they are logged from '''
+        missingsignals = ConstantGAM(f'+missingsignals{getname(state)}', [])
+        missingio = IOGAM(f'+missingiosignals{getname(state)}',[],[])
+        # The names our constants output
+        missing_names = set()
+        named = 0
+        for signal, default in missing:
+            # use replace signal to create this signal in thread 0 for this state
+            # We ensure we don't repeat the name in our missing signals gam
+            unique_name = names.newName(getAlias(signal))
+            missing_names.update(out_signal[0] for out_signal in
+                                 missingsignals.output_signals[named:])
+            named = len(missingsignals.output_signals)
+            if unique_name not in missing_names:
+                # Don't duplicate our work
+                modsignal = copySignal(signal)
+                modsignal = (unique_name,modsignal[1])
+                modsignal[1]['MARTeConfig']['Alias'] = unique_name
+                setDatasource(modsignal, self.constants_ddb)
+                self._replaceSignal(modsignal, missingsignals,
+                                    self.constants_ddb, self.simulation_app, default)
+                missingio.input_signals += [modsignal]
+                missingio.output_signals += [signal]
+        return missingsignals, missingio
+
+    def _missingSignalsKey(self, missing, names):
+        ''' Return what the constants of the missing signals of a state are built from: the
+        signals and their defaults as given by _createMissingSignals, the unique names names
+        gives them and where they are written. None if they cannot be reused, as a signal of
+        a complex type adds functions to the application. '''
+        app = self.simulation_app
+        if not self.copy_on_write or not all(
+            app.type_db.isFundamental(signal[1]['MARTeConfig']['Type'])
+            for signal, _ in missing):
+            return None
+        # No functions are added for fundamental types so these are the names given to them
+        digest = hashlib.sha256(repr([(signal, default, names.newName(getAlias(signal)))
+                                      for signal, default in missing]).encode()).hexdigest()
+        return (digest, self.constants_ddb, app.type_db)
+
     def unflattenReplace(self, signal_to_replace, type_name, # pylint: disable=R0914
                           constant_gam=None, constantgamsource=None):
         ''' This is a recursive algorithm to unflatten a signal and create a Constant
@@ -423,12 +561,12 @@ class SimulationGenerator():
                 constant_gam.output_signals += [constant_signal]
 
                 # Now our field member exists, we need to construct our type
-                field_member_for_io = copy.deepcopy(constant_signal)
+                field_member_for_io = copySignal(constant_signal)
                 if 'Default' in field_member_for_io[1]['MARTeConfig']:
                     del field_member_for_io[1]['MARTeConfig']['Default']
                 field_members += [field_member_for_io]
 
-        output_signal_for_io = copy.deepcopy(signal_to_replace)
+        output_signal_for_io = copySignal(signal_to_replace)
         type_io_gam = IOGAM(f'+IO{ualias}_{type_name}', field_members,[output_signal_for_io])
         self.simulation_app.functions += [type_io_gam]
         return type_io_gam
@@ -443,7 +581,7 @@ class SimulationGenerator():
         the IOGAM, the new functions will be added to thread.functions and
         application.functions in place by reference.
         """
-        constant_signal = copy.deepcopy(signal_to_replace)
+        constant_signal = copySignal(signal_to_replace)
         if 'Frequency' in list(constant_signal[1]['MARTeConfig'].keys()):
             del constant_signal[1]['MARTeConfig']['Frequency']
         type_name = constant_signal[1]['MARTeConfig']['Type']
@@ -478,3 +616,99 @@ class SimulationGenerator():
 
         constant_gam.output_signals += [new_signal]
         return None
+
+
+def _copyGam(function):
+    ''' Return a copy of a GAM whose signals can be edited without changing those of function '''
+    copied = copy.copy(function)
+    copied.input_signals = [copySignal(signal) for signal in function.input_signals]
+    copied.output_signals = [copySignal(signal) for signal in function.output_signals]
+    return copied
+
+
+@dataclass
+class SimulationBuild:
+    ''' The outcome of building the simulation of one application with buildMany, error is
+    None unless building or writing it raised, when it holds the exception message '''
+    path: str
+    seconds: float
+    error: str = None
+
+# The type databases and factories of the applications built in a worker process of buildMany,
+# set once as the worker starts
+_WORKER_SHARED = None
+
+def _initWorker(shared):
+    ''' Set up a worker process of buildMany with each type database and the classes registered
+    in each factory of the applications as (type_db, classes, hidden), loading every plugin
+    once '''
+    global _WORKER_SHARED # pylint: disable=W0603
+    _WORKER_SHARED = []
+    for type_db, classes, hidden in shared:
+        factory = Factory(parent=sharedFactory())
+        factory.classes.update(classes)
+        factory.hidden = set(hidden)
+        factory.getAll()
+        _WORKER_SHARED.append((type_db, factory))
+
+def _buildInWorker(app, path: str, shared: int) -> SimulationBuild:
+    ''' Build app in a worker process of buildMany with the type database and factory at
+    index shared of those the worker was started with '''
+    return buildSimulation(app, path, *_WORKER_SHARED[shared])
+
+def buildSimulation(app, path: str, type_db=None, factory=None) -> SimulationBuild:
+    ''' Build the simulation of app with SimulationGenerator and write its configuration to
+    path, using the type database and factory given, or otherwise those of app. Nothing is
+    left at path when building or writing it raises. '''
+    start = time.perf_counter()
+    app = copy.copy(app)
+    app.type_db = app.type_db if type_db is None else type_db
+    app.factory = app.factory if factory is None else factory
+    opened = False
+    try:
+        with open(path, 'w', encoding='utf-8') as config_file:
+            opened = True
+            SimulationGenerator(app).build().writeToConfig(config_file)
+    except Exception as error: # pylint: disable=W0718
+        if opened:
+            # Not a partial configuration which could be taken for a complete one
+            with contextlib.suppress(OSError):
+                os.remove(path)
+        return SimulationBuild(path, time.perf_counter() - start,
+                               f'{type(error).__name__}: {error}')
+    return SimulationBuild(path, time.perf_counter() - start)
+
+def buildMany(apps: Iterable, paths: Iterable[str], workers: int = None, type_db=None,
+              factory=None) -> List[SimulationBuild]:
+    ''' Build the simulation of each application and write its configuration to the path of
+    the same index, returning how long each took in order. Each application is built with its
+    own type database and factory unless type_db or factory is given for all of them. Given
+    workers, the applications are built in that many processes, each started with every
+    distinct type database and factory loaded once rather than sent with every application,
+    so variants sharing those of one application send them once.
+
+    An application which cannot be built does not stop the others, the error is reported in
+    its result instead and no file is left at its path. '''
+    apps = list(apps)
+    paths = list(paths)
+    if len(apps) != len(paths):
+        raise ValueError(f'{len(apps)} applications given {len(paths)} paths')
+    if not workers or workers < 2 or len(apps) < 2:
+        return [buildSimulation(app, path, type_db, factory) for app, path in zip(apps, paths)]
+    # Each distinct type database and factory, by identity, and the index of those of each app
+    pairs, indices, stripped = {}, [], []
+    for app in apps:
+        pair = (app.type_db if type_db is None else type_db,
+                app.factory if factory is None else factory)
+        indices.append(pairs.setdefault((id(pair[0]), id(pair[1])), (len(pairs), pair))[0])
+        # The type database and factory are given to each worker once
+        app = copy.copy(app)
+        app.type_db = None
+        app.factory = None
+        stripped.append(app)
+    # Only the classes registered in each factory itself, the plugins shipped with martepy are
+    # registered in the shared factory of each worker
+    shared = [(pair_db, dict(dict.items(pair_factory.classes)), pair_factory.hidden)
+              for _, (pair_db, pair_factory) in pairs.values()]
+    with ProcessPoolExecutor(workers, initializer=_initWorker, initargs=(shared,)) as pool:
+        return list(pool.map(_buildInWorker, stripped, paths, indices))
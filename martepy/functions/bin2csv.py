@@ -3,12 +3,25 @@ This module provides capability for a user to convert a MARTe2 written binary fi
 readable CSV file.
 '''
 
+import argparse
+import os
 import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Type, Tuple, Iterable
-from functools import lru_cache
 import itertools
 from dataclasses import dataclass
 
+import numpy as np
+
+# Bytes of a signal name in the header of a binary file
+SIGNAL_NAME_SIZE = 32
+# Rows converted to CSV at a time
+BLOCK_ROWS = 65536
+# Seconds between checks for new rows when following a log being written
+POLL_INTERVAL = 0.5
+
 
 class Bin2CSVError(Exception):
     """Generic exception for all errors"""
@@ -43,7 +56,11 @@ standard_type_descriptors = {
         TypeDescriptor(4104, 'float64','d',8),
         TypeDescriptor(1028, 'uint16', 'H', 2),
         TypeDescriptor(516, 'uint8', 'B', 1),
-        TypeDescriptor(512, 'int8', 'b', 1)
+        TypeDescriptor(512, 'int8', 'b', 1),
+        TypeDescriptor(1024, 'int16', 'h', 2),
+        TypeDescriptor(4096, 'int64', 'q', 8),
+        # MARTe2 writes bool signals with the uint8 code
+        TypeDescriptor(552, 'char8', 'c', 1)
     )
 }
 
@@ -60,27 +77,60 @@ class RowInterpreter:
                  delimiter: str = ',', struct_endianity_char: str = '<'):
         """RowInterpreter constructor.
 
-        Constructor parameters are stored in private fields because the rowSize
-        and rowFormat results are cached and will be invalid if these fields
-        are edited after they have been called the first time.
+        Constructor parameters are stored in private fields because the struct
+        used to unpack rows is compiled from them here, and would be invalid if
+        these fields were edited afterwards.
         """
         self._signal_descriptors = signal_descriptors
         self._delimeter = delimiter
         self._struct_endianity_char = struct_endianity_char
+        self._struct = struct.Struct(struct_endianity_char + ''.join(
+            signal.format() for signal in signal_descriptors))
+        # Positions in an unpacked row of the char8 values, unpacked as bytes
+        self._char_indices = []
+        start = 0
+        for signal in signal_descriptors:
+            if signal.type_descr.struct_format == 'c':
+                self._char_indices += range(start, start + signal.elements)
+            start += signal.elements
+        self._dtypes = {}
+
+    def __getstate__(self) -> dict:
+        """Return our fields for pickling, without the struct which cannot be
+        pickled, so interpreters can be sent to worker processes.
+        """
+        state = self.__dict__.copy()
+        state['_struct'] = self._struct.format
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._struct = struct.Struct(state['_struct'])
 
-    @lru_cache(maxsize=None) # pylint: disable=W1518
     def rowSize(self) -> int:
         """Return the number of bytes that one row of data would require in the
         MARTe2 binary file.
         """
-        return sum(signal.type_descr.size * signal.elements for
-                   signal in self._signal_descriptors)
+        return self._struct.size
 
-    @lru_cache(maxsize=None) # pylint: disable=W1518
     def rowFormat(self) -> str:
         """Return the `struct` library format string used to unpack one row."""
-        return self._struct_endianity_char + ''.join(signal.format() for
-                                                     signal in self._signal_descriptors)
+        return self._struct.format
+
+    def rowDtype(self, names: Tuple[str] = None) -> np.dtype:
+        """Return the NumPy structured dtype of one row, with a field for each
+        signal shaped (elements,) for arrays. Fields are given names in order,
+        by default f0, f1 and so on.
+        """
+        if names is None:
+            names = tuple(f'f{index}' for index in range(len(self._signal_descriptors)))
+        if names not in self._dtypes:
+            endianity = self._struct_endianity_char
+            self._dtypes[names] = np.dtype([
+                (name, endianity + signal.type_descr.struct_format,
+                 (signal.elements,) if signal.elements > 1 else ())
+                for name, signal in zip(names, self._signal_descriptors)])
+        return self._dtypes[names]
 
     def headerRow(self) -> str:
         """Return the first row of an equivalent CSV file format, containing
@@ -103,7 +153,41 @@ class RowInterpreter:
         This will raise an exception if the provided data does not match in
         size with the descriptors this RowInterpreter was constructed with.
         """
-        return struct.unpack(self.rowFormat(), binary_data)
+        values = self._struct.unpack(binary_data)
+        if self._char_indices:
+            values = self._decodeChars(values)
+        return values
+
+    def iterBinToValues(self, binary_data: bytes) -> Iterable[Tuple]:
+        """Yield the values in Python types of each row of a buffer holding a
+        whole number of rows, unpacking them all with the compiled struct.
+        """
+        rows = self._struct.iter_unpack(binary_data)
+        if self._char_indices:
+            return map(self._decodeChars, rows)
+        return rows
+
+    def binToCsvRows(self, binary_data: bytes) -> str:
+        """Return the CSV file formatted data for a buffer holding a whole
+        number of rows, the same as binToCsvRow gives for each row.
+        """
+        return ''.join(map(self.valuesToCsvRow, self.iterBinToValues(binary_data)))
+
+    def _decodeChars(self, values: Tuple) -> Tuple:
+        """Return the values of a row with its char8 values as str."""
+        values = list(values)
+        for index in self._char_indices:
+            values[index] = values[index].decode('latin-1')
+        return tuple(values)
+
+    def _columnStrings(self, signal: SignalDescriptor, values: np.ndarray) -> Iterable[str]:
+        """Return the CSV formatted values of an array of the values of a
+        signal, in order.
+        """
+        values = values.ravel().tolist()
+        if signal.type_descr.struct_format == 'c':
+            return (value.decode('latin-1') for value in values)
+        return map(str, values)
 
     def valuesToCsvRow(self, row_values: Iterable) -> str:
         """Return the CSV file formatted data for a row's data as Python types.
@@ -123,6 +207,28 @@ class RowInterpreter:
                 csv_value_strings.append(f'{{{inner_values}}}')
         return self._delimeter.join(csv_value_strings) + '\n'
 
+    def blockToCsvRows(self, block: np.ndarray) -> str:
+        """Return the CSV file formatted data for rows of data as an array of
+        rowDtype, whatever its field names, the same as binToCsvRow gives for
+        each row. Values are turned
+        into Python types a column at a time before formatting them with str.
+        """
+        columns = []
+        for name, signal in zip(block.dtype.names, self._signal_descriptors):
+            values = self._columnStrings(signal, block[name])
+            if signal.elements > 1:
+                # Group the values of each row of the array
+                values = ('{' + ' '.join(row) + '}' for
+                          row in zip(*[values] * signal.elements))
+            columns.append(values)
+        return self._joinRows(columns, len(block))
+
+    def _joinRows(self, columns, rows: int) -> str:
+        """Join the formatted values of each column into rows of CSV."""
+        if not rows:
+            return ''
+        return '\n'.join(map(self._delimeter.join, zip(*columns))) + '\n'
+
 
 class StandardCSVRowInterpreter(RowInterpreter):
     """A variant of the `RowInterpreter` class which writes a more standardised
@@ -138,6 +244,17 @@ class StandardCSVRowInterpreter(RowInterpreter):
     def valuesToCsvRow(self, row_values: Iterable) -> str:
         return self._delimeter.join(str(value) for value in row_values) + '\n'
 
+    def blockToCsvRows(self, block: np.ndarray) -> str:
+        columns = []
+        for name, signal in zip(block.dtype.names, self._signal_descriptors):
+            values = block[name]
+            if signal.elements == 1:
+                columns.append(self._columnStrings(signal, values))
+            else:
+                columns += [self._columnStrings(signal, values[:, element]) for
+                            element in range(signal.elements)]
+        return self._joinRows(columns, len(block))
+
     def headerRow(self) -> str:
         signal_names_string = self._delimeter.join(self._headerItem(signal) for
                                                    signal in self._signal_descriptors)
@@ -152,20 +269,35 @@ class StandardCSVRowInterpreter(RowInterpreter):
         return self._delimeter.join(index_strings)
 
 
+def convertRows(bin_path: str, interpreter: RowInterpreter, offset: int,
+                start: int, stop: int) -> str:
+    """Return the CSV file formatted data of rows start to stop of a binary
+    file, whose rows begin offset bytes into the file.
+    """
+    data = np.memmap(bin_path, dtype=interpreter.rowDtype(), mode='r',
+                     offset=offset + start * interpreter.rowSize(), shape=(stop - start,))
+    return interpreter.blockToCsvRows(data)
+
+
 class Bin2CSV():
     '''
     The main entrypoint to convert a MARTe2 binary log produced by the FileWriter datasource
     to a csv file.
     See RowInterpretator and StandardRowInterpretator for explanation of marte2_csv
+    Given workers, blocks of block_rows rows are converted in that many processes.
     '''
     def __init__(self,
         bin_path: str = 'log.bin',
         csv_path: str = 'log_0.csv',
-        marte2_csv: bool = True
+        marte2_csv: bool = True,
+        block_rows: int = BLOCK_ROWS,
+        workers: int = None
     ):
         self.bin_path = bin_path
         self.csv_path = csv_path
         self.marte2_csv = marte2_csv
+        self.block_rows = block_rows
+        self.workers = workers
 
     def interpreterClass(self) -> Type[RowInterpreter]:
         ''' Get our declared interpretator'''
@@ -173,42 +305,245 @@ class Bin2CSV():
             return RowInterpreter
         return StandardCSVRowInterpreter
 
-    @lru_cache(maxsize=None) # pylint: disable=W1518
     def unpackStruct(self, name_size, fin):
         ''' Unpack the signal '''
         return struct.unpack('<H' + str(name_size) + 'sI', fin.read((name_size+6)))
 
+    def readHeader(self, fin) -> Tuple[SignalDescriptor]:
+        """Read the signal descriptors from the start of a binary file, leaving
+        fin at the first row of data.
+        """
+        nsignals, = struct.unpack('<I', fin.read(4))
+
+        signals = []
+        for _ in range(nsignals):
+            signal_code, signal_name, signal_elements = self.unpackStruct(SIGNAL_NAME_SIZE, fin)
+
+            signal_name = signal_name.rstrip(b'\x00').decode('utf-8')
+            try:
+                signal_type = standard_type_descriptors[signal_code]
+            except KeyError:
+                msg = f'Unknown TypeDescription code: {signal_code} for signal {signal_name}'
+                raise Bin2CSVError(msg) # pylint: disable=W0707
+
+            signals.append(SignalDescriptor(signal_name, signal_type, signal_elements))
+        return tuple(signals)
+
+    def convertBlocks(self, interpreter: RowInterpreter, offset: int,
+                      rows: int) -> Iterable[str]:
+        """Return the CSV file formatted data of each block of rows in order,
+        converted in worker processes when given workers.
+        """
+        starts = range(0, rows, self.block_rows)
+        stops = [min(start + self.block_rows, rows) for start in starts]
+        arguments = (itertools.repeat(self.bin_path), itertools.repeat(interpreter),
+                     itertools.repeat(offset), starts, stops)
+        if not self.workers or self.workers < 2 or len(starts) < 2:
+            yield from map(convertRows, *arguments)
+        else:
+            with ProcessPoolExecutor(self.workers) as pool:
+                # map returns the blocks in order whichever worker finishes first
+                yield from pool.map(convertRows, *arguments)
+
+    def follow(self, poll_interval: float = POLL_INTERVAL, idle_timeout: float = None):
+        """Convert the binary file into CSV while it is being written, appending
+        newly written rows every poll_interval seconds, see BinaryLogFollower.
+        The CSV is flushed after each batch so it can be read as it grows.
+        """
+        follower = BinaryLogFollower(self.bin_path, poll_interval, idle_timeout,
+                                     self.block_rows)
+        try:
+            if not follower.waitForHeader():
+                raise Bin2CSVError(f'No header written to {self.bin_path} within {idle_timeout}s')
+            interpreter = self.interpreterClass()(*follower.signals)
+            with open(self.csv_path, 'w', encoding='utf-8') as fout:
+                fout.write(interpreter.headerRow())
+                fout.flush()
+                for batch in follower:
+                    fout.write(interpreter.blockToCsvRows(batch))
+                    fout.flush()
+        finally:
+            follower.close()
+
     def main(self):
         """Convert the binary file into CSV"""
         with open(self.bin_path, 'rb') as fin:
-            nsignals, = struct.unpack('<I', fin.read(4))
+            signals = self.readHeader(fin)
+            offset = fin.tell()
+            data_size = os.fstat(fin.fileno()).st_size - offset
 
-            name_size = 32
+        interpreter = self.interpreterClass()(*signals)
+        row_size = interpreter.rowSize()
+        rows, leftover = divmod(data_size, row_size) if row_size else (0, 0)
 
-            signals = []
-            for _ in range(nsignals):
-                signal_code, signal_name, signal_elements = self.unpackStruct(name_size, fin)
+        with open(self.csv_path, 'w', encoding='utf-8') as fout:
+            fout.write(interpreter.headerRow())
+            for text in self.convertBlocks(interpreter, offset, rows):
+                fout.write(text)
+            if leftover:
+                raise Bin2CSVError(f'Reached EOF with partial row: {leftover} leftover bytes')
 
-                signal_name = signal_name.rstrip(b'\x00').decode('utf-8')
-                try:
-                    signal_type = standard_type_descriptors[signal_code]
-                except KeyError:
-                    msg = f'Unknown TypeDescription code: {signal_code} for signal {signal_name}'
-                    raise Bin2CSVError(msg) # pylint: disable=W0707
 
-                signals.append(SignalDescriptor(signal_name, signal_type, signal_elements))
+def namedRowDtype(descriptors: Tuple[SignalDescriptor], path: str) -> np.dtype:
+    """Return the dtype of a row of the binary file at path with fields named
+    after the signals, raising Bin2CSVError if any name is repeated.
+    """
+    names = tuple(signal.name for signal in descriptors)
+    repeated = sorted({name for name in names if names.count(name) > 1})
+    if repeated:
+        raise Bin2CSVError(f'Repeated signal names in {path}: {", ".join(repeated)}')
+    return RowInterpreter(*descriptors).rowDtype(names)
 
-            interpreter = self.interpreterClass()(*signals)
 
-            with open(self.csv_path, 'w', encoding='utf-8') as fout:
-                fout.write(interpreter.headerRow())
+def loadBinaryLog(path: str, signals: Iterable[str] = None) -> np.ndarray:
+    """Return the rows of a MARTe2 FileWriter binary log as a read only NumPy
+    structured array mapped onto the file, with a field named after each signal
+    and shaped (elements,) for arrays. Only the rows and signals used are read,
+    so slice the rows and select the signals needed, e.g. log['Time'][1000:2000].
 
-                while True:
-                    raw_row = fin.read(interpreter.rowSize())
-                    if len(raw_row) < interpreter.rowSize():
-                        if raw_row:
-                            msg = f'Reached EOF with partial row: {len(raw_row)} leftover bytes'
-                            raise Bin2CSVError(msg)
-                        break
+    Given signals, only those fields are in the returned view. A partial row at
+    the end of the file, such as one still being written, is left out.
+    """
+    with open(path, 'rb') as fin:
+        descriptors = Bin2CSV(path).readHeader(fin)
+        offset = fin.tell()
+        data_size = os.fstat(fin.fileno()).st_size - offset
+
+    dtype = namedRowDtype(descriptors, path)
+    names = dtype.names
+    rows = data_size // dtype.itemsize if dtype.itemsize else 0
+    if rows:
+        log = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(rows,))
+    else:
+        # An empty file cannot be mapped
+        log = np.empty(0, dtype=dtype)
+        log.flags.writeable = False
+    if signals is not None:
+        signals = list(signals)
+        missing = [name for name in signals if name not in names]
+        if missing:
+            raise Bin2CSVError(f'Unknown signals {", ".join(missing)} in {path}')
+        log = log[signals]
+    return log
+
+
+class BinaryLogFollower:
+    """Follow a MARTe2 FileWriter binary log while it is being written,
+    iterating over it yields each batch of newly appended complete rows, as a
+    read only structured array like loadBinaryLog of at most block_rows rows.
+
+    The file is checked for new rows every poll_interval seconds, a partial row
+    at the end is left until it is complete. Iterating stops once no complete
+    row was appended for idle_timeout seconds, or never when it is None.
+    """
 
-                    fout.write(interpreter.binToCsvRow(raw_row))
+    def __init__(self, path: str, poll_interval: float = POLL_INTERVAL,
+                 idle_timeout: float = None, block_rows: int = BLOCK_ROWS):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.block_rows = block_rows
+        self.signals = None
+        self.dtype = None
+        self._fin = None
+        self._last_read = None
+
+    def _idle(self) -> bool:
+        """Whether nothing was read for idle_timeout, otherwise wait a poll."""
+        if self.idle_timeout is not None and \
+            time.monotonic() - self._last_read >= self.idle_timeout:
+            return True
+        time.sleep(self.poll_interval)
+        return False
+
+    def _available(self) -> int:
+        """Return the number of bytes written after our position in the file."""
+        return os.fstat(self._fin.fileno()).st_size - self._fin.tell()
+
+    def waitForHeader(self) -> bool:
+        """Open the file and read the signal descriptors once all of them have
+        been written, returning False if idle_timeout passed first.
+        """
+        if self.signals is not None:
+            return True
+        self._last_read = time.monotonic()
+        while self._fin is None:
+            try:
+                self._fin = open(self.path, 'rb') # pylint: disable=R1732
+            except FileNotFoundError:
+                if self._idle():
+                    return False
+        while True:
+            if self._available() >= 4:
+                nsignals, = struct.unpack('<I', self._fin.read(4))
+                self._fin.seek(0)
+                if self._available() >= 4 + nsignals * (SIGNAL_NAME_SIZE + 6):
+                    break
+            if self._idle():
+                return False
+        self.signals = Bin2CSV(self.path).readHeader(self._fin)
+        self.dtype = namedRowDtype(self.signals, self.path)
+        self._last_read = time.monotonic()
+        return True
+
+    def __iter__(self) -> Iterable[np.ndarray]:
+        try:
+            if not self.waitForHeader() or not self.dtype.itemsize:
+                return
+            while True:
+                rows = min(self._available() // self.dtype.itemsize, self.block_rows)
+                if rows:
+                    data = self._fin.read(rows * self.dtype.itemsize)
+                    self._last_read = time.monotonic()
+                    yield np.frombuffer(data, dtype=self.dtype)
+                elif self._idle():
+                    return
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the file being followed."""
+        if self._fin is not None:
+            self._fin.close()
+            self._fin = None
+
+
+def commandLine(argv=None) -> int:
+    """Convert a binary file to CSV from the command line, returning the exit
+    status, run with --help for its options.
+    """
+    parser = argparse.ArgumentParser(
+        prog='bin2csv', description='Convert a MARTe2 FileWriter binary log to CSV.')
+    parser.add_argument('bin_path', help='the binary log to convert')
+    parser.add_argument('csv_path', nargs='?',
+                        help='the CSV file to write, by default the log with a .csv extension')
+    parser.add_argument('--standard', action='store_true',
+                        help='write a column for each element of array signals')
+    parser.add_argument('--block-rows', type=int, default=BLOCK_ROWS,
+                        help='rows converted at a time')
+    parser.add_argument('--workers', type=int, help='processes converting blocks at once')
+    parser.add_argument('--follow', action='store_true',
+                        help='keep appending rows as the log is written, until interrupted')
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL,
+                        help='seconds between checks for new rows when following')
+    parser.add_argument('--idle-timeout', type=float,
+                        help='stop following once no rows were written for this many seconds')
+    args = parser.parse_args(argv)
+    csv_path = args.csv_path or os.path.splitext(args.bin_path)[0] + '.csv'
+    converter = Bin2CSV(args.bin_path, csv_path, not args.standard, args.block_rows,
+                        args.workers)
+    try:
+        if args.follow:
+            converter.follow(args.poll_interval, args.idle_timeout)
+        else:
+            converter.main()
+    except KeyboardInterrupt:
+        pass
+    except (Bin2CSVError, OSError) as error:
+        print(f'bin2csv: {error}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(commandLine())
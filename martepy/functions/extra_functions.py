@@ -4,6 +4,119 @@
 class ConfigGeneratorError(Exception):
     """Generic exception for errors encountered during configuration generation"""
 
+# The index key of items which have no name and cannot be hashed
+_UNKEYED = object()
+
+def _listKey(item):
+    ''' The key a NonDuplicatingList indexes item under, objects are only ever equal to
+    objects of the same configuration_name so are keyed by it, other items by their value '''
+    name = getattr(item, 'configuration_name', _UNKEYED)
+    key = ('name', name) if name is not _UNKEYED else ('value', item)
+    try:
+        hash(key)
+    except TypeError:
+        return _UNKEYED
+    return key
+
+class NonDuplicatingList(list):
+    ''' A list which does not append an item equal to one it already holds, keeping the
+    insertion order. Items are indexed by their configuration_name (or value) so appending
+    only compares against items of the same key. A held item renamed since it was indexed
+    is still found when appended itself, call reindex after renaming held items to also
+    find the items equal to them. '''
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._index = None
+        self._ids = None
+
+    def reindex(self):
+        ''' Rebuild the index of the items held '''
+        self._index = {}
+        # The items held by id, kept so that their ids are not reused
+        self._ids = {}
+        for item in self:
+            self._index.setdefault(_listKey(item), []).append(item)
+            self._ids[id(item)] = item
+
+    def append(self, item):
+        ''' Append item unless an equal item is already held '''
+        if getattr(self, '_index', None) is None:
+            self.reindex()
+        key = _listKey(item)
+        bucket = self._index.get(key, ())
+        if any(item == list_item for list_item in bucket):
+            return
+        if id(item) in self._ids:
+            # Held under the key it had before being renamed
+            self.reindex()
+            return
+        self._index.setdefault(key, []).append(item)
+        self._ids[id(item)] = item
+        super().append(item)
+
+    def __iadd__(self, other):
+        for item in other:
+            self.append(item)
+        return self
+
+    def __getstate__(self):
+        # The index is rebuilt on use, copies and pickles append their items afresh
+        state = dict(self.__dict__)
+        state['_index'] = state['_ids'] = None
+        return state
+
+    def _changed(self, method, *args):
+        ''' Call a list method that changes the items held, dropping the index '''
+        self._index = self._ids = None
+        return method(self, *args)
+
+    def __setitem__(self, *args):
+        return self._changed(list.__setitem__, *args)
+
+    def __delitem__(self, *args):
+        return self._changed(list.__delitem__, *args)
+
+    def __imul__(self, *args):
+        return self._changed(list.__imul__, *args)
+
+    def insert(self, *args):
+        return self._changed(list.insert, *args)
+
+    def extend(self, *args):
+        return self._changed(list.extend, *args)
+
+    def remove(self, *args):
+        return self._changed(list.remove, *args)
+
+    def pop(self, *args):
+        return self._changed(list.pop, *args)
+
+    def clear(self):
+        return self._changed(list.clear)
+
+def generateUniqueName(existing_names, base_name):
+    """Generate a unique name based on the existing names in the list.
+    """
+    if base_name not in existing_names:
+        return base_name
+
+    i = 1
+    while True:
+        new_name = f"{base_name}{i}"
+        if new_name not in existing_names:
+            return new_name
+        i += 1
+
+def generateUniqueGamName(existing_names):
+    """Generate a unique name based on the existing names in the list.
+    """
+    i = 1
+    while True:
+        new_name = f"DDB{i}"
+        if new_name not in existing_names:
+            return new_name
+        i += 1
+
 def getname(object_cls):
     ''' Return the name of an object, omitting the + '''
     return object_cls.configuration_name.lstrip('+')
@@ -28,6 +141,24 @@ def normalizeSignal(signal):
 
     return signal
 
+def normalizedItems(marte_config, exclude=()):
+    ''' Return the key value pairs normalizeSignal would leave in a MARTeConfig, in
+    order, without copying or changing it. Keys in exclude are omitted. '''
+    has_elements = 'NumberOfElements' in marte_config
+    scalar = (has_elements and 'NumberOfDimensions' in marte_config
+              and int(marte_config['NumberOfDimensions']) == 1
+              and int(marte_config['NumberOfElements']) == 1)
+    items = []
+    for key, value in marte_config.items():
+        if key in exclude:
+            continue
+        if scalar and key in ('NumberOfDimensions', 'NumberOfElements'):
+            continue
+        if key == 'Default' and (scalar or not has_elements):
+            value = str(value).lstrip('{').rstrip('}')
+        items.append((key, value))
+    return items
+
 def findIndexByDictKey(list_i, key, value):
     ''' This will search through a list of dictionaries and find a key value matching pair
     # this is intended for where dictionaries are identified by a unique key/value.'''
@@ -1,17 +1,29 @@
 """gam_functions.py contains functions that create or maniuplate gams"""
 
-# Is necessary to import all for consolidate function, don't know what GAM the user will
-# consolidate
-from martepy.marte2.gams import * # pylint: disable=W0614
-from martepy.marte2.qt_functions import generateUniqueName
-
-def assignUniqueName(signal: tuple, signals_list: list):
-    ''' Ensures that a signal is uniquely named compared to a list of signals '''
-    if any(signal_item[0] == signal[0] for signal_item in signals_list):
-        existing_names = [a[0] for a in signals_list]
+# The consolidate function looks up GAMs by class name, as it doesn't know what GAM the
+# user will consolidate
+from martepy.marte2 import gams
+from martepy.functions.extra_functions import generateUniqueName
+
+def assignUniqueName(signal: tuple, signals_list: list, names=None):
+    ''' Ensures that a signal is uniquely named compared to a list of signals, given the set
+    of their names, see SignalIndex, it is used instead of the list '''
+    if names is None:
+        names = [a[0] for a in signals_list]
+    if signal[0] in names:
         alias_name = getAlias(signal)
         signal[1]['MARTeConfig']['Alias'] = alias_name
-        signal = (generateUniqueName(existing_names, signal[0]), signal[1])
+        signal = (generateUniqueName(names, signal[0]), signal[1])
+    return signal
+
+def copySignal(signal):
+    ''' Return a copy of a signal which can be edited without changing the original, its
+    configuration dicts and lists are copied but their values, strings and numbers, are not. This
+    is much quicker than copy.deepcopy '''
+    if isinstance(signal, dict):
+        return {key: copySignal(value) for key, value in signal.items()}
+    if isinstance(signal, (list, tuple)):
+        return type(signal)(copySignal(value) for value in signal)
     return signal
 
 def removeKeysFromConfig(signal: tuple, keys: list):
@@ -50,9 +62,7 @@ def getGamByName(name: str, function_list):
 
 def getAlias(signal_key):
     ''' Return the alias of a signal '''
-    if 'Alias' in list(signal_key[1]['MARTeConfig'].keys()):
-        return signal_key[1]['MARTeConfig']['Alias']
-    return signal_key[0]
+    return signal_key[1]['MARTeConfig'].get('Alias', signal_key[0])
 
 def setDatasource(signal, datasource):
     ''' Simplification of setting a signals datasource '''
@@ -84,6 +94,86 @@ def findSignalInFunctionList(signal, functions):
     except StopIteration:
         return None
 
+def signalKey(signal):
+    ''' Return the alias and datasource of a signal, which isMatchingSignal compares '''
+    return (getAlias(signal), signal[1]['MARTeConfig'].get('DataSource'))
+
+class SignalIndex():
+    ''' The names and aliases of a list of signals, to check whether one is taken without
+    scanning the list. Signals appended to the list are indexed on update, the signals already
+    indexed must not change. '''
+    def __init__(self, signals):
+        self.signals = signals
+        self.names = set()
+        self.aliases = set()
+        self._indexed = 0
+
+    def update(self):
+        ''' Index the signals appended since the last update, returning ourselves '''
+        if len(self.signals) < self._indexed:
+            # Signals were removed, start again
+            self.names, self.aliases, self._indexed = set(), set(), 0
+        for signal in self.signals[self._indexed:]:
+            self.names.add(signal[0])
+            self.aliases.add(getAlias(signal))
+        self._indexed = len(self.signals)
+        return self
+
+def indexSignals(indexes: dict, signals: list) -> SignalIndex:
+    ''' Return the up to date SignalIndex of a list of signals, kept in indexes by the id of
+    the list so it is only indexed once as it grows '''
+    index = indexes.get(id(signals))
+    if index is None or index.signals is not signals:
+        index = indexes[id(signals)] = SignalIndex(signals)
+    return index.update()
+
+class ProducerIndex():
+    ''' Find the signal producing a given signal in a list of functions, the same as
+    findSignalInFunctionList, from an index of the output signals by signalKey. Functions
+    appended to the list are indexed on the next lookup, the output signals of functions
+    already indexed must not change. '''
+    def __init__(self, functions):
+        self.functions = functions
+        self._indexed = 0
+        self._producers = {}
+
+    def find(self, signal):
+        ''' Return the first output signal matching signal, or None '''
+        for function in self.functions[self._indexed:]:
+            for producer in function.output_signals:
+                self._producers.setdefault(signalKey(producer), producer)
+        self._indexed = len(self.functions)
+        return self._producers.get(signalKey(signal))
+
+class UniqueNameAllocator():
+    ''' Generate names unique among the names and aliases of the output signals of a list
+    of functions, as MARTe2Application.newUniqueName does, from a set of those names kept
+    between calls. A name is only taken once a function outputs it, functions appended to the
+    list are indexed on the next call and the output signals of functions already indexed
+    must not change. '''
+    def __init__(self, functions):
+        self.functions = functions
+        self._indexed = 0
+        self._names = set()
+        # The last suffix given to each name, names are only ever added so any lower suffix
+        # is still taken
+        self._counts = {}
+
+    def newName(self, basename):
+        ''' Return basename, or basename followed by the lowest number making it unique '''
+        for function in self.functions[self._indexed:]:
+            for output_signal in function.output_signals:
+                self._names.add(output_signal[0])
+                self._names.add(getAlias(output_signal))
+        self._indexed = len(self.functions)
+        if basename not in self._names:
+            return basename
+        count = self._counts.get(basename, 1)
+        while f'{basename}{count}' in self._names:
+            count += 1
+        self._counts[basename] = count
+        return f'{basename}{count}'
+
 def getParameterName(parameter_name: str):
     """This takes the serialized name of a parameter and returns it's attribute name"""
     return parameter_name.lower().replace(' ','_')
@@ -111,7 +201,7 @@ def consolidate(thread_0_functions, gam_type, config_name, inputs=[], outputs=[]
         for a in thread_0_functions
     ):
         # First actual IOGAM request for any SDN signal so let's add it.
-        gam = globals()[gam_type]
+        gam = getattr(gams, gam_type)
         if gam_type == "ConstantGAM":
             if prepend:
                 thread_0_functions.insert(0,gam(configuration_name=config_name, output_signals=[]))
@@ -0,0 +1,149 @@
+'''
+This module provides capability for a user to convert a MARTe2 written binary file into
+compressed columnar formats which are smaller than a CSV file and quicker to load for analysis:
+NumPy .npz archives, and Parquet or HDF5 files when pyarrow or h5py is installed.
+
+Each signal is stored as a column, shaped (rows, elements) for arrays, alongside metadata of
+its MARTe2 type and number of elements. The log is read a block of rows at a time so memory
+use stays bounded whatever its size.
+'''
+
+import json
+import zipfile
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from martepy.functions.bin2csv import (BLOCK_ROWS, Bin2CSV, Bin2CSVError, SignalDescriptor,
+                                       loadBinaryLog)
+
+
+def signalMetadata(log: np.ndarray, descriptors: Sequence[SignalDescriptor] = ()) -> dict:
+    ''' Return the MARTe2 type and number of elements of each signal of a log as returned by
+    loadBinaryLog, the type named as in the descriptors of the log's header. A signal without
+    a descriptor is given the name of its NumPy type. '''
+    types = {descriptor.name: descriptor.type_descr.name for descriptor in descriptors}
+    metadata = {}
+    for name in log.dtype.names:
+        field_dtype = log.dtype.fields[name][0]
+        elements = field_dtype.shape[0] if field_dtype.shape else 1
+        metadata[name] = {'type': types.get(name, field_dtype.base.name), 'elements': elements}
+    return metadata
+
+def blocks(log: np.ndarray, block_rows: int = BLOCK_ROWS) -> Iterable[np.ndarray]:
+    ''' Yield the rows of a log block_rows at a time '''
+    for start in range(0, len(log), block_rows):
+        yield log[start:start + block_rows]
+
+
+class ColumnarWriter:
+    ''' Base class of the writers of a log to a columnar file, given the structured array of
+    the log as returned by loadBinaryLog it is read block_rows rows at a time. The descriptors
+    of the log's header give the MARTe2 types written in the metadata, see signalMetadata. '''
+    extensions = ()
+
+    def __init__(self, path: str, block_rows: int = BLOCK_ROWS):
+        self.path = path
+        self.block_rows = block_rows
+
+    def write(self, log: np.ndarray, descriptors: Sequence[SignalDescriptor] = ()):
+        ''' Write the signals of log to our file '''
+        raise NotImplementedError
+
+
+class NpzWriter(ColumnarWriter):
+    ''' Write a log to a compressed NumPy .npz archive, with an array for each signal and the
+    JSON of signalMetadata under __metadata__, e.g. numpy.load(path)['Time'] '''
+    extensions = ('.npz',)
+
+    def write(self, log: np.ndarray, descriptors: Sequence[SignalDescriptor] = ()):
+        metadata = signalMetadata(log, descriptors)
+        with zipfile.ZipFile(self.path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name in log.dtype.names:
+                column = log[name]
+                # Each array is streamed into the archive rather than built in memory
+                with archive.open(f'{name}.npy', 'w', force_zip64=True) as member:
+                    np.lib.format.write_array_header_1_0(member, {
+                        'descr': np.lib.format.dtype_to_descr(column.dtype),
+                        'fortran_order': False, 'shape': column.shape})
+                    for block in blocks(column, self.block_rows):
+                        member.write(np.ascontiguousarray(block).tobytes())
+            with archive.open('__metadata__.npy', 'w') as member:
+                np.lib.format.write_array(member, np.array(json.dumps(metadata)))
+
+
+class ParquetWriter(ColumnarWriter):
+    ''' Write a log to a Parquet file using pyarrow, with a column for each signal, a fixed
+    size list column for arrays, and signalMetadata in the schema metadata under martepy '''
+    extensions = ('.parquet',)
+
+    def write(self, log: np.ndarray, descriptors: Sequence[SignalDescriptor] = ()):
+        try:
+            # pylint: disable=C0415
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Bin2CSVError('Writing Parquet files requires pyarrow') # pylint: disable=W0707
+        metadata = signalMetadata(log, descriptors)
+        fields = []
+        for name in log.dtype.names:
+            value_type = pa.from_numpy_dtype(log.dtype.fields[name][0].base)
+            elements = metadata[name]['elements']
+            fields.append(pa.field(name, pa.list_(value_type, elements) if elements > 1 else
+                                   value_type))
+        schema = pa.schema(fields, metadata={'martepy': json.dumps(metadata)})
+
+        def column(values, elements):
+            array = pa.array(np.ascontiguousarray(values).ravel())
+            if elements > 1:
+                return pa.FixedSizeListArray.from_arrays(array, elements)
+            return array
+
+        with pq.ParquetWriter(self.path, schema) as writer:
+            for block in blocks(log, self.block_rows):
+                writer.write_table(pa.table([column(block[name], metadata[name]['elements'])
+                                             for name in log.dtype.names], schema=schema))
+
+
+class Hdf5Writer(ColumnarWriter):
+    ''' Write a log to an HDF5 file using h5py, with a gzip compressed dataset for each
+    signal whose type and elements attributes hold its signalMetadata '''
+    extensions = ('.h5', '.hdf5')
+
+    def write(self, log: np.ndarray, descriptors: Sequence[SignalDescriptor] = ()):
+        try:
+            import h5py # pylint: disable=C0415
+        except ImportError:
+            raise Bin2CSVError('Writing HDF5 files requires h5py') # pylint: disable=W0707
+        metadata = signalMetadata(log, descriptors)
+        with h5py.File(self.path, 'w') as hdf5_file:
+            for name in log.dtype.names:
+                column = log[name]
+                dataset = hdf5_file.create_dataset(
+                    name, shape=column.shape, dtype=column.dtype, compression='gzip',
+                    chunks=(min(max(len(column), 1), self.block_rows),) + column.shape[1:],
+                    maxshape=(None,) + column.shape[1:])
+                dataset.attrs['type'] = metadata[name]['type']
+                dataset.attrs['elements'] = metadata[name]['elements']
+                for start in range(0, len(column), self.block_rows):
+                    dataset[start:start + self.block_rows] = column[start:start + self.block_rows]
+
+
+WRITERS = (NpzWriter, ParquetWriter, Hdf5Writer)
+
+def writerFor(path: str):
+    ''' Return the writer class of the format of path, going by its extension '''
+    for writer in WRITERS:
+        if path.lower().endswith(writer.extensions):
+            return writer
+    extensions = ', '.join(extension for writer in WRITERS for extension in writer.extensions)
+    raise Bin2CSVError(f'Unknown columnar format of {path}, expected one of: {extensions}')
+
+def exportBinaryLog(bin_path: str, out_path: str, signals: Iterable[str] = None,
+                    block_rows: int = BLOCK_ROWS):
+    ''' Convert a MARTe2 FileWriter binary log to the columnar format given by the extension
+    of out_path, .npz, .parquet or .h5, optionally only the given signals '''
+    writer = writerFor(out_path)(out_path, block_rows)
+    with open(bin_path, 'rb') as fin:
+        descriptors = Bin2CSV(bin_path).readHeader(fin)
+    writer.write(loadBinaryLog(bin_path, signals), descriptors)
@@ -1,10 +1,24 @@
-''' Mainly imports just the MARTe2Application instance and a basic GAM.'''
+''' Mainly imports just the MARTe2Application instance and a basic GAM.
+The GAMs, DataSources and objects can also be imported from here, their modules are only
+imported when first used. '''
+
+import importlib
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.datasources import *
-from martepy.marte2.gams import *
-from martepy.marte2.objects import *
+
+_SUBPACKAGES = ('martepy.marte2.datasources', 'martepy.marte2.gams', 'martepy.marte2.objects')
 
 __all__ = [
     "MARTe2GAM",
     ]
+
+def __getattr__(name):
+    ''' Look up the GAMs, DataSources and objects from their packages on first access '''
+    if not name.startswith('__'):
+        for package_name in _SUBPACKAGES:
+            package = importlib.import_module(package_name)
+            if name in package.__all__ or name in dir(package):
+                value = getattr(package, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
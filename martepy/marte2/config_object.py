@@ -1,10 +1,8 @@
 ''' The basic config object definition from which all pythonic MARTe2 representations 
 should derive. '''
-import copy
-
 import martepy.marte2.configwriting as marteconfig
 from martepy.marte2.serialize import Serializable
-from martepy.functions.extra_functions import normalizeSignal
+from martepy.functions.extra_functions import normalizedItems
 
 class MARTe2ConfigObject(Serializable):
     """An object which will write configuration when called"""
@@ -49,19 +47,17 @@ class MARTe2ConfigObject(Serializable):
         return "", ""
 
     @staticmethod
-    def writeSignals(defs, config_writer):
+    def writeSignals(defs, config_writer, exclude=()):
         """Helper function for writing out signals sections. The defs variable
         is a list of tuples of form (str, dict) where the string is a unique
         identifier for a signal and the dict should contain a key 'MARTeConfig'
         and may contain further keys with information about the signal. On
         'MARTeConfig' there should be a dict of key value pairs used to create
-        leaf nodes in the signal configuration section.
+        leaf nodes in the signal configuration section, other than those in exclude.
         """
         for signal_name, details in defs:
             config_writer.startSection(signal_name)
-            signal_details = normalizeSignal(copy.deepcopy(details))
-
-            for key, value in signal_details['MARTeConfig'].items():
+            for key, value in normalizedItems(details['MARTeConfig'], exclude):
                 config_writer.writeNode(key, value)
             config_writer.endSection(signal_name)
 
@@ -69,6 +65,32 @@ class MARTe2ConfigObject(Serializable):
         """Write this configuration object into the provided config writer"""
         raise NotImplementedError
 
+    def sameContent(self, other):
+        ''' Whether other, an instance of our class, serializes the same as this object
+        ignoring their ids. Objects of one type holding equal attributes are equal without
+        serializing, as are objects of differing names unequal. '''
+        if other is self:
+            return True
+        if self.configuration_name != other.configuration_name:
+            return False
+        if type(other) is type(self):
+            theirs = vars(other)
+            if len(vars(self)) == len(theirs) and all(
+                    key == 'id' or (key in theirs and theirs[key] == value)
+                    for key, value in vars(self).items()):
+                return True
+        # Serialized content may not depend on every attribute
+        myself = self.serialize()
+        theother = other.serialize()
+        myself['id'] = 0
+        theother['id'] = 0
+        return myself == theother
+
+    def contentHash(self):
+        ''' A hash consistent with sameContent, of the configuration name alone so that
+        it is unchanged by edits to the signals or parameters of the object '''
+        return hash(self.configuration_name)
+
     def serialize(self):
         """Write this configuration object into the provided config writer"""
         return {'configuration_name': self.configuration_name}
@@ -4,6 +4,9 @@
 import warnings
 import json
 
+# Lines a FileConfigWriter holds before writing them to its file in one call
+FILE_BUFFER_LINES = 4096
+
 class ConfigWriter:
     ''' The Configuration Writer base class that is used by all MARTe2 objects 
     to write their configuration representation. '''
@@ -11,6 +14,9 @@ class ConfigWriter:
         self.sectionStack = []
         self.tab = 0
         self.tab_text = tab_text
+        # The prefix of each indentation depth, built as deeper sections are started
+        self._prefixes = ['']
+        self._prefix_text = tab_text
 
     def _output(self, line):
         ''' Internally used to produce the line output '''
@@ -72,7 +78,12 @@ Tab = {self.tab}, Stack = {self.sectionStack[-1]}'''
         ''' Get the current tab index in number of spaces.'''
         if self.tab < 0:
             raise IndexError(f'Tab Error, tab is set to: {self.tab}')
-        return ''.join([self.tab_text]*self.tab)
+        if self._prefix_text != self.tab_text:
+            self._prefixes = ['']
+            self._prefix_text = self.tab_text
+        while len(self._prefixes) <= self.tab:
+            self._prefixes.append(self._prefixes[-1] + self.tab_text)
+        return self._prefixes[self.tab]
 
 class StringConfigWriter(ConfigWriter):
     '''The derived class which actually outputs when used a string output and returns the
@@ -93,6 +104,42 @@ class StringConfigWriter(ConfigWriter):
         ''' Return the currently defined lines. '''
         return self.lines
 
+class FileConfigWriter(ConfigWriter):
+    ''' Writes the configuration straight to a file as it is produced rather than holding
+    it in memory. file is either a path, which is opened and closed by the writer, or an open
+    text file which is left open. Lines are written in batches of buffer_lines, call flush
+    or close once done, or use the writer as a context manager. '''
+    def __init__(self, file, buffer_lines=FILE_BUFFER_LINES, **kwargs):
+        super().__init__(**kwargs)
+        if isinstance(file, str):
+            self.file = open(file, 'w', encoding='utf-8') # pylint: disable=R1732
+            self.owns_file = True
+        else:
+            self.file = file
+            self.owns_file = False
+        self.buffer_lines = buffer_lines
+        self.buffer = []
+    def _output(self, line):
+        ''' Buffer the line, writing the buffer out once full. '''
+        self.buffer.append(line)
+        if len(self.buffer) >= self.buffer_lines:
+            self.flush()
+    def flush(self):
+        ''' Write the buffered lines to the file, each ended with a newline. '''
+        if self.buffer:
+            self.buffer.append('')
+            self.file.write('\n'.join(self.buffer))
+            self.buffer = []
+    def close(self):
+        ''' Flush the remaining lines and close the file if the writer opened it. '''
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc_info):
+        self.close()
+
 class JSONConfigWriter:
     """A JSON config builder that produces a nested JSON object instead of raw text."""
     def __init__(self):
@@ -1,15 +1,29 @@
-''' Import most of the useful datasources in one go '''
+# pylint: disable=E0603
+# The names in __all__ are provided by __getattr__
+''' Import most of the useful datasources in one go, each datasource module is only
+imported when its class is first used '''
 
-from martepy.marte2.datasources.gam_datasource import GAMDataSource
-from martepy.marte2.datasources.logger_datasource import LoggerDataSource
-from martepy.marte2.datasources.timing_datasource import TimingDataSource
-from martepy.marte2.datasources.udp import UDPReceiver, UDPSender
-from martepy.marte2.datasources.linux_timer import LinuxTimer
-from martepy.marte2.datasources.files import FileReader, FileWriter
-from martepy.marte2.datasources.sdn import SDNPublisher, SDNSubscriber
-from martepy.marte2.datasources.epics import EPICSPublisher, EPICSSubscriber
-from martepy.marte2.datasources.async_bridge import AsyncBridge
-from martepy.marte2.datasources.files.file_datasources import RFileReader, RFileWriter
+import importlib
+
+_MODULES = {
+        'GAMDataSource': 'martepy.marte2.datasources.gam_datasource',
+        'LoggerDataSource': 'martepy.marte2.datasources.logger_datasource',
+        'TimingDataSource': 'martepy.marte2.datasources.timing_datasource',
+        'UDPReceiver': 'martepy.marte2.datasources.udp',
+        'UDPSender': 'martepy.marte2.datasources.udp',
+        'LinuxTimer': 'martepy.marte2.datasources.linux_timer',
+        'FileReader': 'martepy.marte2.datasources.files',
+        'FileWriter': 'martepy.marte2.datasources.files',
+        'SDNPublisher': 'martepy.marte2.datasources.sdn',
+        'SDNSubscriber': 'martepy.marte2.datasources.sdn',
+        'EPICSPublisher': 'martepy.marte2.datasources.epics',
+        'EPICSSubscriber': 'martepy.marte2.datasources.epics',
+        'AsyncBridge': 'martepy.marte2.datasources.async_bridge',
+        'RFileReader': 'martepy.marte2.datasources.files.file_datasources',
+        'RFileWriter': 'martepy.marte2.datasources.files.file_datasources'
+    }
+
+_SUBPACKAGES = ('udp', 'files', 'sdn', 'epics')
 
 __all__ = [
         'GAMDataSource',
@@ -24,3 +38,17 @@ __all__ = [
         'RFileReader',
         'RFileWriter'
     ]
+
+def __getattr__(name):
+    ''' Import the module of a datasource class or subpackage on first access '''
+    if name in _MODULES:
+        value = getattr(importlib.import_module(_MODULES[name]), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f'{__name__}.{name}')
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_MODULES))
@@ -1,6 +1,5 @@
 ''' Pythonic representative class of the EPICS Publisher Datasource '''
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addInputSignalsSection
 
 class EPICSPublisher(MARTe2DataSource):
     ''' Pythonic representation of the EPICS Publisher -
@@ -78,24 +77,14 @@ class EPICSPublisher(MARTe2DataSource):
         self.dbr64castdouble = data['parameters']['dbr64castdouble']
         return res
 
-    def writeSignals(self, defs, config_writer):
-        """Use MARTe1ConfigObject.writeSignals but remove any DataSources."""
-        omit_keys = ('DataSource','Alias')
-        signals = [(
-                n,
-                dict(d, **{'MARTeConfig': {
-                        k: v for k, v in d['MARTeConfig'].items() if k not in omit_keys
-                    }})
-            ) for n, d in defs]
-
-        super().writeSignals(signals, config_writer)
-
     @staticmethod
     def loadParameters(mainpanel_instance, node):
         """This function is intended to be for the GUI where it can call
         the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addInputSignalsSection
         addInputSignalsSection(mainpanel_instance, node, pack=False,
                                datasource=node.configuration_name, epics=True)
 
@@ -3,21 +3,7 @@ write to ensure the data is written without breakages in columns during CSV writ
 
 from functools import partial
 
-from PyQt5.QtWidgets import (
-    QPushButton,
-    QWidget,
-    QLineEdit,
-    QLabel,
-    QHBoxLayout,
-    QFileDialog
-)
-
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import (addComboEdit,
-                                         addInputSignalsSection,
-                                         addOutputSignalsSection,
-                                         addLineEdit,
-                                         paraChange)
 
 class RFileWriter(MARTe2DataSource):
     ''' Pythonic representation of Flushing FileWriter '''
@@ -131,11 +117,13 @@ class RFileWriter(MARTe2DataSource):
                 setattr(self, property_name, data['parameters'][property_name])
 
     @staticmethod
-    def loadParameters(mainpanel_instance, node):
+    def loadParameters(mainpanel_instance, node): # pylint: disable=R0914
         """This function is intended to be for the GUI where it can call
         the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addComboEdit, addInputSignalsSection, addLineEdit
         addInputSignalsSection(mainpanel_instance, node, False, datasource=node.configuration_name)
 
         addLineEdit(mainpanel_instance, node, "File name: ", 'filename', 2, 0)
@@ -235,24 +223,17 @@ class RFileReader(MARTe2DataSource):
         self.preload = data['parameters']["preload"]
         return res
 
-    def writeSignals(self, defs, config_writer):
-        """Use MARTe1ConfigObject.writeSignals but remove any DataSources."""
-        omit_keys = ('DataSource','Alias')
-        signals = [(
-                n,
-                dict(d, **{'MARTeConfig': {
-                        k: v for k, v in d['MARTeConfig'].items() if k not in omit_keys
-                    }})
-            ) for n, d in defs]
-
-        super().writeSignals(signals, config_writer)
-
     @staticmethod
-    def loadParameters(mainpanel_instance, node):
+    def loadParameters(mainpanel_instance, node): # pylint: disable=R0914
         """This function is intended to be for the GUI where it can call
         the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from PyQt5.QtWidgets import (QPushButton, QWidget, QLineEdit, QLabel, QHBoxLayout,
+                                     QFileDialog)
+        from martepy.marte2.qt_functions import (addComboEdit, addOutputSignalsSection, addLineEdit,
+                                                 paraChange)
         addOutputSignalsSection(mainpanel_instance, node, False)
 
         # Special file input
@@ -2,8 +2,6 @@
 from martepy.marte2.datasource import MARTe2DataSource
 
 
-from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addInputSignalsSection
-
 class FileWriter(MARTe2DataSource):
     ''' Pythonic representation of the File Writer object '''
     def __init__(self,
@@ -127,6 +125,8 @@ class FileWriter(MARTe2DataSource):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addInputSignalsSection
         addInputSignalsSection(mainpanel_instance, node, False, datasource=node.configuration_name)
 
         addLineEdit(mainpanel_instance, node, "File name: ", 'filename', 2, 0)
@@ -2,13 +2,7 @@
 
 import copy
 
-from PyQt5.QtWidgets import (
-    QWidget,
-    QSizePolicy
-)
-
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addLineEdit
 
 class LinuxTimer(MARTe2DataSource):
     ''' Pythonic representation of the LinuxTimer '''
@@ -125,6 +119,9 @@ class LinuxTimer(MARTe2DataSource):
     @staticmethod
     def loadParameters(mainpanel_instance, node):
         ''' Loads the configuration panel used in the XMARTe2 GUI '''
+        # pylint: disable=C0415
+        from PyQt5.QtWidgets import QWidget, QSizePolicy
+        from martepy.marte2.qt_functions import addLineEdit
         # Fix to make it look better
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
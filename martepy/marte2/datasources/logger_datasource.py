@@ -2,7 +2,6 @@
 
 from martepy.marte2.datasource import MARTe2DataSource
 
-from martepy.marte2.qt_functions import addSignalsSection
 
 class LoggerDataSource(MARTe2DataSource):
     ''' Pythonic representation of the Logger DataSource '''
@@ -44,10 +43,10 @@ class LoggerDataSource(MARTe2DataSource):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        from martepy.marte2.qt_functions import addSignalsSection # pylint: disable=C0415
         addSignalsSection(mainpanel_instance, node, type_input=True)
 
 
-
 def initialize(factory, plugin_datastore) -> None:
     ''' Initialize our object with the factory '''
     factory.registerBlock("LoggerDataSource", LoggerDataSource, plugin_datastore)
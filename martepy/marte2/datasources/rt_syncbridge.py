@@ -3,13 +3,7 @@
 import copy
 from functools import partial
 
-from PyQt5.QtWidgets import (
-    QLabel,
-    QComboBox
-)
-
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addSignalsSection, addLineEdit, addComboEdit
 
 
 class Synchronisation(MARTe2DataSource):
@@ -72,10 +66,11 @@ class Synchronisation(MARTe2DataSource):
     # self.input for GUI purposes but actually this is the same datasource
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            myself = copy.deepcopy(self.serialize())
-            theother = copy.deepcopy(other.serialize())
-            if not myself['configuration_name'] == theother['configuration_name']:
+            if not self.configuration_name == other.configuration_name:
                 return False
+            # Serialize returns copies so these can be changed
+            myself = self.serialize()
+            theother = other.serialize()
             del myself['parameters']['input']
             del theother['parameters']['input']
             if not myself['parameters'] == theother['parameters']:
@@ -83,6 +78,8 @@ class Synchronisation(MARTe2DataSource):
             return True
         return False
 
+    __hash__ = MARTe2DataSource.__hash__
+
     def deserialize(self, data: dict, hashmap: dict={}, restore_id: bool=True) -> bool:
         ''' Deserialize the datasource object. '''
         res = super().deserialize(data, hashmap, restore_id)
@@ -98,6 +95,9 @@ class Synchronisation(MARTe2DataSource):
         instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from PyQt5.QtWidgets import QLabel, QComboBox
+        from martepy.marte2.qt_functions import addSignalsSection, addLineEdit, addComboEdit
         # This needs to be specialised, if the user selects to have this reading or writing
         # Then the sockets need to be switched
 
@@ -1,6 +1,5 @@
 ''' Pythonic representation of the SDN Publisher '''
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addLineEdit, addInputSignalsSection
 
 class SDNPublisher(MARTe2DataSource):
     ''' Pythonic representation of the SDN Publisher '''
@@ -76,6 +75,8 @@ class SDNPublisher(MARTe2DataSource):
         the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addLineEdit, addInputSignalsSection
         addInputSignalsSection(mainpanel_instance,node, False, datasource=node.configuration_name)
 
         addLineEdit(mainpanel_instance,node,"Topic name: ", 'topic', 2, 0)
@@ -1,6 +1,5 @@
 ''' Pythonic representation of the SDN Subscriber '''
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addOutputSignalsSection
 
 class SDNSubscriber(MARTe2DataSource):
     ''' Pythonic representation of the SDN Subscriber '''
@@ -93,6 +92,8 @@ class SDNSubscriber(MARTe2DataSource):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addOutputSignalsSection
         addOutputSignalsSection(mainpanel_instance, node, False)
 
         addLineEdit(mainpanel_instance, node,"Topic: ",'topic', 2, 0)
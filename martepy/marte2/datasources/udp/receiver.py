@@ -1,6 +1,5 @@
 ''' Pythonic representation of the UDP Receiver '''
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addComboEdit, addOutputSignalsSection, addLineEdit
 
 
 class UDPReceiver(MARTe2DataSource):
@@ -93,6 +92,8 @@ class UDPReceiver(MARTe2DataSource):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addComboEdit, addOutputSignalsSection, addLineEdit
         addOutputSignalsSection(mainpanel_instance, node)
 
         addLineEdit(mainpanel_instance, node, "Port: ", 'port', 2, 0)
@@ -1,7 +1,6 @@
 ''' Pythonic representation of the UDP Sender '''
 
 from martepy.marte2.datasource import MARTe2DataSource
-from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addInputSignalsSection
 
 class UDPSender(MARTe2DataSource):
     ''' Pythonic representation of the UDP Sender '''
@@ -91,6 +90,8 @@ class UDPSender(MARTe2DataSource):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addComboEdit, addLineEdit, addInputSignalsSection
         addInputSignalsSection(mainpanel_instance,node,False, datasource=node.configuration_name)
 
         addLineEdit(mainpanel_instance, node, "Port: ", 'port', 2, 0)
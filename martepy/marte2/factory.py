@@ -6,30 +6,180 @@ Place thing function in each python file of something that can be loaded into th
 def initialize(factory, plugin_datastore) -> None:
     factory.registerBlock("{class name to be used}", {class in file to use}, plugin_datastore)
 
+A JSON plugin definition file maps a key to either the module name, which is imported
+and initialized when the file is loaded, or to the module and the class names it
+registers, which are only imported when one of those classes is first created:
+
+{
+    "waveformsin": {"module": "martepy.marte2.gams.waveform_sin",
+                    "classes": ["WaveformGAM::WaveformSin", "WaveformSin", "WaveformSinGAM"]}
+}
+
+The plugins shipped with martepy are registered once per process in a read only factory,
+returned by sharedFactory. To register further plugins create a Factory with it as parent,
+which looks up any class it does not register itself in the shared factory:
+
+factory = Factory(parent=sharedFactory())
+factory.loadRemote("my_plugins.json")
+
 """
 
 import importlib
 import json
+import os
+import threading
+
+# Process wide caches so that every Factory reads each definition file and initializes
+# each plugin module once, whichever Factory does so first
+_DEFINITIONS = {}
+_PLUGINS = {}
+# Guards the caches above and the import of plugins, shared factory registries are
+# resolved from several threads
+_LOCK = threading.RLock()
+_SHARED = None
+
+MARTE2_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DEFINITIONS = (os.path.join(MARTE2_DIR, 'objects', 'objects.json'),
+                       os.path.join(MARTE2_DIR, 'gams', 'gams.json'),
+                       os.path.join(MARTE2_DIR, 'datasources', 'datasources.json'),
+                       os.path.join(os.path.dirname(MARTE2_DIR), 'frameworks', 'end.json'))
+
+class LazyBlock:
+    ''' Placeholder registered for a class whose plugin module has not been imported yet '''
+    __slots__ = ('module',)
+
+    def __init__(self, module):
+        self.module = module
+
+    def __repr__(self):
+        return f'LazyBlock({self.module!r})'
+
+
+class PluginRegistry(dict):
+    ''' The class name to class mapping of a Factory. Names registered from a plugin
+    definition hold a LazyBlock until they are looked up, at which point the plugin
+    module is imported and every class it registers replaces its placeholder. '''
+    def __init__(self, factory, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.factory = factory
+
+    def __getitem__(self, class_name):
+        block_class = super().__getitem__(class_name)
+        if isinstance(block_class, LazyBlock):
+            block_class = self._load(class_name, block_class)
+        return block_class
+
+    def get(self, class_name, default=None):
+        ''' Return the class registered to class_name or default '''
+        if class_name in self:
+            return self[class_name]
+        return default
+
+    def _load(self, class_name, lazy_block):
+        ''' Import the plugin of a placeholder and register its classes '''
+        with _LOCK:
+            block_class = super().__getitem__(class_name)
+            if not isinstance(block_class, LazyBlock):
+                # Loaded by another thread while this one waited
+                return block_class
+            registered = _PLUGINS.get(lazy_block.module)
+            if registered is None:
+                registered = {}
+                plugin = self.factory.importModule(lazy_block.module)
+                plugin.initialize(self.factory, registered)
+                _PLUGINS[lazy_block.module] = registered
+            self.update(registered)
+            block_class = super().__getitem__(class_name)
+            if isinstance(block_class, LazyBlock):
+                # The definition named a class which its module does not register
+                del self[class_name]
+                raise KeyError(class_name)
+            return block_class
+
+    def loadAll(self):
+        ''' Import every plugin which still has placeholders registered '''
+        for class_name, block_class in list(super().items()):
+            if isinstance(block_class, LazyBlock) and class_name in self:
+                self[class_name] # pylint: disable=W0104
+
+    def values(self):
+        self.loadAll()
+        return super().values()
+
+    def items(self):
+        self.loadAll()
+        return super().items()
+
+    def pop(self, class_name, *default):
+        if class_name in self:
+            block_class = self[class_name]
+            del self[class_name]
+            return block_class
+        return super().pop(class_name, *default)
+
+    def copy(self):
+        return PluginRegistry(self.factory, super().items())
+
+    def __eq__(self, other):
+        self.loadAll()
+        if isinstance(other, PluginRegistry):
+            other.loadAll()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+
+def readDefinition(path):
+    ''' Read a JSON plugin definition file into a list of (module, class names) where class
+    names is None for modules to import straight away. The file is only read once. '''
+    path = os.path.abspath(path)
+    with _LOCK:
+        if path not in _DEFINITIONS:
+            with open(path, 'r', encoding='UTF-8') as json_file:
+                plugins = json.load(json_file).values()
+            _DEFINITIONS[path] = [(plugin, None) if isinstance(plugin, str) else
+                                  (plugin['module'], tuple(plugin['classes']))
+                                  for plugin in plugins]
+        return _DEFINITIONS[path]
+
 
 class Factory:
     ''' The general factory method, should work with any object that in it's python file
-    contains an initialize method which calls and uses the register block. '''
-    def __init__(self):
-        self.classes = {}
+    contains an initialize method which calls and uses the register block.
+
+    Given a parent factory, any class not registered in this factory is created by the
+    parent instead, so registering or unregistering classes never changes the parent. '''
+    def __init__(self, parent=None):
+        self.classes = PluginRegistry(self)
+        self.parent = parent
+        # Names of parent classes unregistered from this factory
+        self.hidden = set()
 
     def importModule(self, name: str):
         ''' Imports a python file '''
         return importlib.import_module(name) # type: ignore
 
     def unloadAll(self):
-        ''' Reset our loaded class instances '''
-        self.classes = {}
+        ''' Reset our loaded class instances, including those of the parent '''
+        self.classes = PluginRegistry(self)
+        self.parent = None
+        self.hidden = set()
 
     def loadRemote(self, path):
-        ''' Load from a given JSON definition file '''
-        with open(path, 'r', encoding='UTF-8') as json_file:
-            plugins = json.load(json_file).values()
-        self.loadPlugins(plugins, self.classes)
+        ''' Load from a given JSON definition file, plugins listing their classes are only
+        imported once one of their classes is created '''
+        for module, class_names in readDefinition(path):
+            if class_names is None:
+                self.loadPlugins([module], self.classes)
+            elif module in _PLUGINS:
+                self.classes.update(_PLUGINS[module])
+            else:
+                lazy_block = LazyBlock(module)
+                for class_name in class_names:
+                    self.classes[class_name] = lazy_block
 
     def loadPlugins(self, plugins, plugin_datastore) -> None:
         """Load the plugins defined in the plugins list."""
@@ -43,18 +193,89 @@ class Factory:
 
     def unregisterBlock(self, class_name: str):
         ''' Unregister a given class instance from our list '''
+        in_parent = self._inParent(class_name)
         try:
             self.classes.pop(class_name)
         except KeyError:
-            raise ValueError(f"Unknown block type {class_name}") # pylint: disable=W0707
+            if not in_parent:
+                raise ValueError(f"Unknown block type {class_name}") # pylint: disable=W0707
+        if in_parent:
+            self.hidden.add(class_name)
+
+    def _inParent(self, class_name):
+        ''' Whether the parent can create class_name and it has not been unregistered '''
+        # Look the name up in each registry rather than create it, which would import its plugin
+        factory = self
+        while factory.parent is not None and class_name not in factory.hidden:
+            factory = factory.parent
+            if class_name in factory.classes:
+                return True
+        return False
 
     def create(self, block_type = "and"):
         """Create a block of a specific type, given an initblock."""
         try:
             return self.classes[block_type]
         except KeyError:
-            raise ValueError(f"Unknown block type {block_type}") # pylint: disable=W0707
+            if self.parent is None or block_type in self.hidden:
+                raise ValueError(f"Unknown block type {block_type}") # pylint: disable=W0707
+        return self.parent.create(block_type)
+
+    def names(self):
+        ''' The names of every class this factory can create, in registration order '''
+        names = {} if self.parent is None else dict.fromkeys(
+            name for name in self.parent.names() if name not in self.hidden)
+        names.update(dict.fromkeys(self.classes))
+        return list(names)
 
     def getAll(self):
         ''' Get an instance of all registered block classes. '''
-        return list(self.classes.values())
+        if self.parent is None:
+            return list(self.classes.values())
+        return [self.create(name) for name in self.names()]
+
+
+class SharedFactory(Factory):
+    ''' A read only factory of the plugins shipped with martepy, see sharedFactory. Its
+    classes can be looked up from any thread, registering further plugins raises TypeError,
+    create a Factory with this as its parent to do so. '''
+    def __init__(self, definitions=DEFAULT_DEFINITIONS):
+        super().__init__()
+        for path in definitions:
+            super().loadRemote(path)
+        self.frozen = True
+
+    def _readOnly(self):
+        ''' Raise the error of trying to change the shared classes '''
+        raise TypeError('The shared factory is read only, register plugins in a '
+                        'Factory(parent=sharedFactory()) instead')
+
+    def loadRemote(self, path):
+        self._readOnly()
+
+    def unloadAll(self):
+        self._readOnly()
+
+    def unregisterBlock(self, class_name: str):
+        self._readOnly()
+
+    def registerBlock(self, class_name: str, block_class: object, plugin_datastore):
+        # Plugins register into their own datastore as they are lazily initialized
+        if plugin_datastore is self.classes and getattr(self, 'frozen', False):
+            self._readOnly()
+        super().registerBlock(class_name, block_class, plugin_datastore)
+
+    def __reduce__(self):
+        # Unpickle to this process' shared factory so pickled applications keep sharing it
+        return (sharedFactory, ())
+
+
+def sharedFactory():
+    ''' Return the process wide factory of the GAMs, DataSources and objects shipped with
+    martepy, it is built on first use and shared by every application and reader '''
+    global _SHARED # pylint: disable=W0603
+    if _SHARED is None:
+        with _LOCK:
+            if _SHARED is None:
+                _SHARED = SharedFactory()
+    return _SHARED
@@ -57,14 +57,12 @@ class MARTe2GAM(MARTe2ConfigObject):
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            myself = copy.deepcopy(self.serialize())
-            theother = copy.deepcopy(other.serialize())
-            myself['id'] = 0
-            theother['id'] = 0
-            if myself == theother:
-                return True
+            return self.sameContent(other)
         return False
 
+    def __hash__(self):
+        return self.contentHash()
+
     def serialize(self):
         ''' Serialize our GAM into a dictionary '''
         data = super().serialize()
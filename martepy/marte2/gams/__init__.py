@@ -1,35 +1,37 @@
-''' Easy import of all available GAMs '''
+# pylint: disable=E0603
+# The names in __all__ are provided by __getattr__
+''' Easy import of all available GAMs, each GAM module is only imported when its class is
+first used so importing one GAM does not import them all '''
 
-from martepy.marte2.gams.iogam import IOGAM
-from martepy.marte2.gams.constant_gam import ConstantGAM
-from martepy.marte2.gams.ssm_gam import SSMGAM
-from martepy.marte2.gams.simulink_gam import SimulinkGAM
-from martepy.marte2.gams.conversion import ConversionGAM
-from martepy.marte2.gams.expression_gam import ExpressionGAM
-from martepy.marte2.gams.message_gam import MessageGAM
-from martepy.marte2.gams.mux import MuxGAM
-from martepy.marte2.gams.filter import FilterGAM
-from martepy.marte2.gams.pid import PIDGAM
-from martepy.marte2.gams.waveform_chirp import WaveformChirpGAM
-from martepy.marte2.gams.waveform_points import WaveformPointsGAM
-from martepy.marte2.gams.waveform_sin import WaveformSinGAM
-from martepy.marte2.gams.histogram import HistogramGAM
-from martepy.marte2.gams.statistics import StatisticsGAM
+import importlib
 
-__all__ = [
-        'IOGAM',
-        'ConstantGAM',
-        'SSMGAM',
-        'SimulinkGAM',
-        'ConversionGAM',
-        'ExpressionGAM',
-        'MessageGAM',
-        'MuxGAM',
-        'FilterGAM',
-        'PIDGAM',
-        'WaveformChirpGAM',
-        'WaveformPointsGAM',
-        'WaveformSinGAM',
-        'HistogramGAM',
-        'StatisticsGAM'
-    ]
+_MODULES = {
+        'IOGAM': 'martepy.marte2.gams.iogam',
+        'ConstantGAM': 'martepy.marte2.gams.constant_gam',
+        'SSMGAM': 'martepy.marte2.gams.ssm_gam',
+        'SimulinkGAM': 'martepy.marte2.gams.simulink_gam',
+        'ConversionGAM': 'martepy.marte2.gams.conversion',
+        'ExpressionGAM': 'martepy.marte2.gams.expression_gam',
+        'MessageGAM': 'martepy.marte2.gams.message_gam',
+        'MuxGAM': 'martepy.marte2.gams.mux',
+        'FilterGAM': 'martepy.marte2.gams.filter',
+        'PIDGAM': 'martepy.marte2.gams.pid',
+        'WaveformChirpGAM': 'martepy.marte2.gams.waveform_chirp',
+        'WaveformPointsGAM': 'martepy.marte2.gams.waveform_points',
+        'WaveformSinGAM': 'martepy.marte2.gams.waveform_sin',
+        'HistogramGAM': 'martepy.marte2.gams.histogram',
+        'StatisticsGAM': 'martepy.marte2.gams.statistics'
+    }
+
+__all__ = list(_MODULES)
+
+def __getattr__(name):
+    ''' Import the module of a GAM class on first access '''
+    if name in _MODULES:
+        value = getattr(importlib.import_module(_MODULES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,5 @@
 ''' Pythonic representation of the Constant GAM '''
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import addOutputSignalsSection
 
 class ConstantGAM(MARTe2GAM):
     """This block allows you to define multiple constant signals
@@ -49,6 +48,7 @@ class ConstantGAM(MARTe2GAM):
         the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        from martepy.marte2.qt_functions import addOutputSignalsSection # pylint: disable=C0415
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addOutputSignalsSection(mainpanel_instance, node, default=True, datasource=datasource)
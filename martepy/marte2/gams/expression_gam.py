@@ -2,13 +2,7 @@
 
 from functools import partial
 
-from PyQt5.QtWidgets import (
-    QTextEdit,
-    QLabel
-)
-
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import addInputSignalsSection, addOutputSignalsSection, paraChange
 class ExpressionGAM(MARTe2GAM):
     ''' Pythonic representation of the Expression GAM'''
     def __init__(self,
@@ -69,6 +63,10 @@ class ExpressionGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from PyQt5.QtWidgets import QTextEdit, QLabel
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 paraChange)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False)
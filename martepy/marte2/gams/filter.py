@@ -1,10 +1,6 @@
 ''' Pythonic representation of the Filter GAM'''
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addInputSignalsSection,
-                                         addOutputSignalsSection,
-                                         addLineEdit,
-                                         addComboEdit)
 
 class FilterGAM(MARTe2GAM):
     ''' Pythonic representation of the Filter GAM'''
@@ -67,6 +63,9 @@ class FilterGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 addLineEdit, addComboEdit)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False)
@@ -1,10 +1,6 @@
 ''' Pythonic representation of the PID GAM'''
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addInputSignalsSection,
-                                         addOutputSignalsSection,
-                                         addLineEdit,
-                                         addComboEdit)
 
 class HistogramGAM(MARTe2GAM):
     ''' Pythonic representation of the Histogram GAM'''
@@ -61,6 +57,9 @@ class HistogramGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 addLineEdit, addComboEdit)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False, samples=True, lims=True)
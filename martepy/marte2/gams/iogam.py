@@ -1,7 +1,6 @@
 ''' Pythonic representation of the IO GAM'''
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import addInputSignalsSection, addOutputSignalsSection
 
 class IOGAM(MARTe2GAM):
     ''' Pythonic representation of the IO GAM'''
@@ -46,6 +45,8 @@ class IOGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import addInputSignalsSection, addOutputSignalsSection
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False)
@@ -1,9 +1,6 @@
 ''' Pythonic representation of the PID GAM'''
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addInputSignalsSection,
-                                         addOutputSignalsSection,
-                                         addLineEdit)
 
 class PIDGAM(MARTe2GAM):
     ''' Pythonic representation of the PID GAM'''
@@ -80,6 +77,9 @@ class PIDGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 addLineEdit)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False)
@@ -1,19 +1,10 @@
 ''' Pythonic representation of the Simulink GAM'''
+import importlib
 from collections import defaultdict
 from functools import partial
-import copy
-
-from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QComboBox, QAbstractItemView
-)
-from PyQt5.QtCore import QSize
-from PyQt5.QtGui import QGuiApplication
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
-                                         addComboEdit, addLineEdit, getSetKey)
-from martepy.functions.extra_functions import normalizeSignal
+from martepy.functions.extra_functions import normalizedItems
 
 class SimulinkGAM(MARTe2GAM):
     ''' Pythonic representation of the Simulink GAM'''
@@ -81,6 +72,7 @@ _{self.configuration_name}.parameters = {self.configuration_name}_params
     # Groups our signals by bus for outputting
     def groupByBus(self, items):
         ''' Group signals together who have the same bus '''
+        from martepy.marte2.qt_functions import getSetKey # pylint: disable=C0415
         grouped = defaultdict(list)
 
         for name, info in items:
@@ -95,6 +87,7 @@ _{self.configuration_name}.parameters = {self.configuration_name}_params
 
     def writeBuses(self, config_writer, ordered_by_bus):
         ''' If using bus, write as a bus into the config '''
+        from martepy.marte2.qt_functions import getSetKey # pylint: disable=C0415
         if not ordered_by_bus:
             return  # nothing to process
 
@@ -110,11 +103,8 @@ _{self.configuration_name}.parameters = {self.configuration_name}_params
                 current_bus = bus
 
             config_writer.startSection(name)
-            signal_details = normalizeSignal(copy.deepcopy(info))
-
-            for key, value in signal_details['MARTeConfig'].items():
-                if not key == 'Bus':
-                    config_writer.writeNode(key, value)
+            for key, value in normalizedItems(info['MARTeConfig'], exclude=('Bus',)):
+                config_writer.writeNode(key, value)
             config_writer.endSection(name)
 
         # After loop, end the last section
@@ -190,6 +180,8 @@ _{self.configuration_name}.parameters = {self.configuration_name}_params
     @staticmethod
     def openDefineParametersDialog(node):
         ''' Called from xMARTe to define the parameters via a dialog '''
+        # pylint: disable=C0415
+        from martepy.marte2.gams.simulink_gam_qt import DefineParametersDialog
         dialog = DefineParametersDialog(node)
         dialog.exec_()
 
@@ -199,6 +191,10 @@ _{self.configuration_name}.parameters = {self.configuration_name}_params
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from PyQt5.QtWidgets import QPushButton
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 addComboEdit, addLineEdit)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False, buses=True)
@@ -230,119 +226,14 @@ _{self.configuration_name}.parameters = {self.configuration_name}_params
                                                   node))
         mainpanel_instance.configbarBox.addWidget(btn_define_params, 6, 2)
 
+def __getattr__(name):
+    ''' The parameters dialog needs PyQt5 so lives in simulink_gam_qt, it is imported from there
+    on first access '''
+    if name == 'DefineParametersDialog':
+        return importlib.import_module('martepy.marte2.gams.simulink_gam_qt').DefineParametersDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def initialize(factory, plugin_datastore) -> None:
     ''' Initialize the object with the factory '''
     factory.registerBlock("SimulinkGAM", SimulinkGAM, plugin_datastore)
     factory.registerBlock("SimulinkWrapperGAM", SimulinkGAM, plugin_datastore)
-
-class DefineParametersDialog(QDialog):
-    ''' Dialog box for setting model parameters '''
-    TYPE_OPTIONS = ['uint8', 'int8', 'uint16', 'int16', 'uint32', 'int32', 'float32', 'float64']
-
-    def __init__(self, node):
-        ''' Dialog box for setting model parameters '''
-        super().__init__()
-        self.node = node
-        self.setWindowTitle("Define Parameters")
-        self.initUI()
-        self.loadExistingParameters()
-
-    def initUI(self):
-        ''' Setup the UI '''
-        self.setMinimumSize(QSize(int(self.screenWidth() * 0.3),
-                                  int(self.screenHeight() * 0.5)))
-        self.setModal(True)
-
-        layout = QVBoxLayout(self)
-
-        # Top bar with Add and Delete
-        top_bar = QHBoxLayout()
-        top_bar.addStretch()
-        self.btn_add = QPushButton("Add")
-        self.btn_delete = QPushButton("Delete")
-        top_bar.addWidget(self.btn_add)
-        top_bar.addWidget(self.btn_delete)
-        layout.addLayout(top_bar)
-
-        # Table
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(['Parameter Name', 'Type', 'Presets'])
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.EditKeyPressed)
-        self.table.verticalHeader().setVisible(False)
-        layout.addWidget(self.table)
-
-        # Bottom bar with Cancel and Apply
-        bottom_bar = QHBoxLayout()
-        bottom_bar.addStretch()
-        self.btn_cancel = QPushButton("Cancel")
-        self.btn_apply = QPushButton("Apply")
-        bottom_bar.addWidget(self.btn_cancel)
-        bottom_bar.addWidget(self.btn_apply)
-        layout.addLayout(bottom_bar)
-
-        # Connections
-        self.btn_add.clicked.connect(self.addRow)
-        self.btn_delete.clicked.connect(self.deleteSelectedRow)
-        self.btn_cancel.clicked.connect(self.reject)
-        self.btn_apply.clicked.connect(self.applyChanges)
-
-    def screenWidth(self):
-        ''' Get screen width '''
-        return QGuiApplication.primaryScreen().geometry().width()
-
-    def screenHeight(self):
-        ''' Get screen height '''
-        return QGuiApplication.primaryScreen().geometry().height()
-
-    def loadExistingParameters(self):
-        ''' Load the previous set of parameters and display '''
-        self.table.setRowCount(0)
-        param_list = self.node.parameters.get('parameters', [])
-        for param in param_list:
-            self.addRow(param.get('parameter_name', ''),
-                         param.get('type', ''),
-                         param.get('presets', ''))
-
-    def addRow(self, name='', type_str='uint8', presets=''):
-        ''' Add another parameter for row '''
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        self.table.setItem(row, 0, QTableWidgetItem(name))
-
-        combo = QComboBox()
-        combo.addItems(self.TYPE_OPTIONS)
-        if type_str in self.TYPE_OPTIONS:
-            combo.setCurrentText(type_str)
-        self.table.setCellWidget(row, 1, combo)
-
-        self.table.setItem(row, 2, QTableWidgetItem(presets))
-
-    def deleteSelectedRow(self):
-        ''' Delete the selected row '''
-        selected = self.table.selectionModel().selectedRows()
-        for index in sorted(selected, reverse=True):
-            self.table.removeRow(index.row())
-
-    def applyChanges(self):
-        ''' Save parameters to the GAM config '''
-        self.node.parameters['parameters'] = []
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 0)
-            presets_item = self.table.item(row, 2)
-            type_widget = self.table.cellWidget(row, 1)
-
-            name = name_item.text() if name_item else ''
-            presets = presets_item.text() if presets_item else ''
-            type_str = type_widget.currentText() if type_widget else 'uint8'
-
-            param_dict = {
-                'parameter_name': name,
-                'type': type_str,
-                'presets': presets
-            }
-            self.node.parameters['parameters'].append(param_dict)
-
-        self.accept()
@@ -1,9 +1,5 @@
 ''' Pythonic representation of the SSM GAM'''
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addComboEdit,
-                                         addInputSignalsSection,
-                                         addLineEdit,
-                                         addOutputSignalsSection)
 
 class SSMGAM(MARTe2GAM):
     ''' Pythonic representation of the SSM GAM'''
@@ -84,6 +80,9 @@ class SSMGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import (addComboEdit, addInputSignalsSection, addLineEdit,
+                                                 addOutputSignalsSection)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False, True)
@@ -1,9 +1,6 @@
 ''' Pythonic representation of the PID GAM'''
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addInputSignalsSection,
-                                         addOutputSignalsSection,
-                                         addLineEdit)
 
 class StatisticsGAM(MARTe2GAM):
     ''' Pythonic representation of the Statistics GAM'''
@@ -65,6 +62,9 @@ class StatisticsGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 addLineEdit)
         app_def = mainpanel_instance.parent.API.getServiceByName('ApplicationDefinition')
         datasource = app_def.configuration['misc']['gamsources'][0]
         addInputSignalsSection(mainpanel_instance, node, False)
@@ -1,9 +1,6 @@
 ''' Pythonic representation of the WaveformChirp GAM'''
 
 from martepy.marte2.gam import MARTe2GAM
-from martepy.marte2.qt_functions import (addInputSignalsSection,
-                                         addOutputSignalsSection,
-                                         addLineEdit)
 
 class WaveformChirpGAM(MARTe2GAM):
     ''' Pythonic representation of the WaveformChirp GAM'''
@@ -106,6 +103,9 @@ class WaveformChirpGAM(MARTe2GAM):
         call the static instance of the class directly to generate
         the appropriate parameter modifier for the node in XMARTe2.
         """
+        # pylint: disable=C0415
+        from martepy.marte2.qt_functions import (addInputSignalsSection, addOutputSignalsSection,
+                                                 addLineEdit)
 
         def validateTime(field):
             if not (len(node.parameters[field]) == 0 or
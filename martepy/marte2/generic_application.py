@@ -1,28 +1,142 @@
 """A more unified and simpler approach to developing MARTe2 application
 """
-import copy
+import fnmatch
+import itertools
+import math
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import martepy.marte2.configwriting as marteconfig
 from martepy.functions.gam_functions import (addAlias, addDimensions, assignUniqueName, consolidate,
-                                             getAlias, getDatasource, getGamByName,
+                                             copySignal, getAlias, getDatasource, getGamByName,
                                              getKeyAttribute, setDatasource,
                                              setKeyAttribute,
-                                             removeKeysFromConfig)
-from martepy.functions.extra_functions import getname, type_sizes, computeTypeSizes
+                                             removeKeysFromConfig, indexSignals,
+                                             UniqueNameAllocator)
+from martepy.functions.extra_functions import (getname, type_sizes, computeTypeSizes,
+                                               generateUniqueName, NonDuplicatingList)
 from martepy.marte2.gams.iogam import IOGAM
+from martepy.marte2.gams.expression_gam import ExpressionGAM
 from martepy.marte2.datasources.gam_datasource import GAMDataSource
-from martepy.marte2.factory import Factory
+from martepy.marte2.factory import Factory, sharedFactory, MARTE2_DIR
 from martepy.marte2.type_database import TypeDBv2 as TypeDB
 from martepy.marte2.datasources.files.file_datasources import RFileWriter
 from martepy.marte2.datasources.files.writer import FileWriter
 from martepy.marte2.datasources.rt_syncbridge import Synchronisation
-from martepy.marte2.qt_functions import generateUniqueName
 from martepy.marte2.datasources.async_bridge import AsyncBridge
 
 class MARTe2Exception(Exception):
     ''' A general MARTe2 Exception - should match similar to what you would receive
     if you tried to actually run the configuration in MARTe2.'''
 
+# Seconds of rows each log FileWriter buffers, within the memory budget in bytes, when buildLog
+# is given LogOptions without numberofbuffers
+LOG_BUFFER_SECONDS = 1
+LOG_BUFFER_BYTES = 64 * 1024 * 1024
+
+@dataclass
+class LogOptions:
+    ''' Which signals buildLog logs and how. A signal is logged if its alias or DataSource
+    matches a pattern of include and neither matches one of exclude. Patterns are globs, or
+    regular expressions given compiled by re.compile, matching the whole alias or DataSource.
+
+    decimation maps patterns to N, a signal matching one, the first in order, is logged only
+    every Nth cycle into a FileWriter of its own. It stores on a trigger computed from the
+    logged cycle counter whose alias is counter, such as the Counter of a LinuxTimer.
+
+    fileformat is that of every FileWriter, csv or binary. Unless numberofbuffers is given
+    each FileWriter buffers LOG_BUFFER_SECONDS of the rows it stores, within LOG_BUFFER_BYTES.
+    '''
+    include: tuple = ('*',)
+    exclude: tuple = ()
+    decimation: dict = None
+    counter: str = 'Counter'
+    fileformat: str = 'csv'
+    numberofbuffers: int = None
+
+    def __post_init__(self):
+        if self.fileformat not in ('csv', 'binary'):
+            raise ValueError(f'Unknown log file format {self.fileformat}, expected csv or binary')
+        self.decimation = self.decimation or {}
+        if any(int(every) < 1 for every in self.decimation.values()):
+            raise ValueError('Signals can only be logged every 1 or more cycles')
+
+    @staticmethod
+    def matches(signal, patterns) -> bool:
+        ''' Return whether the alias or DataSource of signal matches one of patterns '''
+        names = [name for name in (getAlias(signal), signal[1]['MARTeConfig'].get('DataSource'))
+                 if name is not None]
+        return any(pattern.fullmatch(name) if isinstance(pattern, re.Pattern) else
+                   fnmatch.fnmatchcase(name, pattern) for pattern in patterns for name in names)
+
+    def selects(self, signal) -> bool:
+        ''' Return whether signal is logged '''
+        return self.matches(signal, self.include) and not self.matches(signal, self.exclude)
+
+    def every(self, signal) -> int:
+        ''' Return every how many cycles signal is logged '''
+        return next((int(every) for pattern, every in self.decimation.items()
+                     if self.matches(signal, [pattern])), 1)
+
+def checkFunctions(functions, sizes): # pylint:disable=R0914
+    ''' Check the signals of each function, given as its name, class name, input and output
+    signals, against each other. Returns for each function the errors found, the aliases it
+    consumes from each datasource and the datasources it writes to. '''
+    results = []
+    for name, class_name, input_signals, output_signals in functions:
+        errors = []
+
+        def calculateTotalBytes(signals, errors=errors):
+            ''' Return the bytes of signals, or None if the size of a type is unknown '''
+            total = 0
+            for signal in signals:
+                _, config = signal
+                marte = config.get('MARTeConfig', {})
+                type_str = marte.get('Type')
+                num_elements = int(marte.get('NumberOfElements', '1'))
+                if type_str not in sizes:
+                    errors.append(MARTe2Exception(f"Unsupported type: {type_str}"))
+                    total = None
+                elif total is not None:
+                    total += sizes[type_str] * num_elements
+            return total
+
+        consumed = []
+        input_signal_names = set()
+        for signal in input_signals:
+            if signal[0] in input_signal_names:
+                errors.append(MARTe2Exception(f"""Cannot have same root name of input
+signal repeated within function: {name.lstrip('+')}"""))
+            input_signal_names.add(signal[0])
+            consumed.append((signal[1]['MARTeConfig']['DataSource'], getAlias(signal)))
+        output_signal_aliases = set()
+        output_signal_names = set()
+        for signal in output_signals:
+            if getAlias(signal) in output_signal_aliases:
+                errors.append(MARTe2Exception(f"""Multiple producers of alias within
+function: {name.lstrip('+')}"""))
+            elif signal[0] in output_signal_names:
+                errors.append(MARTe2Exception(f"""Cannot have same root name of output
+signal repeated within function: {name.lstrip('+')}"""))
+            output_signal_aliases.add(getAlias(signal))
+            output_signal_names.add(signal[0])
+
+        # Perform a check on IOGAM and the same bytes in as bytes out
+        if class_name == 'IOGAM':
+            input_total = calculateTotalBytes(input_signals)
+            output_total = calculateTotalBytes(output_signals)
+
+            if None not in (input_total, output_total) and input_total != output_total:
+                errors.append(MARTe2Exception(
+                    f"""Input/output size mismatch: {input_total} bytes in, {output_total}
+ bytes out in IOGAM function: {name}"""
+                ))
+        writes = {getKeyAttribute(output_signal, 'DataSource') for
+                  output_signal in output_signals}
+        results.append((errors, consumed, writes))
+    return results
+
 class MARTe2Application():
     ''' The pythonic object representation of a MARTe2 application, how to build it and
     ultimately write this into it's string configuration format. '''
@@ -48,16 +162,9 @@ class MARTe2Application():
         self.type_db = TypeDB()
         self.maxcycles = 40000
         self.app_name = app_name
-        # Load the factory
-        self.factory = Factory()
-        self.marte2_dir = os.path.abspath(os.path.join(os.path.dirname(__file__)))
-        datasources = os.path.join(self.marte2_dir,"datasources", "datasources.json")
-        gams = os.path.join(self.marte2_dir,"gams", "gams.json")
-        objects = os.path.join(self.marte2_dir,"objects","objects.json")
-        self.factory.loadRemote(datasources)
-        self.factory.loadRemote(gams)
-        self.app_name = app_name
-        self.factory.loadRemote(objects)
+        # Classes registered in the factory of an application extend the shared plugins
+        self.factory = Factory(parent=sharedFactory())
+        self.marte2_dir = MARTE2_DIR
         self.logging_iogam = IOGAM('+LoggingGAM',[],[])
         self.filewriter = RFileWriter('+LoggingFileWriter',filename='output.csv')
         self.asyncbridge = AsyncBridge('+LoggingAsyncBridge')
@@ -71,16 +178,7 @@ class MARTe2Application():
         ''' Load type definition directory into our type database '''
         self.type_db.loadDb(filepath)
 
-    class NonDuplicatingList(list):
-        ''' A non duplicating list class - effectively a set '''
-        def append(self, item):
-            if not any(item == list_item for list_item in self):
-                super().append(item)
-
-        def __iadd__(self, other):
-            for item in other:
-                self.append(item)
-            return self
+    NonDuplicatingList = NonDuplicatingList
 
     def resetApp(self):
         ''' Reset our application instance. '''
@@ -94,7 +192,23 @@ class MARTe2Application():
         self.states = self.NonDuplicatingList()
         self.internals = self.NonDuplicatingList()
         self.objects = self.NonDuplicatingList()
-
+        # What sanitize and removeUnused last saw, so re-exporting after a small edit only
+        # re-checks what changed, see markDirty
+        self._dirty = set()
+        self._sanitized = None
+        self._usage = {}
+        self._clean = None
+
+    def markDirty(self, *objects):
+        ''' Record that objects of the application were edited in place so the next sanitize
+        and removeUnused re-check them. Adding, removing, replacing or renaming functions and
+        changing the DataSource of their signals is noticed without this, other edits in place,
+        for instance to a datasource, are not. Given no objects everything is re-checked. '''
+        if not objects:
+            self._sanitized = None
+            self._usage = {}
+        self._dirty.update(id(obj) for obj in objects)
+        self._clean = None
 
     def add(self, externals=[], additional_datasources=[], functions=[],
             states=[], internals=[], objects=[]):
@@ -167,22 +281,9 @@ class MARTe2Application():
         return signals
 
     def newUniqueName(self, basename):
-        ''' Generate a unique name from what is already defined in our application. '''
-        count = 0
-        existing_signals = []
-        name = basename
-        for function in self.functions:
-            for output_signal in function.output_signals:
-                existing_signals.append(output_signal[0])
-                existing_signals.append(getAlias(output_signal))
-        if name in existing_signals:
-            for _ in existing_signals: # It would be impossible to exceed this,
-                # better than doing an infinite while loop
-                count = count + 1
-                name = f'{basename}{count}'
-                if name not in existing_signals:
-                    break
-        return name
+        ''' Generate a unique name from what is already defined in our application. To
+        generate many names use a UniqueNameAllocator of our functions. '''
+        return UniqueNameAllocator(self.functions).newName(basename)
 
     def defineTypeSizes(self, typedb):
         ''' Add type sizes from the type database if used.
@@ -196,150 +297,103 @@ class MARTe2Application():
                 sizes[name] = computeTypeSizes(type_obj, typedb.types, cache)
         return sizes
 
-    def onlyErrors(self, typedb=None): # pylint:disable=R0914, R0915, R0912
+    def _checkFunctions(self, workers=None):
+        ''' Run checkFunctions over our functions, split between workers processes when
+        given more than one '''
+        functions = [(function.configuration_name, function.class_name,
+                      function.input_signals, function.output_signals)
+                     for function in self.functions]
+        sizes = dict(type_sizes)
+        if not workers or len(functions) <= workers:
+            return checkFunctions(functions, sizes)
+        # A few chunks for each worker so that uneven chunks even out
+        chunk = -(-len(functions) // (workers * 4))
+        with ProcessPoolExecutor(workers) as pool:
+            # map returns results in order so the errors are the same as checking serially
+            results = pool.map(checkFunctions,
+                               [functions[i:i + chunk] for i in range(0, len(functions), chunk)],
+                               itertools.repeat(sizes))
+            return [result for chunk_results in results for result in chunk_results]
+
+    def onlyErrors(self, typedb=None, workers=None): # pylint:disable=R0914, R0915, R0912
         ''' Check our application for any errors given what we know, if we were to run this
-        configuration now, what would MARTe2 error/say? '''
+        configuration now, what would MARTe2 error/say?
+
+        Given workers, the signals of the functions are checked in that many processes
+        when there are more functions than workers, which only pays off for large
+        applications with as many cores free. '''
         exceptions = []
         consumed = {}
         produced = {}
-        function_names = []
+        function_names = set()
         type_sizes.update(self.defineTypeSizes(typedb))
         # Check that all interfaces are unique
-        interface_names = []
+        interface_names = set()
         for objec in self.objects:
             if objec.configuration_name.lstrip('+') in interface_names:
                 exceptions.append(MARTe2Exception("""Two objects/interfaces exist in the
 configuration with the same name."""))
-            interface_names.append(objec.configuration_name.lstrip('+'))
+            interface_names.add(objec.configuration_name.lstrip('+'))
+
         # Signal names of same name within same function - use MARTeApplication.getAlias
-        for function in self.functions:
+        writers = {}
+        for function, (function_errors, function_consumed, writes) in zip(
+            self.functions, self._checkFunctions(workers)):
             # Same named functions in application
             if function.configuration_name.lstrip('+') in function_names:
                 exceptions.append(MARTe2Exception("""Two functions with the same name exist -
 this can happen if you have two functions in the same state or across states which are
 non-identical but identical in name."""))
-            function_names.append(function.configuration_name.lstrip('+'))
-            input_signal_names = []
-            for signal in function.input_signals:
-                if signal[0] in input_signal_names:
-                    exceptions.append(MARTe2Exception(f"""Cannot have same root name of input
-signal repeated within function: {function.configuration_name.lstrip('+')}"""))
-                input_signal_names.append(signal[0])
-                datasource = signal[1]['MARTeConfig']['DataSource']
-                if datasource not in consumed:
-                    consumed[datasource] = []
-                consumed[datasource].append(getAlias(signal))
-            output_signal_aliases = []
-            output_signal_names = []
-            for signal in function.output_signals:
-                if getAlias(signal) in output_signal_aliases:
-                    exceptions.append(MARTe2Exception(f"""Multiple producers of alias within
-function: {function.configuration_name.lstrip('+')}"""))
-                elif signal[0] in output_signal_names:
-                    exceptions.append(MARTe2Exception(f"""Cannot have same root name of output
-signal repeated within function: {function.configuration_name.lstrip('+')}"""))
-                output_signal_aliases.append(getAlias(signal))
-                output_signal_names.append(signal[0])
-
-            # Perform a check on IOGAM and the same bytes in as bytes out
-            if function.class_name == 'IOGAM':
-                def calculateTotalBytes(signals):
-                    total = 0
-                    for signal in signals:
-                        _, config = signal
-                        marte = config.get('MARTeConfig', {})
-                        type_str = marte.get('Type')
-                        num_elements = int(marte.get('NumberOfElements', '1'))
-                        if type_str not in type_sizes:
-                            exceptions.append(MARTe2Exception(f"Unsupported type: {type_str}"))
-                        total += type_sizes[type_str] * num_elements
-                    return total
-
-                input_total = calculateTotalBytes(function.input_signals)
-                output_total = calculateTotalBytes(function.output_signals)
-
-                if input_total != output_total:
-                    exceptions.append(MARTe2Exception(
-                        f"""Input/output size mismatch: {input_total} bytes in, {output_total}
- bytes out in IOGAM function: {function.configuration_name}"""
-                    ))
-        # More than one producer of a signal in a datasource - use MARTeApplication.getAlias
-
-        for datasource_name, datasource_signals in produced.items():
-            seen = set()
-            for string in datasource_signals:
-                if string in seen:
-                    exceptions.append(MARTe2Exception(f"""Multiple producers found of
-signal/alias: {string} in datasource {datasource_name}"""))
-                else:
-                    seen.add(string)
+            function_names.add(function.configuration_name.lstrip('+'))
+            exceptions += function_errors
+            for datasource, alias in function_consumed:
+                consumed.setdefault(datasource, []).append(alias)
+            for datasource in writes:
+                writers[datasource] = writers.get(datasource, 0) + 1
+
+        # States in which any thread has functions, the signals of datasources are consumed
+        # once for each of these
+        active_states = sum(1 for state in self.states if
+                            not all(len(thread.functions) == 0 for
+                                    thread in state.threads.objects))
         # Same named datasources in application
-        datasource_names = []
+        datasource_names = set()
         for datasource in self.additional_datasources:
             if datasource.configuration_name.lstrip('+') in datasource_names:
                 exceptions.append(MARTe2Exception("""Two datasources with the same name exist
  - this can happen if you have two datasources in the same state or across states which are
  non-identical but identical in name."""))
             datasource_name = datasource.configuration_name.replace('+','')
-            datasource_names.append(datasource_name)
-            input_signal_names = []
+            datasource_names.add(datasource_name)
+            input_signal_names = set()
             for signal in datasource.input_signals:
                 if signal[0] in input_signal_names:
                     exceptions.append(MARTe2Exception(f"""Cannot have same root name of input
  signal repeated within datasource: {datasource.configuration_name.lstrip('+')}"""))
-                input_signal_names.append(signal[0])
+                input_signal_names.add(signal[0])
 
-            output_signal_names = []
+            output_signal_names = set()
             for signal in datasource.output_signals:
                 if signal[0] in output_signal_names:
                     exceptions.append(MARTe2Exception(f"""Cannot have same root name of
  output signal repeated within datasource: {datasource.configuration_name.lstrip('+')}"""))
-                output_signal_names.append(signal[0])
-            # A datasource must be read/written in each state
-            for input_signal in datasource.input_signals:
-                for state in self.states:
-                    # Ignore if not functions in this state
-                    if all(len(thread.functions) == 0 for thread in state.threads.objects):
-                        continue
-                    if not any(((sinput[1]['MARTeConfig']['DataSource'] ==
-                                 datasource.configuration_name.lstrip('+') and
-                                 getAlias(sinput) == getAlias(input_signal) for
-                                 sinput in function.input_signals) for
-                                 function in thread.functions) for
-                                 thread in state.threads.objects):
-                        exceptions.append(MARTe2Exception(f"""No function in state
-{state.configuration_name.lstrip('+')} found reading from datasource
-{datasource.configuration_name.lstrip('+')} for signal {getAlias(input_signal)}"""))
-                    if datasource_name not in consumed:
-                        consumed[datasource_name] = []
-                    consumed[datasource_name].append(getAlias(input_signal))
-
+                output_signal_names.add(signal[0])
+            if active_states:
+                for input_signal in datasource.input_signals:
+                    consumed.setdefault(datasource_name, []).extend(
+                        [getAlias(input_signal)] * active_states)
+            # Only whether an alias is produced matters here, multiple producers of an alias
+            # are checked for within each function above
             for output_signal in datasource.output_signals:
-                for state in self.states:
-                    if all(len(thread.functions) == 0 for thread in state.threads.objects):
-                        continue
-                    if not any(((output[1]['MARTeConfig']['DataSource'] ==
-                                 datasource.configuration_name.lstrip('+') and
-                                 getAlias(output) == getAlias(output_signal) for
-                                 output in function.output_signals) for
-                                 function in thread.functions) for
-                                 thread in state.threads.objects):
-                        exceptions.append(MARTe2Exception(f"""No function in state
-{state.configuration_name.lstrip('+')} found writing to datasource
-{datasource.configuration_name.lstrip('+')} for signal {getAlias(output_signal)}"""))
-                if datasource_name not in produced:
-                    produced[datasource_name] = []
-                if getAlias(output_signal) not in produced[datasource_name]:
-                    produced[datasource_name].append(getAlias(output_signal))
+                produced.setdefault(datasource_name, set()).add(getAlias(output_signal))
         # All consumers must have their producing signal - use MARTeApplication.getAlias
+        known_datasources = {getname(a) for a in self.additional_datasources}
         for datasource_name, consumed_signals in consumed.items():
             for consumer_signal in consumed_signals:
                 if datasource_name not in produced:
-                    if datasource_name not in [getname(a) for a in self.additional_datasources]:
+                    if datasource_name not in known_datasources:
                         exceptions.append(MARTe2Exception(f"""No datasource {datasource_name}
  found yet consumed by signal {consumer_signal}"""))
-                if datasource_name not in produced:
-                    if datasource_name not in [getname(a) for a in self.additional_datasources]:
                         exceptions.append(MARTe2Exception(f"""datasource {datasource_name} not
   found for consumed signal {consumer_signal}"""))
                     continue
@@ -349,45 +403,36 @@ signal/alias: {string} in datasource {datasource_name}"""))
 
         # Now qualify that you can't have states with the same name and
         # subsequently threads with the same name
-        state_names = []
-        for state in self.states: # pylint: disable=R1702
-            thread_names = []
-            produced_state = copy.deepcopy(produced)
+        state_names = set()
+        for state in self.states:
+            thread_names = set()
             if state.configuration_name.lstrip('+') in state_names:
                 exceptions.append(MARTe2Exception(f"""Multiple states with the same
  name: {state.configuration_name.lstrip('+')}"""))
-            state_names.append(state.configuration_name.lstrip('+'))
+            state_names.add(state.configuration_name.lstrip('+'))
             for thread in state.threads.objects:
                 if thread.configuration_name.lstrip('+') in thread_names:
                     exceptions.append(MARTe2Exception(f"""Multiple threads with the same
  name in state: {state.configuration_name.lstrip('+')},
  with name: {thread.configuration_name.lstrip('+')}"""))
-                for function in thread.functions:
-                    for output_signal in function.output_signals:
-                        if 'DataSource' in signal[1]['MARTeConfig'].keys():
-                            datasource = signal[1]['MARTeConfig']['DataSource']
-                            if datasource not in produced_state:
-                                produced_state[datasource] = []
-                            produced_state[datasource].append(getAlias(signal))
-                thread_names.append(thread.configuration_name.lstrip('+'))
+                thread_names.add(thread.configuration_name.lstrip('+'))
 
         # Only one function can write to a FileWriter across states/threads
         for filewriter in [a for a in self.additional_datasources if
                            isinstance(a, (FileWriter, RFileWriter))]:
-            writers = [a for a in self.functions if any(
-                getKeyAttribute(output_signal, 'DataSource') ==
-                getname(filewriter) for output_signal in a.output_signals)]
-            if len(writers) > 1:
+            if writers.get(getname(filewriter), 0) > 1:
                 exceptions.append(MARTe2Exception(f"""Multiple writers to FileWriter
  {getname(filewriter)}"""))
 
         return exceptions
 
     @staticmethod
-    def _unflattenLog(orig_signal, type_db, loggingiogam, loggingintoio, filewriter, loggamsource): # pylint:disable=R0914
+    def _unflattenLog(orig_signal, type_db, loggingiogam, loggingintoio, filewriter, loggamsource, # pylint:disable=R0913,R0914
+                      indexes=None):
         # Here we want to get the signals associated type and
         # then unflatten it's members so we can get it into
         # the SimFileWriter
+        indexes = {} if indexes is None else indexes
         new_gams = []
         types_used = []
         type_name = getKeyAttribute(orig_signal,'Type')
@@ -404,40 +449,44 @@ signal/alias: {string} in datasource {datasource_name}"""))
             if not type_db.isFundamental(field.type):
                 new_gams += MARTe2Application._unflattenLog(field, type_db, loggingiogam,
                                                             loggingintoio, filewriter,
-                                                            loggamsource)
+                                                            loggamsource, indexes)
             else:
                 # For each field, we now want to create an IOGAM output_signal for it
                 alias = getAlias(orig_signal) + field.name
-                out_sgl = (alias, copy.deepcopy(orig_signal[1]))
+                out_sgl = (alias, copySignal(orig_signal[1]))
                 setKeyAttribute(out_sgl,'Type',field.type)
                 default = 0 if field.type in ('uint32','uint64', 'uint8') else 0.0
                 setKeyAttribute(out_sgl,'Default',default)
                 setKeyAttribute(out_sgl,'Alias',alias)
                 top_gam.output_signals.append(out_sgl)
                 loggingiogam.input_signals += [out_sgl]
-                out_sgl = copy.deepcopy(out_sgl)
-                if any(signal[0] == out_sgl[0] for signal in loggingiogam.output_signals):
-                    existing_names = [a[0] for a in loggingiogam.input_signals]
+                out_sgl = copySignal(out_sgl)
+                if out_sgl[0] in indexSignals(indexes, loggingiogam.output_signals).names:
+                    existing_names = indexSignals(indexes, loggingiogam.input_signals).names
                     out_sgl = (generateUniqueName(existing_names, out_sgl[0]), out_sgl[1])
 
                 setKeyAttribute(out_sgl,'DataSource',loggamsource)
 
                 loggingiogam.output_signals += [out_sgl]
                 loggingintoio.input_signals += [out_sgl]
-                out_sgl = copy.deepcopy(out_sgl)
+                out_sgl = copySignal(out_sgl)
                 setKeyAttribute(out_sgl,'DataSource',getname(filewriter))
 
                 loggingintoio.output_signals += [out_sgl]
 
-                out_sgl = copy.deepcopy(out_sgl)
+                out_sgl = copySignal(out_sgl)
                 removeKeysFromConfig(out_sgl, ['DataSource'])
                 filewriter.input_signals += [out_sgl]
         return new_gams
 
-    def _logSignal(self, signal, thread_index: int, state, thread, new_functions): # pylint: disable=R0914,R0915
+    def _logSignal(self, signal, thread_index: int, state, thread, new_functions, # pylint: disable=R0913,R0914,R0915
+                   indexes=None):
         ''' This function will log a signal, if it is outside the primary thread
         it will use an Async Bridge to transfer the signal to the primary and then 
-        add this to the log. If it is a complex type, it will unflatten the signal type. '''
+        add this to the log. If it is a complex type, it will unflatten the signal type.
+        Given indexes, a dict kept between calls, the names already used in the logging
+        signal lists are looked up in a SignalIndex of each rather than scanning them. '''
+        indexes = {} if indexes is None else indexes
         # Is not a signal from the outside world and therefore we want to log it
         # into our primary thread and primary FileWriter for the simulation.
         osig_name = getAlias(signal)
@@ -445,28 +494,29 @@ signal/alias: {string} in datasource {datasource_name}"""))
             # Now we need to add to loggingintoio IOGAM to get this into our
             # LoggingGAMSource
 
-            if not any(getAlias(signal) == osig_name for
-                        signal in self.logging_iogam.input_signals):
+            if osig_name not in indexSignals(indexes, self.logging_iogam.input_signals).aliases:
 
-                new_signal = copy.deepcopy(signal)
+                new_signal = copySignal(signal)
                 removeKeysFromConfig(new_signal, ['Default'])
 
                 addDimensions(new_signal)
 
                 addAlias(new_signal)
 
-                out_signal = copy.deepcopy(new_signal)
+                out_signal = copySignal(new_signal)
 
                 if self.type_db.isFundamental(
                     new_signal[1]['MARTeConfig']['Type']):
 
                     setDatasource(out_signal, 'LogGAMSource')
 
-                    assignUniqueName(new_signal, self.logging_iogam.input_signals)
+                    assignUniqueName(new_signal, self.logging_iogam.input_signals,
+                                     indexSignals(indexes, self.logging_iogam.input_signals).names)
 
                     self.logging_iogam.input_signals += [new_signal]
 
-                    assignUniqueName(out_signal, self.logging_iogam.output_signals)
+                    assignUniqueName(out_signal, self.logging_iogam.output_signals,
+                                     indexSignals(indexes, self.logging_iogam.output_signals).names)
 
                     removeKeysFromConfig(out_signal, ['Alias'])
 
@@ -474,13 +524,13 @@ signal/alias: {string} in datasource {datasource_name}"""))
 
                     self.loggingintoio.input_signals += [out_signal]
 
-                    out_signal = copy.deepcopy(out_signal)
+                    out_signal = copySignal(out_signal)
 
                     setDatasource(out_signal, getname(self.filewriter))
 
                     self.loggingintoio.output_signals += [out_signal]
 
-                    out_signal = copy.deepcopy(out_signal)
+                    out_signal = copySignal(out_signal)
 
                     removeKeysFromConfig(out_signal, ['DataSource'])
 
@@ -491,14 +541,15 @@ signal/alias: {string} in datasource {datasource_name}"""))
                                                                      self.logging_iogam,
                                                                      self.loggingintoio,
                                                                      self.filewriter,
-                                                                     'LogGAMSource')
+                                                                     'LogGAMSource',
+                                                                     indexes)
         else:
             # Create an IOGAM to get it to the bridge - if not already made
             # Now add signal to loggingintoio
             # Next check if not already logged
             # We need to signals, the input of our signal to the async bridge from the thread
             # and the output signal to the async bridge
-            input_signal = copy.deepcopy(signal)
+            input_signal = copySignal(signal)
             # Neither signal should have a Default value set in the IOGAM
             removeKeysFromConfig(input_signal, ['Default'])
 
@@ -510,14 +561,17 @@ signal/alias: {string} in datasource {datasource_name}"""))
             # Get the Async Bridge in question
             iobridge = getGamByName(iobridge_name.lstrip('+'), self.io_asyncs)
             # Ensure it has a unique name
-            input_signal = assignUniqueName(input_signal, self.loggingintoio.input_signals)
+            logged_names = indexSignals(indexes, self.loggingintoio.input_signals).names
+            input_signal = assignUniqueName(input_signal, self.loggingintoio.input_signals,
+                                            logged_names)
             if iobridge:
-                input_signal = assignUniqueName(input_signal, iobridge.input_signals)
+                input_signal = assignUniqueName(input_signal, iobridge.input_signals,
+                                                indexSignals(indexes, iobridge.input_signals).names)
             # Make sure it will still link by alias back to the original
             input_alias = getAlias(signal)
             input_signal[1]['MARTeConfig']['Alias'] = input_alias
             # Set the output signal to the async bridge
-            out_signal = copy.deepcopy(input_signal)
+            out_signal = copySignal(input_signal)
             # Now create our output_signal and set it to the bridge
             setDatasource(out_signal, 'LoggingAsyncBridge')
             removeKeysFromConfig(out_signal, ['Alias'])
@@ -531,8 +585,9 @@ signal/alias: {string} in datasource {datasource_name}"""))
                 new_functions.append(io_async_gam)
             # Now we know what the signal will be on the primary thread of the async bridge
             # Now create the logging of this signal in the primary thread
-            tolog = copy.deepcopy(out_signal)
-            assignUniqueName(tolog, self.loggingintoio.input_signals)
+            tolog = copySignal(out_signal)
+            assignUniqueName(tolog, self.loggingintoio.input_signals,
+                             indexSignals(indexes, self.loggingintoio.input_signals).names)
             setDatasource(tolog, 'LogGAMSource')
             consolidate(state.threads.objects[0].functions,
                         'IOGAM','+async_sim_io',
@@ -543,11 +598,11 @@ signal/alias: {string} in datasource {datasource_name}"""))
 
                 self.loggingintoio.input_signals += [tolog]
 
-                tolog = copy.deepcopy(tolog)
+                tolog = copySignal(tolog)
                 setDatasource(tolog, getname(self.filewriter))
 
                 self.loggingintoio.output_signals += [tolog]
-                tolog = copy.deepcopy(tolog)
+                tolog = copySignal(tolog)
                 del tolog[1]['MARTeConfig']['DataSource']
                 self.filewriter.input_signals += [tolog]
             else:
@@ -557,12 +612,14 @@ signal/alias: {string} in datasource {datasource_name}"""))
                                                 self.logging_iogam,
                                                 self.loggingintoio,
                                                 self.filewriter,
-                                                'LogGAMSource')
+                                                'LogGAMSource',
+                                                indexes)
 
         return new_functions
 
-    def buildLog(self):
-        """Build a datalogger IO and log signals from our application given user input
+    def buildLog(self, options: LogOptions = None):
+        """Build a datalogger IO and log signals from our application given user input. Given
+        LogOptions only the signals they select are logged, decimated and written as they say.
         """
         # Now that everything exists as it should, we now need to create a
         # method of logging every signal ever created.
@@ -582,6 +639,11 @@ signal/alias: {string} in datasource {datasource_name}"""))
         self._internal_datasources = [a.configuration_name.lstrip('+') for a in
                                  self.additional_datasources if isinstance(a,
                                      (Synchronisation))]
+        indexes = {}
+        # The index in loggingintoio of each signal logged every few cycles, or 0 cycles if
+        # it is only in the LogGAMSource for the trigger, and the cycle counter as it is there
+        decimated = {}
+        counter = None
         for state in self.states:
             if len(state.threads.objects) > 0:
                 state.threads.objects[0].functions += self.iogams
@@ -599,18 +661,130 @@ signal/alias: {string} in datasource {datasource_name}"""))
                     if hasattr(function, 'isSimulation') and function.isSimulation:
                         continue
                     for output_signal in function.output_signals:
-                        if getDatasource(output_signal) not in self._internal_datasources:
-                            self._logSignal(output_signal,thread_index, state, thread,
-                                            new_functions)
+                        if getDatasource(output_signal) in self._internal_datasources:
+                            continue
+                        counter = self._logSelected(output_signal, options, decimated,
+                                                    counter, thread_index, state, thread,
+                                                    new_functions, indexes)
                 thread.functions += new_functions
+        if options:
+            writers = [(self.filewriter, 1)] + self._decimateLog(options, decimated, counter)
+            self._configureLogWriters(options, writers)
+
+    def _logSelected(self, output_signal, options: LogOptions, decimated: dict, counter,
+                     *log_args):
+        ''' Log an output signal, given LogOptions only if they select it or it is the cycle
+        counter, recording in decimated every how many cycles its logged signals are stored.
+        Returns the logged cycle counter once it is found, otherwise counter. '''
+        selected = not options or options.selects(output_signal)
+        is_counter = bool(options) and counter is None and \
+            getAlias(output_signal) == options.counter
+        # The decimation trigger is computed from the counter in any case
+        if not selected and not (options.decimation and is_counter):
+            return counter
+        start = len(self.loggingintoio.input_signals)
+        self._logSignal(output_signal, *log_args)
+        if options:
+            logged = self.loggingintoio.input_signals[start:]
+            if logged and is_counter:
+                counter = logged[0]
+            every = options.every(output_signal) if selected else 0
+            if every != 1:
+                decimated.update((index, every) for index in range(start, start + len(logged)))
+        return counter
+
+    def _decimateLog(self, options: LogOptions, decimated: dict, counter) -> list: # pylint: disable=R0914
+        ''' Move the signals logged every few cycles from the FileWriter to one FileWriter for
+        each number of cycles, storing on a trigger which is 1 every that many cycles of the
+        counter. Returns the new FileWriters with every how many cycles they store. '''
+        if not decimated:
+            return []
+        if counter is None:
+            raise MARTe2Exception(f'Decimating the log needs its cycle counter {options.counter}'
+                                  ' to be logged')
+        writers = []
+        counter_name = counter[0]
+        counter_type = getKeyAttribute(counter, 'Type')
+        for every in sorted(set(decimated.values()) - {0}):
+            indices = [index for index, value in decimated.items() if value == every]
+            writer = RFileWriter(f'+{getname(self.filewriter)}{every}', input_signals=[],
+                                 filename=self.filewriter.filename, storeontrigger=True)
+            root, extension = os.path.splitext(writer.filename or 'output.csv')
+            writer.filename = f'{root}_{every}{extension}'
+            # The FileWriter stores the row when its first signal, the trigger, is 1
+            trigger_name = generateUniqueName({signal[0] for signal in
+                                               self.loggingintoio.input_signals},
+                                              f'LogTrigger{every}')
+            trigger = (trigger_name, {'MARTeConfig': {'DataSource': getDatasource(counter),
+                                                      'Type': 'uint8',
+                                                      'NumberOfDimensions': '1',
+                                                      'NumberOfElements': '1'}})
+            cast = f'({counter_type})'
+            expression = (f'{trigger_name} = ({counter_name} - ({counter_name} / {cast}{every})'
+                          f' * {cast}{every}) == {cast}0;')
+            decimation_gam = ExpressionGAM(f'+LogDecimation{every}', [copySignal(counter)],
+                                           [trigger], expression)
+            to_writer = ('Trigger', copySignal(trigger[1]))
+            setDatasource(to_writer, getname(writer))
+            to_log = IOGAM(f'+{getname(self.loggingintoio)}{every}',
+                           [copySignal(trigger)] +
+                           [self.loggingintoio.input_signals[index] for index in indices],
+                           [to_writer] +
+                           [self.loggingintoio.output_signals[index] for index in indices])
+            for signal in to_log.output_signals[1:]:
+                setDatasource(signal, getname(writer))
+            writer.input_signals = [copySignal(to_writer)] + \
+                [self.filewriter.input_signals[index] for index in indices]
+            removeKeysFromConfig(writer.input_signals[0], ['DataSource'])
+            writers.append((writer, every))
+            self.additional_datasources += [writer]
+            self.iogams += [decimation_gam, to_log]
+            for state in self.states:
+                if len(state.threads.objects) > 0:
+                    state.threads.objects[0].functions += [decimation_gam, to_log]
+        self.loggingintoio.input_signals = [signal for index, signal in
+                                            enumerate(self.loggingintoio.input_signals)
+                                            if index not in decimated]
+        self.loggingintoio.output_signals = [signal for index, signal in
+                                             enumerate(self.loggingintoio.output_signals)
+                                             if index not in decimated]
+        self.filewriter.input_signals = [signal for index, signal in
+                                         enumerate(self.filewriter.input_signals)
+                                         if index not in decimated]
+        if not self.filewriter.input_signals:
+            # Every signal is decimated
+            self.additional_datasources.remove(self.filewriter)
+        return writers
+
+    def _configureLogWriters(self, options: LogOptions, writers: list):
+        ''' Set the file format and number of buffers of the FileWriters of the log, given
+        with every how many cycles they store '''
+        frequency = float(self.config.get('timefrequency', 1000))
+        for writer, every in writers:
+            writer.fileformat = options.fileformat
+            if options.fileformat == 'binary' and writer.filename and \
+                writer.filename.endswith('.csv'):
+                writer.filename = writer.filename[:-len('.csv')] + '.bin'
+            if options.numberofbuffers is not None:
+                writer.numberofbuffers = options.numberofbuffers
+                continue
+            row_bytes = sum(type_sizes.get(getKeyAttribute(signal, 'Type'), 8) *
+                            int(signal[1]['MARTeConfig'].get('NumberOfElements', 1))
+                            for signal in writer.input_signals)
+            writer.numberofbuffers = max(1, min(math.ceil(LOG_BUFFER_SECONDS * frequency / every),
+                                                LOG_BUFFER_BYTES // max(row_bytes, 1)))
 
     def writeToConfig(self, out=None):
-        ''' Write our application out and return as a string '''
+        ''' Write our application out and return as a string. Given a FileConfigWriter or
+        an open text file the configuration is instead streamed to the file and None
+        returned. '''
         # Fix any breaks in the config automatically
         self.sanitize()
         self.removeUnused()
         if not out:
             out = marteconfig.StringConfigWriter()
+        elif hasattr(out, 'write') and not isinstance(out, marteconfig.ConfigWriter):
+            out = marteconfig.FileConfigWriter(out)
 
         for piece in self.externals:
             if piece:
@@ -652,6 +826,9 @@ signal/alias: {string} in datasource {datasource_name}"""))
 
         out.endSection(f'${self.app_name.replace("$","")}')
 
+        if isinstance(out, marteconfig.FileConfigWriter):
+            out.flush()
+            return None
         return str(out) + "\n"
 
     def _removeDuplicateLines(self, text: str) -> str:
@@ -735,32 +912,84 @@ def getApplication():
 
         return str_header + str_content
 
+    @staticmethod
+    def _signalDatasources(function):
+        ''' Return the DataSource of each input and each output signal of a function '''
+        return (tuple(signal[1]['MARTeConfig'].get('DataSource') for
+                      signal in function.input_signals),
+                tuple(signal[1]['MARTeConfig'].get('DataSource') for
+                      signal in function.output_signals))
+
+    def _structure(self):
+        ''' Identify the functions of each thread, their names and the DataSources of their
+        signals, this changes whenever functions or signals are added, removed, replaced,
+        renamed or moved to another DataSource, even in place '''
+        return tuple((id(function), function.configuration_name,
+                      self._signalDatasources(function))
+                     for state in self.states for thread in state.threads.objects
+                     for function in thread.functions)
+
     def sanitize(self):
-        ''' Resanitize an application between its state, 
+        ''' Resanitize an application between its state,
         threads functions and it's functions definitions.'''
-        self.functions = []
+        structure = self._structure()
+        if (self._sanitized is not None and not self._dirty and
+            self._sanitized[0] is self.functions and
+            self._sanitized[1:] == (len(self.functions), structure)):
+            # Nothing changed since the functions were last gathered
+            return
+        functions = self.NonDuplicatingList()
         for state in self.states:
             for thread in state.threads.objects:
-                for function in thread.functions:
-                    if function not in self.functions: # Avoid duplications
-                        self.functions.append(function)
-
-
-    def removeUnused(self):
+                # Avoid duplications
+                functions += thread.functions
+        self.functions = functions
+        self._sanitized = (functions, len(functions), structure)
+
+    def _datasourceUsage(self):
+        ''' Return the names of the datasources each function reads from and writes to,
+        only building the sets again for functions whose signals' DataSources changed '''
+        usage = {}
+        for function in self.functions:
+            key = id(function)
+            signature = self._signalDatasources(function)
+            cached = self._usage.get(key)
+            if cached is None or cached[0] is not function or cached[1] != signature or \
+                key in self._dirty:
+                cached = (function, signature, set(signature[0]), set(signature[1]))
+            usage[key] = cached
+        self._usage = usage
+        return usage.values()
+
+    def _datasourcesKey(self):
+        ''' Identify the datasources of the application and their names '''
+        return tuple((id(datasource), datasource.configuration_name)
+                     for datasource in self.additional_datasources)
+
+    def removeUnused(self): # pylint:disable=R0912
         ''' Removes empty and unused objects such as:
         - An IOGAM with no inputs or outputs
         - An Async bridge with no IOGAMs writing to it or from it
-        - A GAM DataSource with no signals defined throughout the application into it. '''
+        - A GAM DataSource with no signals defined throughout the application into it.
+
+        When nothing was removed the last time and nothing changed since, there is nothing to
+        check again. '''
         self.sanitize()
+        if self._clean is not None and not self._dirty and \
+            self._clean == (self._sanitized, self._datasourcesKey()):
+            return
+        removed = False
+        written = set()
+        for _, _, _, outputs in self._datasourceUsage():
+            written |= outputs
         # If a GAM Datasource has no values assigned to it - we should remove it
         gam_sources = [(a.configuration_name.lstrip('+'), a) for
                        a in self.additional_datasources if isinstance(a, GAMDataSource)]
         for datasource, gam_object in gam_sources:
-            if not any(any(output_signal[1]['MARTeConfig']['DataSource'] == datasource for
-                           output_signal in function.output_signals) for
-                           function in self.functions):
+            if datasource not in written:
                 # We need to remove this
                 self.additional_datasources.remove(gam_object)
+                removed = True
 
         # If an IOGAM has no inputs/outputs, it should be removed,
         # if it has no inputs, sanity is all but lost:
@@ -772,18 +1001,23 @@ def getApplication():
                     for state in self.states:
                         for thread in state.threads.objects:
                             thread.functions = [a for a in thread.functions if not a == function]
+                    removed = True
 
-        self.sanitize()
+        if removed:
+            self.sanitize()
 
         # As above, if an async bridge exists without any
         # reading/writing signals the heap allocation will fail
+        used = set()
+        for _, _, inputs, outputs in self._datasourceUsage():
+            used |= inputs | outputs
         asyncbridges = [a for a in self.additional_datasources if isinstance(a, AsyncBridge)]
         for bridge in asyncbridges:
-            if not any(any(input_signal[1]['MARTeConfig']['DataSource'] == getname(bridge) for
-                           input_signal in function.input_signals) for
-                           function in self.functions) and not any(
-                any(output_signal[1]['MARTeConfig']['DataSource'] == getname(bridge) for
-                    output_signal in function.output_signals) for function in self.functions):
-
+            if getname(bridge) not in used:
                 # Remove the bridge as it is unused
                 self.additional_datasources.remove(bridge)
+                removed = True
+
+        self._dirty = set()
+        # Only a pass which removed nothing is certain to remove nothing when repeated
+        self._clean = None if removed else (self._sanitized, self._datasourcesKey())
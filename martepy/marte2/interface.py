@@ -49,24 +49,16 @@ class MARTe2Interface(MARTe2ConfigObject):
 
     def writeSignals(self, defs, config_writer): # pylint: disable=W0237, W0221
         """Use MARTe1ConfigObject.writeSignals but remove any Interfaces."""
-        super().writeSignals([(
-                n,
-                dict(d, **{'MARTeConfig': {
-                        k: v for k, v in d['MARTeConfig'].items() if
-                        k not in ('DataSource','Alias')
-                    }})
-            ) for n, d in defs], config_writer)
+        super().writeSignals(defs, config_writer, exclude=('DataSource', 'Alias'))
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            myself = copy.deepcopy(self.serialize())
-            theother = copy.deepcopy(other.serialize())
-            myself['id'] = 0
-            theother['id'] = 0
-            if myself == theother:
-                return True
+            return self.sameContent(other)
         return False
 
+    def __hash__(self):
+        return self.contentHash()
+
     def serialize(self):
         ''' Serialize the datasource '''
         res = super().serialize()
@@ -1,9 +1,6 @@
 ''' Pythonic representation of the TCP Message Proxy provided by padova '''
 
-from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QSpinBox, QPushButton
-)
+import importlib
 
 from martepy.marte2.interface import MARTe2Interface
 
@@ -57,48 +54,19 @@ class TCPMessageProxy(MARTe2Interface):
         return self
 
     def configure(self):
+        from martepy.marte2.interfaces.tcpmessageproxy_qt import PortDialog # pylint: disable=C0415
         dialog = PortDialog(current_port=self.port)
         if dialog.exec_() == dialog.Accepted:
             self.port = dialog.get_port()
 
+def __getattr__(name):
+    ''' The port dialog needs PyQt5 so lives in tcpmessageproxy_qt, it is imported from there
+    on first access '''
+    if name == 'PortDialog':
+        return importlib.import_module('martepy.marte2.interfaces.tcpmessageproxy_qt').PortDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def initialize(factory, plugin_datastore) -> None:
     ''' Initialize our object with the factory '''
     factory.registerBlock("TCPSocketMessageProxyExample", TCPMessageProxy, plugin_datastore)
     factory.registerBlock("TCPMessageProxy", TCPMessageProxy, plugin_datastore)
-
-class PortDialog(QDialog):
-    def __init__(self, current_port=None, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Set Port")
-        self.port = current_port if current_port is not None else 0
-        self._setup_ui()
-
-    def _setup_ui(self):
-        layout = QVBoxLayout(self)
-
-        # Label + numeric input
-        input_layout = QHBoxLayout()
-        label = QLabel("Port:")
-        self.port_input = QSpinBox()
-        self.port_input.setRange(1, 65535)
-        self.port_input.setValue(self.port)
-
-        input_layout.addWidget(label)
-        input_layout.addWidget(self.port_input)
-        layout.addLayout(input_layout)
-
-        # OK / Cancel buttons
-        button_layout = QHBoxLayout()
-        ok_btn = QPushButton("OK")
-        cancel_btn = QPushButton("Cancel")
-
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn.clicked.connect(self.reject)
-
-        button_layout.addWidget(ok_btn)
-        button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
-
-    def get_port(self):
-        """Return the port chosen by the user."""
-        return self.port_input.value()
\ No newline at end of file
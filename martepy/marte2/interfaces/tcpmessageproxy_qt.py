@@ -0,0 +1,41 @@
+''' Port selection dialog used by the TCPMessageProxy in the GUI '''
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QPushButton
+
+
+class PortDialog(QDialog):
+    def __init__(self, current_port=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Set Port")
+        self.port = current_port if current_port is not None else 0
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Label + numeric input
+        input_layout = QHBoxLayout()
+        label = QLabel("Port:")
+        self.port_input = QSpinBox()
+        self.port_input.setRange(1, 65535)
+        self.port_input.setValue(self.port)
+
+        input_layout.addWidget(label)
+        input_layout.addWidget(self.port_input)
+        layout.addLayout(input_layout)
+
+        # OK / Cancel buttons
+        button_layout = QHBoxLayout()
+        ok_btn = QPushButton("OK")
+        cancel_btn = QPushButton("Cancel")
+
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+
+        button_layout.addWidget(ok_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+
+    def get_port(self):
+        """Return the port chosen by the user."""
+        return self.port_input.value()
@@ -96,6 +96,18 @@ class MARTe2Message(MARTe2ConfigObject):
         self.mode = data["mode"]
         return self
 
+def genNextStateMsgs(state_name, app_name):
+    ''' Generate a set of messages based on the state name and application name '''
+    params = MARTe2ConfigurationDatabase(objects = {"param1": state_name})
+    prepare = MARTe2Message(f"+PrepareChangeTo{state_name}Msg", app_name,
+                            "PrepareNextState", params)
+    defaultmessages = [MARTe2Message("+StopCurrentStateExecutionMsg",
+                                     app_name, "StopCurrentStateExecution"),
+                        prepare,
+                        MARTe2Message("+StartNextStateExecutionMsg",
+                                      app_name, "StartNextStateExecution")]
+    return defaultmessages
+
 def initialize(factory, plugin_datastore) -> None:
     ''' Register us with the factory '''
     factory.registerBlock("Message", MARTe2Message, plugin_datastore)
@@ -1,19 +1,7 @@
 ''' Pythonic representation of the Thread object '''
 
 from martepy.marte2.config_object import MARTe2ConfigObject
-from martepy.functions.extra_functions import getname
-
-class NonDuplicatingList(list):
-    ''' Ensure our list is non duplicating '''
-    def append(self, item):
-        ''' Ensure the append is not appending again '''
-        if not any(item == list_item for list_item in self):
-            super().append(item)
-
-    def __iadd__(self, other):
-        for item in other:
-            self.append(item)
-        return self
+from martepy.functions.extra_functions import getname, NonDuplicatingList
 
 class MARTe2RealTimeThread(MARTe2ConfigObject):
     """Object for configuring RealTimeThreads for MARTe2 applications"""
@@ -0,0 +1,142 @@
+"""An opt-in on-disk cache of read applications, so that reading an unchanged cfg again
+loads the previously interpreted result instead of parsing it.
+
+Entries are keyed by a hash of the cfg text, the martepy version, the sources of the reader
+and parser and the tree building function used, and are evicted least recently used first
+once the cache exceeds its size.
+Entries are pickles so the cache directory should only be writable by its user.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+
+# The installed martepy version, looked up on first use as importing metadata is slow
+VERSION = None
+# The hash of SOURCES, which change what is read from a cfg even where VERSION does not
+# such as in a source checkout, computed on first use
+SOURCES_DIGEST = None
+SOURCES = tuple(os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+                for name in ('reader.py', 'parser.py'))
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'martepy')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+def martepyVersion():
+    ''' Return the installed martepy version, or unknown when not installed '''
+    global VERSION # pylint: disable=W0603
+    if VERSION is None:
+        from importlib import metadata # pylint: disable=C0415
+        try:
+            VERSION = metadata.version('martepy')
+        except metadata.PackageNotFoundError:
+            VERSION = 'unknown'
+    return VERSION
+
+def sourcesDigest():
+    ''' Return the hash of the reader and parser sources '''
+    global SOURCES_DIGEST # pylint: disable=W0603
+    if SOURCES_DIGEST is None:
+        digest = hashlib.sha256()
+        for path in SOURCES:
+            with open(path, 'rb') as file:
+                digest.update(file.read())
+        SOURCES_DIGEST = digest.hexdigest()
+    return SOURCES_DIGEST
+
+class ParseCache:
+    ''' A size bounded least recently used cache of read applications stored in directory,
+    pass it to readApplication or readApplicationText as cache to use it. '''
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, content, read_func):
+        ''' The key of the entry for the cfg text read with read_func '''
+        name = getattr(read_func, '__qualname__', type(read_func).__qualname__)
+        digest = hashlib.sha256()
+        digest.update(f'{martepyVersion()}\0{sourcesDigest()}\0{read_func.__module__}.{name}\0'
+                      .encode('utf-8'))
+        digest.update(content.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        ''' The file an entry is stored in '''
+        return os.path.join(self.directory, f'{key}.pickle')
+
+    def get(self, key):
+        ''' Return the cached result for key or None, marking it as recently used '''
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                result = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception: # pylint: disable=W0718
+            # Unreadable or written by an incompatible version, it is read again instead
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key, result):
+        ''' Store the result for key, then evict the least recently used entries until the
+        cache fits within max_bytes. A result which cannot be pickled or written is not
+        cached. '''
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Written to a temporary file first so readers never see a partial entry
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except (pickle.PicklingError, TypeError, AttributeError, OSError):
+            self._remove(temp_path)
+            return
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        self.evict()
+
+    def entries(self):
+        ''' Return (last used time, size, path) for each entry, least recently used first '''
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith('.pickle'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self):
+        ''' Remove the least recently used entries until the cache fits within max_bytes '''
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        ''' Remove every entry from the cache '''
+        if os.path.isdir(self.directory):
+            for _, _, path in self.entries():
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        ''' Remove a file, ignoring it having already gone '''
+        try:
+            os.remove(path)
+        except OSError:
+            pass
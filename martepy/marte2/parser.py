@@ -0,0 +1,564 @@
+"""A single pass tokenizing parser for MARTe2 cfg text. It scans the content once into
+tokens and builds the same TreeNode tree that the reader interprets, handling values
+and braces on the same line, comments inside quoted strings and { ... } vectors.
+"""
+import re
+from itertools import chain, islice
+from sys import intern
+
+# Parameter values up to this length are interned by CompactTreeNode
+INTERN_LENGTH = 32
+
+class _Node:
+    ''' Methods shared by the tree node classes, holding no attributes of its own '''
+    __slots__ = ()
+    name: str
+    parameters: dict
+    children: list
+
+    def addParameter(self, key, value):
+        ''' Add a parameter to the config item '''
+        self.parameters[key] = value
+
+    def addChild(self, child):
+        ''' Add a child to the config tree item '''
+        self.children.append(child)
+
+    def getChild(self, name):
+        ''' Return the first child with the given name or None '''
+        for child in self.children:
+            if child.name == name:
+                return child
+        return None
+
+    def getChildByClass(self, class_name):
+        ''' Return the first child whose Class parameter matches or None '''
+        for child in self.children:
+            if child.parameters.get('Class') == class_name:
+                return child
+        return None
+
+    def _lines(self, indent, lines):
+        ''' Append the lines of this node and its children to lines '''
+        lines.append(f"{indent}{self.name}\n")
+        inner = indent + "\t"
+        for key, value in self.parameters.items():
+            lines.append(f"{inner}{key} = {value}\n")
+        for child in self.children:
+            child._lines(inner, lines) # pylint: disable=W0212
+
+    def __str__(self, level=0):
+        ''' Display the item details as a string as it would in the cfg '''
+        lines = []
+        self._lines("\t" * level, lines)
+        return ''.join(lines)
+
+
+class TreeNode(_Node):
+    ''' Node which represents an item in the configuration for navigating the tree '''
+    def __init__(self, name, parent = None):
+        self.name = name
+        self.parameters = {}
+        self.children = []
+        self.parent = parent
+
+
+class ChildList(list):
+    ''' The children of a CompactTreeNode, holding the indexes of them by name and by class.
+    These are built on the first lookup and dropped by any change to the list. '''
+    # Not set by __init__, which would make creating one slower than a list, CompactTreeNode
+    # sets them to None
+    __slots__ = ('names', 'classes')
+
+    def byName(self):
+        ''' Return the first child of each name '''
+        if getattr(self, 'names', None) is None:
+            self.names = {}
+            for child in reversed(self):
+                self.names[child.name] = child
+        return self.names
+
+    def byClass(self):
+        ''' Return the first child of each Class parameter '''
+        if getattr(self, 'classes', None) is None:
+            self.classes = {}
+            for child in reversed(self):
+                self.classes[child.parameters.get('Class')] = child
+        return self.classes
+
+
+def _dropsIndexes(method):
+    ''' Wrap a list method changing the list so that it drops the indexes '''
+    def changed(self, *args, **kwargs):
+        self.names = None
+        self.classes = None
+        return method(self, *args, **kwargs)
+    changed.__name__ = method.__name__
+    changed.__doc__ = method.__doc__
+    return changed
+
+for _method in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+                'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(ChildList, _method, _dropsIndexes(getattr(list, _method)))
+
+
+class CompactTreeNode(_Node):
+    ''' A TreeNode using slots for large configurations, parameter keys and short values are
+    interned so the many repeats of Type, DataSource, float64 and so on share one string.
+    Children are looked up through the name and class indexes of its ChildList, which are
+    rebuilt after children is changed or replaced. The ChildList is only created once
+    needed, so that the many signals without children hold one object less for the garbage
+    collector to go through. '''
+    __slots__ = ('name', 'parameters', '_children', 'parent')
+
+    def __init__(self, name, parent = None):
+        self.name = name
+        self.parameters = {}
+        self._children = None
+        self.parent = parent
+
+    @property
+    def children(self):
+        ''' The child nodes, in order '''
+        children = self._children
+        if children is None:
+            children = self._children = ChildList()
+            children.names = children.classes = None
+        return children
+
+    @children.setter
+    def children(self, children):
+        if not isinstance(children, ChildList):
+            children = ChildList(children)
+        children.names = children.classes = None
+        self._children = children
+
+    def addParameter(self, key, value):
+        ''' Add a parameter to the config item, interning the key and short values '''
+        if len(value) <= INTERN_LENGTH:
+            value = intern(value)
+        self.parameters[intern(key)] = value
+
+    def addChild(self, child):
+        ''' Add a child to the config tree item, extending its name index if built '''
+        children = self._children
+        if children is None:
+            children = self.children
+        list.append(children, child)
+        if children.names is not None:
+            children.names.setdefault(child.name, child)
+        if children.classes is not None:
+            children.classes = None
+
+    def getChild(self, name):
+        ''' Return the first child with the given name or None '''
+        children = self._children
+        return None if children is None else children.byName().get(name)
+
+    def getChildByClass(self, class_name):
+        ''' Return the first child whose Class parameter matches or None '''
+        children = self._children
+        return None if children is None else children.byClass().get(class_name)
+
+
+class ConfigParseError(ValueError):
+    ''' Exception raised when the cfg text cannot be tokenized or parsed '''
+    def __init__(self, msg, line=0):
+        super().__init__(f'{msg} (line {line})')
+        self.line = line
+
+
+# Characters read from the file at a time by streamTree
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Characters split into lines at a time by parseTree, rather than holding a list of every
+# line which the garbage collector would go through each time it runs while parsing
+LINES_CHUNK_SIZE = 1 << 16
+# Lines remembered by parseTree as read, most lines of a configuration repeat many times
+LINES_READ_SIZE = 4096
+
+_SKIP = r'\s*(?:(?://[^\n]*|/\*.*?\*/)\s*)*'
+_WORD = r'[^\s{}="/]+(?:/(?![/*])[^\s{}="/]*)*'
+# A brace group closed on the same line without any assignment inside, e.g. { 1 2 3 }
+_GROUP = r'\{[^\n{}"=]*(?:\{[^\n{}"=]*\}[^\n{}"=]*)*\}'
+# A bare value is the run of words and brace groups up to the end of the line, an
+# unmatched brace, a comment or the next "name =" on the same line, e.g.
+# "(float64) 0.005" and "(float32) { 0.1, 0.2 }" are each a single value
+_BARE = rf'(?:{_WORD}|{_GROUP})(?:[ \t]+(?:{_GROUP}|{_WORD}(?![^\s{{}}="/]|[ \t]*=)))*'
+
+# Every match is one token made of the groups:
+# (name, bare value, string value, block opening brace, vector opening brace, other)
+# where an assignment such as "Type = uint32" is a single token, so most lines of a cfg
+# produce exactly one token, and other holds any brace, word or string on its own.
+# The last match holds no token, it takes the whitespace and comments left at the end
+# which would otherwise be searched again from within a comment.
+_TOKEN_RE = re.compile(rf'''{_SKIP}(?:
+    ({_WORD})[ \t]*=(?:
+        [ \t]*({_BARE})
+        |\s*("[^"]*")
+        |\s*(\{{)(?={_SKIP}(?:{_WORD}[ \t]*=|\}}))
+        |\s*(\{{)
+        |)
+    |(\}}|\{{|{_WORD}|"[^"]*"|\S)
+    |\Z
+)''', re.VERBOSE | re.DOTALL)
+
+def tokenize(content):
+    ''' Scan the text once and return its tokens as tuples of
+    (name, bare value, string value, block opening brace, vector opening brace, other)
+    where only the fields relevant to the token are non-empty. Comments (// and /* */)
+    and whitespace are skipped and a // inside quotes stays part of the string. '''
+    tokens = _TOKEN_RE.findall(content)
+    while tokens and not any(tokens[-1]):
+        tokens.pop()
+    return tokens
+
+
+def _formatString(text):
+    ''' Multi-line strings have their continuation lines stripped of indentation so that
+    they read back the way they were written, a trailing literal \\n joins lines as the
+    original line based reader did. '''
+    if '\n' not in text:
+        return text
+    lines = text.split('\n')
+    result = lines[0]
+    for line in lines[1:]:
+        if result.endswith('\\n'):
+            result = result[:-2] + '\n' + line.lstrip()
+        else:
+            result += '\n' + line.lstrip()
+    return result
+
+
+def _tokenLine(content, index):
+    ''' Return the line number of the token at the given index - only used for errors '''
+    for count, match in enumerate(_TOKEN_RE.finditer(content)):
+        if count == index:
+            return content.count('\n', 0, match.end()) + 1
+    return content.count('\n') + 1
+
+
+def _isName(text):
+    ''' Whether text is a name which needs no tokenizing, e.g. Type, +GAM1 or $App '''
+    return text.isidentifier() or (text[:1] in ('+', '$') and text[1:].isidentifier())
+
+
+def _isBareValue(text):
+    ''' Whether text is a bare value which needs no tokenizing, e.g. float64 or
+    (float64) 0.005, having no braces, quotes, slashes, equals or whitespace but spaces '''
+    return text.isalnum() or (text.isprintable() and '{' not in text and '}' not in text and
+                              '"' not in text and '=' not in text and '/' not in text)
+
+
+# What _readLine returns for a line to skip and for a closing brace
+_BLANK = ('', '')
+_CLOSE = ('}', '')
+
+def _readLine(line): # pylint: disable=R0911
+    ''' Return what a line holds if it can be read without tokenizing: _BLANK for an empty
+    or comment line, _CLOSE for a closing brace and (name, value) for an assignment, where
+    the value "{" opens a section or vector. Returns None for any other line. '''
+    parts = line.split(None, 2)
+    if len(parts) == 3 and parts[1] == '=' and line.isprintable():
+        # name = value separated by spaces only, the most common line by far
+        name, value = parts[0], parts[2]
+    elif not parts or parts[0][:2] == '//':
+        return _BLANK
+    elif parts[0] == '}' and (len(parts) == 1 or parts[1][:2] == '//'):
+        return _CLOSE
+    else:
+        name, equals, value = line.partition('=')
+        if not equals:
+            return None
+        name = name.strip(' \t')
+        value = value.lstrip(' \t')
+    if not (name.isidentifier() or _isName(name)):
+        return None
+    if value[:1] == '"':
+        end = value.find('"', 1)
+        rest = value[end + 1:].lstrip()
+        return (name, value[:end + 1]) if end > 0 and (not rest or rest[:2] == '//') else None
+    value = value.partition('//')[0].rstrip()
+    # An empty value is left to the tokenizer as it may be on the next line
+    if value == '{' or (value and _isBareValue(value)):
+        return (name, value)
+    return None
+
+
+def _chunks(content, size):
+    ''' Yield content in pieces of at least size characters split between lines '''
+    start = 0
+    while True:
+        end = content.find('\n', start + size)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+def _lineStart(content, start, lines):
+    ''' Return where the line the given number of lines after the one at start begins '''
+    for _ in range(lines):
+        start = content.index('\n', start) + 1
+    return start
+
+
+def parseTree(content, node_class=CompactTreeNode):
+    ''' Read a text content and parse it into TreeNode classes for later interpretation.
+    A drop in replacement for reader.buildTree giving the same tree as tokenizing the whole
+    content, where lines holding a single assignment, opening or closing brace are read
+    without tokenizing them. '''
+    builder = _TreeBuilder(node_class)
+    builder.feedLines(content)
+    return builder.finish()
+
+
+def streamTree(file, chunk_size=STREAM_CHUNK_SIZE, node_class=CompactTreeNode):
+    ''' Parse a cfg from a file object read in chunks of chunk_size characters, yielding
+    each top level object as soon as its closing brace is read instead of building the
+    whole tree. The objects are yielded as TreeNodes in the order they close, so children
+    come before their parents:
+
+    - every child of the +Functions and +Data sections of a RealTimeApplication
+    - the other sections of the application such as +States and +Scheduler
+    - +Functions and +Data themselves, holding only their own parameters
+    - every root level object such as the StateMachine or Http objects, and the
+      application itself holding only its own parameters
+
+    A yielded node is detached from its parent, its parent attribute is kept so that
+    node.parent.name tells where it came from. '''
+    builder = _TreeBuilder(node_class, streaming=True)
+    pending = ''
+    while True:
+        chunk = file.read(chunk_size)
+        text = pending + chunk
+        if not chunk:
+            builder.feed(text, tokenize(text))
+            builder.finish()
+            yield from builder.drain()
+            return
+        # Only whole lines are tokenized and the last token is held back as an opening
+        # brace or empty value may depend on what follows it
+        matches = list(_TOKEN_RE.finditer(text, 0, text.rfind('\n') + 1))
+        while matches and matches[-1].lastindex is None:
+            matches.pop()
+        keep = len(matches) - 1
+        for index, match in enumerate(matches):
+            if match.group(6) in ('"', '/'):
+                # A string or comment continuing beyond the chunk, wait for the rest
+                keep = index
+                break
+        if 0 < keep and not any(matches[keep - 1].groups()[1:]):
+            # Its name if the value of the previous token has been cut off
+            keep -= 1
+        if keep <= 0:
+            pending = text
+            continue
+        end = matches[keep - 1].end()
+        builder.feed(text[:end], [match.groups() for match in matches[:keep]])
+        pending = text[end:]
+        yield from builder.drain()
+
+
+def _isStreamed(node, level):
+    ''' Whether streamTree yields the node given its level below the root '''
+    if level == 1:
+        return True
+    parent = node.parent
+    if level == 2:
+        return parent.parameters.get('Class') == 'RealTimeApplication'
+    return (level == 3 and parent.name in ('+Functions', '+Data') and
+            parent.parent.parameters.get('Class') == 'RealTimeApplication')
+
+
+class _TreeBuilder: # pylint: disable=R0902
+    ''' Builds the tree from tokens, the content can be fed in several pieces as long as
+    each piece ends between tokens. When streaming, nodes to be yielded by streamTree are
+    detached from the tree as they close and kept until drained. '''
+    def __init__(self, node_class, streaming=False):
+        self.node_class = node_class
+        self.root = node_class('root')
+        self.current_node = self.root
+        self.level = 0
+        # A vector spread over several lines is collected here until its closing brace
+        self.vector = None
+        self.vector_name = ''
+        self.depth = 0
+        # The line number the next piece of content starts on
+        self.line = 1
+        self.closed = [] if streaming else None
+
+    def drain(self):
+        ''' Return and forget the nodes detached since the last call '''
+        closed, self.closed = self.closed, []
+        return closed
+
+    def _close(self, node, level):
+        ''' Detach a node which just closed if it is to be streamed '''
+        if level < 4 and _isStreamed(node, level):
+            node.parent.children.pop()
+            self.closed.append(node)
+
+    def feed(self, content, tokens): # pylint: disable=R0912,R0914
+        ''' Add the tokens of the next piece of content to the tree '''
+        node_class, root, closed = self.node_class, self.root, self.closed
+        current_node, level = self.current_node, self.level
+        vector, vector_name, depth = self.vector, self.vector_name, self.depth
+        for index, (name, bare, string, block, vector_open, other) in enumerate(tokens):
+            if vector is not None:
+                if other == '}':
+                    vector.append('}')
+                    depth -= 1
+                    if depth == 0:
+                        current_node.addParameter(vector_name, ' '.join(vector))
+                        vector = None
+                elif other == '{':
+                    vector.append('{')
+                    depth += 1
+                elif other:
+                    vector.append(_formatString(other))
+                else:
+                    raise ConfigParseError('Unexpected assignment inside vector',
+                                           self._line(content, index))
+            elif bare:
+                if bare[0] == '{' and name[0] in ('+', '$'):
+                    # An empty object written on one line, e.g. +Empty = {}
+                    current_node.addChild(node_class(name, current_node))
+                    if closed is not None:
+                        self._close(current_node.children[-1], level + 1)
+                else:
+                    current_node.addParameter(name, bare)
+            elif block:
+                new_node = node_class(name, current_node)
+                current_node.addChild(new_node)
+                current_node = new_node
+                level += 1
+            elif other == '}':
+                if current_node is root:
+                    raise ConfigParseError('Unmatched "}"', self._line(content, index))
+                if closed is not None:
+                    self._close(current_node, level)
+                current_node = current_node.parent
+                level -= 1
+            elif string:
+                current_node.addParameter(name, _formatString(string))
+            elif vector_open:
+                vector, vector_name, depth = ['{'], name, 1
+            elif name:
+                # Nothing was given after the equals on this line
+                current_node.addParameter(name, '')
+            else:
+                raise ConfigParseError(f'Expected "name = value" at {other!r}',
+                                       self._line(content, index))
+        self.current_node, self.level = current_node, level
+        self.vector, self.vector_name, self.depth = vector, vector_name, depth
+        self.line += content.count('\n')
+
+    def feedLines(self, content): # pylint: disable=R0912,R0914,R0915
+        ''' Add the whole content to the tree, reading the lines which hold one assignment,
+        one opening brace of a section or one closing brace directly, see _readLine. From any
+        other line the content is tokenized until the end of a line is reached outside of
+        any vector. '''
+        root, closed = self.root, self.closed
+        current_node, level = self.current_node, self.level
+        numbered = enumerate(chain.from_iterable(
+            chunk.split('\n') for chunk in _chunks(content, LINES_CHUNK_SIZE)))
+        # What each line read holds, most lines of a configuration repeat many times
+        lines_read = {}
+        # A line and where it starts in content, from which later lines are found
+        known_index = known_start = 0
+        # "name = {" is a section when the next line starts with an assignment or a closing
+        # brace, as the tokenizer looks ahead for, until then its name and line are kept
+        opening = opening_index = None
+        for index, line in numbered:
+            read = lines_read.get(line)
+            if read is None:
+                read = _readLine(line)
+                if read is not None:
+                    if len(lines_read) >= LINES_READ_SIZE:
+                        lines_read.clear()
+                    lines_read[line] = read
+            if read is _BLANK:
+                continue
+            if read is _CLOSE:
+                if opening is not None:
+                    current_node = self._open(current_node, opening)
+                    opening = None
+                elif current_node is root:
+                    raise ConfigParseError('Unmatched "}"', index + 1)
+                else:
+                    level -= 1
+                if closed is not None:
+                    self._close(current_node, level + 1)
+                current_node = current_node.parent
+                continue
+            if read is not None:
+                name, value = read
+                if opening is not None:
+                    current_node = self._open(current_node, opening)
+                    level += 1
+                    opening = None
+                if value == '{':
+                    opening, opening_index = name, index
+                else:
+                    current_node.addParameter(name, value)
+                continue
+            # Tokenize from this line, or the opening brace before it, until a token ends
+            # this line or a later one outside of any vector
+            first = index if opening is None else opening_index
+            start = _lineStart(content, known_start, first - known_index)
+            line_start = _lineStart(content, start, index - first)
+            self.line, opening = first + 1, None
+            self.current_node, self.level = current_node, level
+            line_end = self._feedTokens(content, start, line_start)
+            current_node, level = self.current_node, self.level
+            if line_end < 0:
+                break
+            known_index, known_start = self.line, line_end + 1
+            # Skip the lines which have been tokenized
+            next(islice(numbered, known_index - index - 1, known_index - index - 1), None)
+        if opening is not None:
+            self.current_node, self.level = current_node, level
+            self.line = opening_index + 1
+            self._feedTokens(content, _lineStart(content, known_start,
+                                                 opening_index - known_index), len(content))
+            current_node, level = self.current_node, self.level
+        self.current_node, self.level = current_node, level
+        self.line = content.count('\n') + 1
+
+    def _open(self, parent, name):
+        ''' Add a section to parent and return it '''
+        node = self.node_class(name, parent)
+        parent.addChild(node)
+        return node
+
+    def _feedTokens(self, content, start, after):
+        ''' Feed the tokens of content from start on until one ends a line outside of any
+        vector, and past after, returning where that line ends or -1 at the end of content '''
+        position = start
+        for match in _TOKEN_RE.finditer(content, start):
+            if match.lastindex is None:
+                break
+            end = match.end()
+            self.feed(content[position:end], [match.groups()])
+            position = end
+            line_end = content.find('\n', end)
+            if line_end >= after and self.vector is None:
+                rest = content[end:line_end].lstrip()
+                if not rest or rest[:2] == '//':
+                    return line_end
+        return -1
+
+    def _line(self, content, index):
+        ''' The line number of the token at index in the piece of content being fed '''
+        return self.line - 1 + _tokenLine(content, index)
+
+    def finish(self):
+        ''' Check the content ended outside of any section or vector and return the root '''
+        if self.vector is not None:
+            raise ConfigParseError(f'Unterminated vector {self.vector_name!r}', self.line)
+        if self.current_node is not self.root:
+            raise ConfigParseError(f'Unterminated section {self.current_node.name!r}',
+                                   self.line)
+        return self.root
@@ -15,9 +15,10 @@ from PyQt5.QtWidgets import (QComboBox,
                              QSizePolicy,
                              QWidget,
                              QTextEdit)
-from martepy.marte2.objects.configuration_database import MARTe2ConfigurationDatabase
-from martepy.marte2.objects.message import MARTe2Message
+from martepy.marte2.objects.message import genNextStateMsgs # pylint: disable=W0611
 from martepy.marte2.signal_names_wdw import SignalWdw
+from martepy.functions.extra_functions import (generateUniqueName, # pylint: disable=W0611
+                                               generateUniqueGamName)
 
 
 def textChangeOut(wdgt, node, default, epics, type_input, datasource=None, # pylint: disable=R0914
@@ -383,42 +384,6 @@ def recursivelySetEnabled(layout, enable):
         elif isinstance(item.widget(), QWidget):
             item.widget().setEnabled(enable)
 
-def generateUniqueName(existing_names, base_name):
-    """Generate a unique name based on the existing names in the list.
-    """
-    if base_name not in existing_names:
-        return base_name
-
-    i = 1
-    while True:
-        new_name = f"{base_name}{i}"
-        if new_name not in existing_names:
-            return new_name
-        i += 1
-
-def generateUniqueGamName(existing_names):
-    """Generate a unique name based on the existing names in the list.
-    """
-    i = 1
-    while True:
-        new_name = f"DDB{i}"
-        if new_name not in existing_names:
-            return new_name
-        i += 1
-
-
-def genNextStateMsgs(state_name, app_name):
-    ''' Generate a set of messages based on the state name and application name '''
-    params = MARTe2ConfigurationDatabase(objects = {"param1": state_name})
-    prepare = MARTe2Message(f"+PrepareChangeTo{state_name}Msg", app_name,
-                            "PrepareNextState", params)
-    defaultmessages = [MARTe2Message("+StopCurrentStateExecutionMsg",
-                                     app_name, "StopCurrentStateExecution"),
-                        prepare,
-                        MARTe2Message("+StartNextStateExecutionMsg",
-                                      app_name, "StartNextStateExecution")]
-    return defaultmessages
-
 def showErrorDialog(message):
     ''' Show an error dialog messagebox. '''
     msg_box = QMessageBox()
@@ -15,37 +15,14 @@ from martepy.marte2.objects.http.service import MARTe2HttpService
 from martepy.marte2.objects.real_time_state import MARTe2RealTimeState
 from martepy.marte2.objects.real_time_thread import MARTe2RealTimeThread
 from martepy.marte2.objects.gam_scheduler import MARTe2GAMScheduler
-from martepy.marte2.factory import Factory as mpyFactory
+from martepy.marte2.factory import Factory as mpyFactory, sharedFactory
 from martepy.marte2.objects.http.objectbrowser import MARTe2HTTPObjectBrowser
 from martepy.marte2.objects.configuration_database import MARTe2ConfigurationDatabase
-from martepy.marte2.qt_functions import genNextStateMsgs
+from martepy.marte2.objects.message import genNextStateMsgs
 from martepy.functions.extra_functions import getname
-
-class TreeNode:
-    ''' Node which represents an item in the configuration for navigating the tree '''
-    def __init__(self, name, parent = None):
-        self.name = name
-        self.parameters = {}
-        self.children = []
-        self.parent = parent
-
-    def addParameter(self, key, value):
-        ''' Add a parameter to the config item '''
-        self.parameters[key] = value
-
-    def addChild(self, child):
-        ''' Add a child to the config tree item '''
-        self.children.append(child)
-
-    def __str__(self, level=0):
-        ''' Display the item details as a string as it would in the cfg '''
-        result = "\t" * level + f"{self.name}\n"
-        for key, value in self.parameters.items():
-            result += "\t" * (level + 1) + f"{key} = {value}\n"
-        for child in self.children:
-            result += child.__str__(level + 1)
-        return result
-
+from martepy.marte2.parser import (TreeNode, parseTree, # pylint: disable=W0611
+                                   streamTree, STREAM_CHUNK_SIZE)
+from martepy.marte2.parse_cache import ParseCache # pylint: disable=W0611
 
 def parseFile(file_path):
     ''' Parse a cfg file given a path - wrapper around the parse text function '''
@@ -54,6 +31,13 @@ def parseFile(file_path):
     return content
 
 
+def streamFile(file_path, chunk_size=STREAM_CHUNK_SIZE):
+    ''' Yield the top level objects of a cfg file as TreeNodes while it is read in chunks,
+    without holding the whole text or tree in memory - see parser.streamTree '''
+    with open(file_path, 'r', encoding='utf-8') as file:
+        yield from streamTree(file, chunk_size)
+
+
 def buildTree(content): #pylint: disable=R0912
     ''' Read a text content and parse it into TreeNode classes for later interpretation '''
     root = TreeNode('root')
@@ -151,12 +135,13 @@ def grabParameters(child):
 def getSignals(function_def, formatter):
     ''' Given a cfg definition of a signal - return this into the signal format
     we universally use '''
-    return formatToSignal(next((a for a in function_def.children if a.name == formatter), None))
+    return formatToSignal(function_def.getChild(formatter))
 
-def readApplication(file_path, read_func=buildTree):
-    ''' Read an application given a file path - wrapper around the parse file function '''
+def readApplication(file_path, read_func=buildTree, cache=None, factory=None):
+    ''' Read an application given a file path - wrapper around the parse file function,
+    given a ParseCache an unchanged file is loaded from the cache without parsing '''
     file_content = parseFile(file_path)
-    return readApplicationText(file_content, read_func=read_func)
+    return readApplicationText(file_content, read_func=read_func, cache=cache, factory=factory)
 
 class UnrecognisedParameterException(Exception):
     ''' Exception that should be thrown when an unknown parameter in a tree occurs '''
@@ -217,22 +202,11 @@ def handleChildObjects(parent_obj, function, factory):
                     raise ValueError("Unknown child object to parent found in config")
 
 def getRootClass(tree_root, class_name):
-    ''' Iterator that returns the first node in a given tree with a matching class '''
-    for result in tree_root.children:
-        if hasattr(result, 'parameters'):
-            # Written this way to make more readable - initially was a one line list comprehension
-            if any(param == 'Class' for param in list(result.parameters)):
-                if result.parameters['Class'] == class_name:
-                    return result
-    # Nothing was found, return None like you would with next(({condition}), None)
-    return None
+    ''' Return the first node directly below tree_root with a matching class or None '''
+    return tree_root.getChildByClass(class_name)
 
-mfactory = mpyFactory()
-main_dir = os.path.abspath(os.path.dirname(__file__))
-mfactory.loadRemote(os.path.join(main_dir,"objects","objects.json"))
-mfactory.loadRemote(os.path.join(main_dir,"gams","gams.json"))
-mfactory.loadRemote(os.path.join(main_dir,"datasources","datasources.json"))
-mfactory.loadRemote(os.path.join(os.path.dirname(main_dir),"frameworks","end.json"))
+# Plugins registered here are only used by the reader, the shipped ones are shared
+mfactory = mpyFactory(parent=sharedFactory())
 
 def getSimulinkParameters(function):
     ''' Specifically for the SimulinkWrapperGAM, gets the parameters section '''
@@ -255,14 +229,15 @@ def getSimulinkParameters(function):
 
     return output_list
 
-def toFunctionObj(function):
+def toFunctionObj(function, factory=None):
     ''' Convert object to it's function class '''
+    factory = mfactory if factory is None else factory
     class_name = function.parameters['Class']
-    block_cls = mfactory.create(class_name)
+    block_cls = factory.create(class_name)
     input_signals = getSignals(function, "InputSignals")
     output_signals = getSignals(function, "OutputSignals")
     # Handle Parameters object for Simulink Wrapper GAM
-    matching_obj = next((obj for obj in function.children if obj.name == 'Parameters'), None)
+    matching_obj = function.getChild('Parameters')
     parameters = []
     if matching_obj:
         parameters = getSimulinkParameters(matching_obj)
@@ -274,20 +249,21 @@ def toFunctionObj(function):
             continue
         setattr(blk, parameter_name.lower(), parameter_value.replace('"',''))
     if not parameters:
-        handleChildObjects(blk, function, mfactory)
+        handleChildObjects(blk, function, factory)
     if parameters:
         blk.parameters = parameters
     return configuration_name, blk
 
-def toDataSourceObj(datasource):
+def toDataSourceObj(datasource, factory=None):
     ''' Convert object to it's datasource class '''
+    factory = mfactory if factory is None else factory
     configuration_name = datasource.name.lstrip('+')
     class_name = datasource.parameters['Class']
     signals = getSignals(datasource, "Signals")
     try:
-        blk_cls = mfactory.create(class_name)
+        blk_cls = factory.create(class_name)
     except ValueError:
-        blk_cls = mfactory.create(configuration_name)
+        blk_cls = factory.create(configuration_name)
     try:
         blk = blk_cls(configuration_name=configuration_name, output_signals=signals)
     except TypeError:
@@ -300,6 +276,14 @@ def toDataSourceObj(datasource):
         setattr(blk, param.lower(), value)
     return blk
 
+def getSection(application_definition, name):
+    ''' Return the named section of an application, raising ValueError if it has none '''
+    section = application_definition.getChild(name)
+    if section is None:
+        raise ValueError(f"RealTimeApplication {application_definition.name} has no {name} "
+                         "section")
+    return section
+
 def returnFromChildren(children, name):
     ''' Given a tree nodes children, return the named node or None '''
     for child in children:
@@ -307,15 +291,28 @@ def returnFromChildren(children, name):
             return child
     return None
 
-def readApplicationText(file_content, read_func=buildTree): # pylint: disable=R0914
+def readApplicationText(file_content, read_func=buildTree, cache=None, # pylint: disable=R0914
+                        factory=None):
     ''' Given text content, read this in and interpret it into the MARTe2
-    Pythonic class representations '''
+    Pythonic class representations, given a ParseCache the result is looked up in and
+    stored to it. Classes are created by factory, by default the reader's mfactory, pass
+    a Factory(parent=sharedFactory()) with further plugins registered to read them. The
+    cache is only used with the default factory, as what another creates is not in its key. '''
+    if cache is not None and factory in (None, mfactory):
+        key = cache.key(file_content, read_func)
+        result = cache.get(key)
+        if result is None:
+            result = readApplicationText(file_content, read_func=read_func, factory=factory)
+            cache.put(key, result)
+        return result
     app = MARTe2Application()
     tree_root = read_func(file_content)
     # The first set of objects should be anything root level and our application.
     # First let's find our application, we can worry about
     # root level objects later when we incorporate those
     application_definition = getRootClass(tree_root, 'RealTimeApplication')
+    if application_definition is None:
+        raise ValueError("No RealTimeApplication found in the configuration")
     app.app_name = application_definition.name.lstrip('$')
 
     # Okay now we have this, there will be four child sections:
@@ -325,17 +322,17 @@ def readApplicationText(file_content, read_func=buildTree): # pylint: disable=R0
     # - Scheduler
     function_map = {}
     # Now iterate our functions and interpret them based on our factory knowledge of them
-    for function in returnFromChildren(application_definition.children, '+Functions').children:
+    for function in getSection(application_definition, '+Functions').children:
         # There will always be a class parameter here
-        configuration_name, blk = toFunctionObj(function)
+        configuration_name, blk = toFunctionObj(function, factory)
         app.add(functions=[blk])
         function_map[configuration_name.strip('+')] = blk
 
     # Handle the datasource section
-    datasources = returnFromChildren(application_definition.children, '+Data')
+    datasources = getSection(application_definition, '+Data')
 
     for datasource in datasources.children:
-        blk = toDataSourceObj(datasource)
+        blk = toDataSourceObj(datasource, factory)
         app.add(additional_datasources=[blk])
 
     # Handle if we have a defined default DataSource
@@ -352,7 +349,7 @@ def readApplicationText(file_content, read_func=buildTree): # pylint: disable=R0
     getStates(application_definition, function_map, app)
     # And now the scheduler finally
 
-    scheduler = next(a for a in application_definition.children if a.name == '+Scheduler')
+    scheduler = getSection(application_definition, '+Scheduler')
     app.add(internals=[
         MARTe2GAMScheduler(configuration_name = scheduler.name,
                            timing_datasource_name=scheduler.parameters['TimingDataSource'],
@@ -377,7 +374,7 @@ def readApplicationText(file_content, read_func=buildTree): # pylint: disable=R0
 def getStates(application_definition, function_map, app):
     ''' Get an applications states definition '''
     # Now decipher the states
-    states = next(a for a in application_definition.children if a.name == '+States')
+    states = getSection(application_definition, '+States')
     for state in states.children:
         config_name = state.name
         threads = MARTe2ReferenceContainer('Threads', objects=[])
@@ -502,18 +499,18 @@ def createHttpBrowser(http_browser, http_messages):
     if http_browser is None:
         return None
     parent_browser = MARTe2HTTPObjectBrowser(http_browser.name,
-                                                http_browser.parameters['Root'],
+                                                http_browser.parameters['Root'].strip('"'),
                                                 objects=[])
     object_browser = getRootClass(http_browser, 'HttpObjectBrowser')
     if object_browser:
-        attributes = [object_browser.name, object_browser.parameters['Root']]
+        attributes = [object_browser.name, object_browser.parameters['Root'].strip('"')]
         parent_browser.objects += [MARTe2HTTPObjectBrowser(*attributes,
                                                             objects=[])]
         # This is the initial child version,
         # we're going to build the children objects first
     resources_html = getRootClass(http_browser, 'HttpDirectoryResource')
     if resources_html:
-        attributes = [resources_html.name, resources_html.parameters['BaseDir']]
+        attributes = [resources_html.name, resources_html.parameters['BaseDir'].strip('"')]
         parent_browser.objects += [MARTe2HttpDirectoryResource(*attributes)]
     message_interface = getRootClass(http_browser, 'HttpMessageInterface')
     if message_interface:
@@ -555,14 +552,10 @@ def toHttp(tree_root):
             found_http_browser = createHttpBrowser(http_browser, http_messages)
         # Now interpret the WebService
         if http_service:
-            attributes = [http_service.name,
-                          http_service.parameters['Port'],
-                          http_service.parameters['WebRoot'],
-                          http_service.parameters['Timeout'],
-                          http_service.parameters['ListenMaxConnections'],
-                          http_service.parameters['AcceptTimeout'],
-                          http_service.parameters['MaxNumberOfThreads'],
-                          http_service.parameters['MinNumberOfThreads']]
+            attributes = [http_service.name] + [
+                http_service.parameters[key].strip('"') for key in
+                ('Port', 'WebRoot', 'Timeout', 'ListenMaxConnections', 'AcceptTimeout',
+                 'MaxNumberOfThreads', 'MinNumberOfThreads')]
             found_http_service = MARTe2HttpService(*attributes)
     except AttributeError:
         http_browser = None # Will handle later on in the call stack upwards
@@ -0,0 +1,30 @@
+''' Helpers shared by the tests of MARTe2 FileWriter binary logs '''
+import random
+import struct
+
+from martepy.functions.bin2csv import RowInterpreter
+
+def writeBinary(path, signals, rows):
+    """ Write a MARTe2 FileWriter binary file of the signals and rows of values """
+    interpreter = RowInterpreter(*signals)
+    with open(path, 'wb') as binfile:
+        binfile.write(struct.pack('<I', len(signals)))
+        for signal in signals:
+            binfile.write(struct.pack('<H32sI', signal.type_descr.code,
+                                      signal.name.encode('utf-8'), signal.elements))
+        for row in rows:
+            binfile.write(struct.pack(interpreter.rowFormat(), *row))
+
+def randomValue(type_descr):
+    """ Return a random value of a MARTe2 type, including the edge cases of floats """
+    if type_descr.name.startswith('float'):
+        return random.choice([random.uniform(-1e6, 1e6), random.uniform(-1, 1) * 1e-30,
+                              random.uniform(-1, 1) * 1e30, 0.0, -0.0, 1.0, 0.1,
+                              float('inf'), float('-inf'), float('nan')])
+    if type_descr.name == 'char8':
+        # Printable characters, as line endings would be translated reading the CSV back
+        return bytes([random.choice([*range(32, 127), *range(160, 256)])])
+    bits = type_descr.size * 8
+    if type_descr.name.startswith('u'):
+        return random.randrange(2 ** bits)
+    return random.randrange(-2 ** (bits - 1), 2 ** (bits - 1))
@@ -1,8 +1,17 @@
 import pytest
 import os
 import csv
+import random
+import struct
+import gc
+import weakref
 
-from martepy.functions.bin2csv import Bin2CSV, Bin2CSVError
+import numpy as np
+
+from martepy.functions.bin2csv import (Bin2CSV, Bin2CSVError, BinaryLogFollower, RowInterpreter,
+                                       SignalDescriptor, StandardCSVRowInterpreter,
+                                       standard_type_descriptors, commandLine, loadBinaryLog)
+from .binary_logs import randomValue, writeBinary
 
 def test_bin2csv():
     input_path = os.path.join(os.path.abspath(os.path.dirname(__file__)),'output.bin')
@@ -31,7 +40,165 @@ def test_bin2csv():
         output_path = os.path.join(os.path.abspath(os.path.dirname(__file__)),'log2.csv')
         binmain = Bin2CSV(input_path,output_path, marte2_csv=False)
         binmain.main()
-    assert str(excinfo.value) == 'Reached EOF with partial row: 4 leftover bytes'
+    assert str(excinfo.value) == 'Reached EOF with partial row: 12 leftover bytes'
     # clean up
     os.remove(os.path.join(os.path.abspath(os.path.dirname(__file__)),'log0.csv'))
-    os.remove(os.path.join(os.path.abspath(os.path.dirname(__file__)),'log1.csv'))
\ No newline at end of file
+    os.remove(os.path.join(os.path.abspath(os.path.dirname(__file__)),'log1.csv'))
+
+def test_row_interpreter_types():
+    types = {type_descr.name: type_descr for type_descr in standard_type_descriptors.values()}
+    signals = [SignalDescriptor('Name', types['char8'], 3),
+               SignalDescriptor('Small', types['int16'], 1),
+               SignalDescriptor('Big', types['int64'], 2)]
+    interpreter = RowInterpreter(*signals)
+    assert interpreter.rowFormat() == '<3ch2q'
+    assert interpreter.rowSize() == 21
+    rows = [[b'a', b'b', b'\xe9', -300, -2 ** 62, 2 ** 40],
+            [b'x', b' ', b'z', 7, 0, -1]]
+    binary_data = b''.join(struct.pack(interpreter.rowFormat(), *row) for row in rows)
+    assert interpreter.binToValues(binary_data[:21]) == ('a', 'b', '\xe9', -300, -2 ** 62, 2 ** 40)
+    assert interpreter.binToCsvRows(binary_data) == \
+        '{a b \xe9},-300,{-4611686018427387904 1099511627776}\n{x   z},7,{0 -1}\n'
+    standard = StandardCSVRowInterpreter(*signals)
+    assert standard.binToCsvRows(binary_data) == ''.join(
+        standard.binToCsvRow(binary_data[start:start + 21]) for start in (0, 21))
+    assert interpreter.blockToCsvRows(np.frombuffer(binary_data, interpreter.rowDtype())) == \
+        interpreter.binToCsvRows(binary_data)
+
+    # Interpreters are not kept alive by caches of their methods
+    reference = weakref.ref(interpreter)
+    del interpreter
+    gc.collect()
+    assert reference() is None
+
+@pytest.mark.parametrize('marte2_csv', [True, False])
+def test_bin2csv_blocks(tmp_path, marte2_csv):
+    random.seed(5)
+    signals = [SignalDescriptor(f'S{type_descr.name}{elements}', type_descr, elements)
+               for type_descr in standard_type_descriptors.values() for elements in (1, 3)]
+    interpreter = Bin2CSV(marte2_csv=marte2_csv).interpreterClass()(*signals)
+    rows = [[randomValue(signal.type_descr) for signal in signals
+             for _ in range(signal.elements)] for _ in range(50)]
+    bin_path = str(tmp_path / 'log.bin')
+    writeBinary(bin_path, signals, rows)
+    expected = interpreter.headerRow() + ''.join(
+        interpreter.binToCsvRow(struct.pack(interpreter.rowFormat(), *row)) for row in rows)
+
+    for block_rows, workers in ((7, None), (50, None), (1000, None), (7, 2), (50, 3)):
+        csv_path = str(tmp_path / f'log{block_rows}_{workers}.csv')
+        Bin2CSV(bin_path, csv_path, marte2_csv, block_rows=block_rows, workers=workers).main()
+        with open(csv_path, 'r', encoding='utf-8') as csvfile:
+            assert csvfile.read() == expected
+
+    writeBinary(bin_path, signals, [])
+    Bin2CSV(bin_path, csv_path, marte2_csv).main()
+    with open(csv_path, 'r', encoding='utf-8') as csvfile:
+        assert csvfile.read() == interpreter.headerRow()
+
+def test_load_binary_log(tmp_path):
+    types = {type_descr.name: type_descr for type_descr in standard_type_descriptors.values()}
+    signals = [SignalDescriptor('Counter', types['uint32'], 1),
+               SignalDescriptor('Position', types['float64'], 3),
+               SignalDescriptor('Status', types['int8'], 1)]
+    rows = [[index, index * 0.5, -1.0, 2.0, index % 3 - 1] for index in range(100)]
+    bin_path = str(tmp_path / 'log.bin')
+    writeBinary(bin_path, signals, rows)
+
+    log = loadBinaryLog(bin_path)
+    assert isinstance(log, np.memmap)
+    assert log.dtype.names == ('Counter', 'Position', 'Status')
+    assert log.shape == (100,)
+    assert log['Position'].shape == (100, 3)
+    assert log['Counter'].tolist() == list(range(100))
+    assert log['Position'][10:12].tolist() == [[5.0, -1.0, 2.0], [5.5, -1.0, 2.0]]
+    assert log[-1]['Position'].tolist() == [49.5, -1.0, 2.0]
+    assert not log.flags.writeable
+
+    selected = loadBinaryLog(bin_path, ['Status', 'Counter'])
+    assert selected.dtype.names == ('Status', 'Counter')
+    assert selected[:3].tolist() == [(-1, 0), (0, 1), (1, 2)]
+    with pytest.raises(Bin2CSVError):
+        loadBinaryLog(bin_path, ['Missing'])
+
+    # A partial row being written is left out
+    with open(bin_path, 'ab') as binfile:
+        binfile.write(b'\x00' * 5)
+    assert loadBinaryLog(bin_path).shape == (100,)
+
+    writeBinary(bin_path, signals, [])
+    assert loadBinaryLog(bin_path).shape == (0,)
+
+def test_follow_binary_log(tmp_path):
+    types = {type_descr.name: type_descr for type_descr in standard_type_descriptors.values()}
+    signals = [SignalDescriptor('Counter', types['uint32'], 1),
+               SignalDescriptor('Position', types['float64'], 2)]
+    bin_path = str(tmp_path / 'log.bin')
+    assert not BinaryLogFollower(bin_path, 0.01, 0).waitForHeader()
+    with open(bin_path, 'wb') as binfile:
+        binfile.write(struct.pack('<I', len(signals)))
+    assert not BinaryLogFollower(bin_path, 0.01, 0).waitForHeader()
+
+    writeBinary(bin_path, signals, [[index, index, -index] for index in range(10)])
+    follower = BinaryLogFollower(bin_path, 0.01, 0.2, block_rows=4)
+    batches = iter(follower)
+    assert [len(next(batches)) for _ in range(3)] == [4, 4, 2]
+    assert follower.dtype.names == ('Counter', 'Position')
+
+    # Rows appended later are picked up, a partial row once it is complete
+    interpreter = RowInterpreter(*signals)
+    row = struct.pack(interpreter.rowFormat(), 10, 10.0, -10.0)
+    with open(bin_path, 'ab') as binfile:
+        binfile.write(row + row[:5])
+        binfile.flush()
+        batch = next(batches)
+        assert batch['Counter'].tolist() == [10]
+        assert batch['Position'].tolist() == [[10.0, -10.0]]
+        assert not batch.flags.writeable
+        binfile.write(row[5:])
+    assert next(batches)['Position'].tolist() == [[10.0, -10.0]]
+    with pytest.raises(StopIteration):
+        next(batches)
+
+def test_bin2csv_follow(tmp_path, monkeypatch):
+    types = {type_descr.name: type_descr for type_descr in standard_type_descriptors.values()}
+    signals = [SignalDescriptor('Counter', types['uint32'], 1),
+               SignalDescriptor('Position', types['float64'], 3)]
+    bin_path = str(tmp_path / 'log.bin')
+    writeBinary(bin_path, signals, [[index, index * 0.5, -1.0, 2.0] for index in range(50)])
+    with open(bin_path, 'ab') as binfile:
+        binfile.write(b'\x00' * 7)
+    for marte2_csv, option in ((True, []), (False, ['--standard'])):
+        expected = str(tmp_path / 'expected.csv')
+        followed = str(tmp_path / 'followed.csv')
+        with pytest.raises(Bin2CSVError):
+            Bin2CSV(bin_path, expected, marte2_csv).main()
+        Bin2CSV(bin_path, followed, marte2_csv, block_rows=8).follow(0.01, 0)
+        with open(expected) as fexpected, open(followed) as ffollowed:
+            assert ffollowed.read() == fexpected.read()
+        assert commandLine([bin_path, followed, '--follow', '--idle-timeout', '0',
+                            '--block-rows', '8'] + option) == 0
+        with open(expected) as fexpected, open(followed) as ffollowed:
+            assert ffollowed.read() == fexpected.read()
+
+    assert commandLine([bin_path]) == 1
+    writeBinary(bin_path, signals, [[index, index * 0.5, -1.0, 2.0] for index in range(50)])
+    assert commandLine([bin_path]) == 0
+    assert os.path.exists(str(tmp_path / 'log.csv'))
+    with pytest.raises(Bin2CSVError):
+        Bin2CSV(str(tmp_path / 'missing.bin'), followed).follow(0.01, 0)
+
+    # A header that never completes leaves no file open behind
+    partial = str(tmp_path / 'partial.bin')
+    with open(partial, 'wb') as binfile:
+        binfile.write(struct.pack('<I', len(signals)))
+    opened = []
+    wait_for_header = BinaryLogFollower.waitForHeader
+    def waitForHeader(follower):
+        try:
+            return wait_for_header(follower)
+        finally:
+            opened.append(follower._fin)
+    monkeypatch.setattr(BinaryLogFollower, 'waitForHeader', waitForHeader)
+    with pytest.raises(Bin2CSVError):
+        Bin2CSV(partial, followed).follow(0.01, 0)
+    assert opened[0].closed
@@ -1,6 +1,8 @@
 import pytest
 
-from martepy.functions.extra_functions import calculateStackSize, form, findIndexByDictKey, isfloat
+import copy
+
+from martepy.functions.extra_functions import calculateStackSize, form, findIndexByDictKey, isfloat, normalizeSignal, normalizedItems
 
 def test_calculate_stacksize():
     signals = [('Name1', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'uint32', 'Alias': 'Namealias', 'Default': '3.2', 'NumberOfElements': '1'}}),
@@ -37,4 +39,56 @@ def test_float():
     assert isfloat(2.0)
     assert not isfloat('2b')
     assert isfloat(2)
-    assert isfloat('2')
\ No newline at end of file
+    assert isfloat('2')
+@pytest.mark.parametrize(
+    "marte_config",
+    [
+        {'DataSource': 'DDB0', 'Type': 'uint32', 'NumberOfDimensions': '1', 'NumberOfElements': 1, 'Default': '{3}'},
+        {'Type': 'uint32', 'NumberOfDimensions': 1, 'NumberOfElements': '4', 'Default': '{1 2 3 4}'},
+        {'Type': 'float64', 'Default': '{0.5}', 'Alias': 'A'},
+        {'Type': 'float64', 'NumberOfDimensions': '1', 'Default': 2},
+        {'Type': 'float64', 'NumberOfElements': '1'},
+    ]
+)
+def test_normalizedItems(marte_config):
+    original = copy.deepcopy(marte_config)
+    expected = normalizeSignal({'MARTeConfig': copy.deepcopy(marte_config)})['MARTeConfig']
+    assert normalizedItems(marte_config) == list(expected.items())
+    assert normalizedItems(marte_config, exclude=('Alias', 'DataSource')) == [
+        (k, v) for k, v in expected.items() if k not in ('Alias', 'DataSource')]
+    assert marte_config == original
+
+def test_non_duplicating_list():
+    import pickle
+    from martepy.functions.extra_functions import NonDuplicatingList
+    from martepy.marte2.gams.iogam import IOGAM
+    signal = ('A', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'uint32'}})
+    items = NonDuplicatingList()
+    items += [IOGAM('GAM1', [signal], [signal]), IOGAM('GAM2', [], []), 'name', {'a': 1}]
+    # Equal by content rather than identity, same named but different objects are kept
+    items += [IOGAM('GAM1', [signal], [signal]), IOGAM('GAM2', [signal], []), 'name', {'a': 1}]
+    assert [getattr(item, 'configuration_name', item) for item in items] == [
+        'GAM1', 'GAM2', 'name', {'a': 1}, 'GAM2']
+    assert len(copy.deepcopy(items)) == 5
+    assert len(pickle.loads(pickle.dumps(items))) == 5
+
+    # Changing the list through other methods is seen by the next append
+    items.remove('name')
+    items.append('name')
+    del items[0]
+    items.append(IOGAM('GAM1', [signal], [signal]))
+    assert [getattr(item, 'configuration_name', item) for item in items] == [
+        'GAM2', {'a': 1}, 'GAM2', 'name', 'GAM1']
+
+    # A renamed item is not appended again itself, nor are items equal to it afterwards
+    renamed = items[-1]
+    renamed.configuration_name = 'GAM3'
+    items.append(renamed)
+    assert len(items) == 5
+    items.append(IOGAM('GAM3', [signal], [signal]))
+    assert len(items) == 5
+    # Without appending the renamed item those are found once reindexed
+    renamed.configuration_name = 'GAM4'
+    items.reindex()
+    items.append(IOGAM('GAM4', [signal], [signal]))
+    assert len(items) == 5
@@ -4,7 +4,9 @@ from martepy.marte2.gams.iogam import IOGAM
 from martepy.marte2.gams.constant_gam import ConstantGAM
 from martepy.marte2.gams.mux import MuxGAM
 
-from martepy.functions.gam_functions import consolidate
+from martepy.functions.gam_functions import (assignUniqueName, consolidate, copySignal,
+                                             findSignalInFunctionList, indexSignals,
+                                             ProducerIndex, UniqueNameAllocator)
 
 def test_consolidate():
     functions = []
@@ -76,3 +78,57 @@ def test_consolidate():
     assert functions[0].input_signals[0]
     assert functions[0].input_signals[2][0] == 'Constant_1'
     assert functions[0].input_signals[3][0] == 'Constant_2'
+
+def test_copy_signal():
+    signal = ('Position', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'float64',
+                                           'Default': ['0', '1']}})
+    copied = copySignal(signal)
+    assert copied == signal
+    assert isinstance(copied, tuple)
+    copied[1]['MARTeConfig']['DataSource'] = 'DDB1'
+    copied[1]['MARTeConfig']['Default'].append('2')
+    assert signal[1]['MARTeConfig'] == {'DataSource': 'DDB0', 'Type': 'float64',
+                                        'Default': ['0', '1']}
+
+def test_producer_index():
+    first = IOGAM('First', [], [('A', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'uint32'}}),
+                                ('B', {'MARTeConfig': {'DataSource': 'DDB0', 'Alias': 'C',
+                                                       'Type': 'uint32'}})])
+    functions = [first]
+    index = ProducerIndex(functions)
+    wanted = ('C', {'MARTeConfig': {'DataSource': 'DDB0'}})
+    assert index.find(wanted) is findSignalInFunctionList(wanted, functions) is \
+        first.output_signals[1]
+    later = ('D', {'MARTeConfig': {'DataSource': 'DDB1', 'Type': 'uint32'}})
+    assert index.find(later) is None
+    functions.append(IOGAM('Second', [], [later, ('A', {'MARTeConfig': {'DataSource': 'DDB0'}})]))
+    assert index.find(later) is later
+    # The first producer is found, as findSignalInFunctionList does
+    assert index.find(first.output_signals[0]) is first.output_signals[0]
+
+def test_unique_name_allocator():
+    functions = [IOGAM('First', [], [('A', {'MARTeConfig': {'DataSource': 'DDB0'}}),
+                                     ('A1', {'MARTeConfig': {'Alias': 'B'}})])]
+    names = UniqueNameAllocator(functions)
+    assert names.newName('C') == 'C'
+    assert names.newName('B') == 'B1'
+    assert names.newName('A') == 'A2'
+    # Names are taken once a function outputs them
+    assert names.newName('A') == 'A2'
+    functions.append(IOGAM('Second', [], [('A2', {'MARTeConfig': {}})]))
+    assert names.newName('A') == 'A3'
+
+def test_signal_index():
+    signals = [('A', {'MARTeConfig': {'Alias': 'X'}}), ('B', {'MARTeConfig': {}})]
+    indexes = {}
+    index = indexSignals(indexes, signals)
+    assert index.names == {'A', 'B'} and index.aliases == {'X', 'B'}
+    signals.append(('C', {'MARTeConfig': {}}))
+    assert indexSignals(indexes, signals) is index and 'C' in index.names
+    # Given the names, assignUniqueName renames the same way as scanning the list
+    for names in (None, index.names):
+        signal = assignUniqueName(('A', {'MARTeConfig': {}}), signals, names)
+        assert signal[0] == 'A1' and signal[1]['MARTeConfig']['Alias'] == 'A'
+    # Removing signals indexes the list again
+    del signals[:2]
+    assert indexSignals(indexes, signals).names == {'C'}
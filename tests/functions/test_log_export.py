@@ -0,0 +1,102 @@
+import json
+import pytest
+
+import numpy as np
+
+from martepy.functions.bin2csv import Bin2CSVError, SignalDescriptor, standard_type_descriptors
+from martepy.functions.log_export import exportBinaryLog, signalMetadata, writerFor, NpzWriter
+from .binary_logs import writeBinary
+
+TYPES = {type_descr.name: type_descr for type_descr in standard_type_descriptors.values()}
+
+@pytest.fixture
+def binary_log(tmp_path):
+    signals = [SignalDescriptor('Counter', TYPES['uint32'], 1),
+               SignalDescriptor('Position', TYPES['float64'], 3),
+               SignalDescriptor('Status', TYPES['int8'], 1)]
+    rows = [[index, index * 0.5, -1.0, 2.0, index % 3 - 1] for index in range(100)]
+    bin_path = str(tmp_path / 'log.bin')
+    writeBinary(bin_path, signals, rows)
+    return bin_path
+
+METADATA = {'Counter': {'type': 'uint32', 'elements': 1},
+            'Position': {'type': 'float64', 'elements': 3},
+            'Status': {'type': 'int8', 'elements': 1}}
+
+def checkColumns(columns):
+    assert columns['Counter'].tolist() == list(range(100))
+    assert columns['Position'].shape == (100, 3)
+    assert columns['Position'][7].tolist() == [3.5, -1.0, 2.0]
+    assert columns['Status'].dtype == np.int8
+    assert columns['Status'][:4].tolist() == [-1, 0, 1, -1]
+
+def test_npz(binary_log, tmp_path):
+    out_path = str(tmp_path / 'log.npz')
+    # Small blocks so each column is written in several
+    exportBinaryLog(binary_log, out_path, block_rows=7)
+    with np.load(out_path) as archive:
+        assert sorted(archive.files) == ['Counter', 'Position', 'Status', '__metadata__']
+        checkColumns(archive)
+        assert json.loads(str(archive['__metadata__'])) == METADATA
+
+    exportBinaryLog(binary_log, out_path, signals=['Status'])
+    with np.load(out_path) as archive:
+        assert sorted(archive.files) == ['Status', '__metadata__']
+
+def test_parquet(binary_log, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    out_path = str(tmp_path / 'log.parquet')
+    exportBinaryLog(binary_log, out_path, block_rows=7)
+    table = pq.read_table(out_path)
+    assert str(table.schema.field('Status').type) == 'int8'
+    assert table.schema.field('Position').type.list_size == 3
+    checkColumns({name: np.array(table[name].to_pylist(), dtype=METADATA[name]['type'])
+                  for name in table.column_names})
+    assert json.loads(table.schema.metadata[b'martepy']) == METADATA
+
+def test_hdf5(binary_log, tmp_path):
+    h5py = pytest.importorskip('h5py')
+    out_path = str(tmp_path / 'log.h5')
+    exportBinaryLog(binary_log, out_path, block_rows=7)
+    with h5py.File(out_path, 'r') as hdf5_file:
+        checkColumns({name: hdf5_file[name][()] for name in hdf5_file})
+        assert {name: {'type': hdf5_file[name].attrs['type'],
+                       'elements': int(hdf5_file[name].attrs['elements'])}
+                for name in hdf5_file} == METADATA
+
+def test_writer_for():
+    assert writerFor('log.NPZ') is NpzWriter
+    with pytest.raises(Bin2CSVError):
+        writerFor('log.csv')
+
+def test_char_signals(tmp_path):
+    signals = [SignalDescriptor('Name', TYPES['char8'], 4),
+               SignalDescriptor('Small', TYPES['int16'], 2),
+               SignalDescriptor('Count', TYPES['int64'], 1)]
+    bin_path = str(tmp_path / 'log.bin')
+    writeBinary(bin_path, signals, [[b'a', b'b', b'c', b'\x00', -3, 4, -2 ** 40]] * 3)
+    # The MARTe2 type names of the header rather than NumPy's S1 for char8
+    metadata = {'Name': {'type': 'char8', 'elements': 4},
+                'Small': {'type': 'int16', 'elements': 2},
+                'Count': {'type': 'int64', 'elements': 1}}
+    out_path = str(tmp_path / 'log.npz')
+    exportBinaryLog(bin_path, out_path)
+    with np.load(out_path) as archive:
+        assert archive['Name'][0].tobytes() == b'abc\x00'
+        assert archive['Small'][0].tolist() == [-3, 4]
+        assert archive['Count'].tolist() == [-2 ** 40] * 3
+        assert json.loads(str(archive['__metadata__'])) == metadata
+
+    h5py = pytest.importorskip('h5py')
+    exportBinaryLog(bin_path, str(tmp_path / 'log.h5'))
+    with h5py.File(str(tmp_path / 'log.h5'), 'r') as hdf5_file:
+        assert {name: {'type': hdf5_file[name].attrs['type'],
+                       'elements': int(hdf5_file[name].attrs['elements'])}
+                for name in hdf5_file} == metadata
+
+    pq = pytest.importorskip('pyarrow.parquet')
+    exportBinaryLog(bin_path, str(tmp_path / 'log.parquet'))
+    table = pq.read_table(str(tmp_path / 'log.parquet'))
+    assert json.loads(table.schema.metadata[b'martepy']) == metadata
+    # NumPy drops trailing null bytes of its bytes values
+    assert table['Name'][0].as_py() == [b'a', b'b', b'c', b'']
@@ -1,6 +1,6 @@
 import pytest
 
-from martepy.marte2.configwriting import ConfigWriter, StringConfigWriter
+from martepy.marte2.configwriting import ConfigWriter, StringConfigWriter, FileConfigWriter
 
 def test_string_writer():
     test_obj = StringConfigWriter()
@@ -36,3 +36,30 @@ def test_configwriter():
     test_obj.writeMARTe2Vector('Defaults', [0.9793,898.8797,8.8766], formatAsFloat=True)
     assert str(repr(test_obj)) == 'Defaults = { 0.9793 898.88 8.8766 }'
 
+
+def test_file_writer():
+    import io
+    handle = io.StringIO()
+    test_obj = FileConfigWriter(handle, buffer_lines=4)
+    string_obj = StringConfigWriter()
+    for writer in (test_obj, string_obj):
+        writer.startClass('+GAM', 'IOGAM')
+        writer.startSection('InputSignals')
+        writer.writeNode('Counter', 1)
+        writer.endSection('InputSignals')
+        writer.endSection('+GAM')
+    # Only whole batches have been written until flushed
+    assert handle.getvalue().count('\n') == 4
+    test_obj.close()
+    assert handle.getvalue() == string_obj.toString() + '\n'
+    assert not handle.closed
+
+def test_prefix_cache():
+    test_obj = StringConfigWriter()
+    test_obj.tab = 3
+    assert test_obj.getPrefix() == ' ' * 12
+    test_obj.tab = 1
+    assert test_obj.getPrefix() == ' ' * 4
+    test_obj.tab_text = '\t'
+    test_obj.tab = 2
+    assert test_obj.getPrefix() == '\t\t'
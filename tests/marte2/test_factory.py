@@ -47,4 +47,108 @@ def test_factory():
 
     assert test_obj.classes == {}
 
-    assert test_obj.getAll() == []
\ No newline at end of file
+    assert test_obj.getAll() == []
+
+PLUGIN = '''
+INITIALIZED = []
+
+class LazyGAM:
+    pass
+
+def initialize(factory, plugin_datastore):
+    INITIALIZED.append(factory)
+    factory.registerBlock("LazyGAM", LazyGAM, plugin_datastore)
+    factory.registerBlock("Lazy::LazyGAM", LazyGAM, plugin_datastore)
+'''
+
+def test_lazy_factory(tmp_path, monkeypatch):
+    import sys
+    import json
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / 'lazy_test_plugin.py').write_text(PLUGIN)
+    definition = tmp_path / 'lazy.json'
+    definition.write_text(json.dumps({'lazy': {'module': 'lazy_test_plugin',
+                                               'classes': ['LazyGAM', 'Lazy::LazyGAM', 'Missing']}}))
+    test_obj = Factory()
+    test_obj.loadRemote(str(definition))
+    assert 'lazy_test_plugin' not in sys.modules
+    assert list(test_obj.classes) == ['LazyGAM', 'Lazy::LazyGAM', 'Missing']
+    # Hiding a parent class from a child does not import its plugin
+    child = Factory(parent=test_obj)
+    child.unregisterBlock('LazyGAM')
+    assert 'lazy_test_plugin' not in sys.modules
+    with pytest.raises(ValueError):
+        child.unregisterBlock('Unknown')
+
+    lazy_gam = test_obj.create('Lazy::LazyGAM')
+    plugin = sys.modules['lazy_test_plugin']
+    assert lazy_gam is plugin.LazyGAM
+    assert test_obj.create('LazyGAM') is lazy_gam
+    assert plugin.INITIALIZED == [test_obj]
+    # A name listed in the definition but not registered by the module is unknown
+    with pytest.raises(ValueError) as excinfo:
+        test_obj.create('Missing')
+    assert str(excinfo.value) == "Unknown block type Missing"
+    assert test_obj.getAll() == [lazy_gam, lazy_gam]
+
+    # Other factories reuse the loaded plugin without initializing it again
+    other = Factory()
+    other.loadRemote(str(definition))
+    assert other.create('LazyGAM') is lazy_gam
+    assert plugin.INITIALIZED == [test_obj]
+    monkeypatch.delitem(sys.modules, 'lazy_test_plugin')
+
+def test_eager_definition(tmp_path):
+    import json
+    definition = tmp_path / 'eager.json'
+    definition.write_text(json.dumps({'iogam': 'martepy.marte2.gams.iogam'}))
+    test_obj = Factory()
+    test_obj.loadRemote(str(definition))
+    assert dict.__getitem__(test_obj.classes, 'IOGAM') is IOGAM
+
+def test_shared_factory():
+    from concurrent.futures import ThreadPoolExecutor
+    from martepy.marte2.factory import sharedFactory
+    from martepy.marte2.generic_application import MARTe2Application
+    from martepy.marte2.gams.message_gam import MFactory
+    from martepy.marte2.objects.message import MARTe2Message
+    from martepy.marte2.reader import mfactory
+
+    shared = sharedFactory()
+    assert sharedFactory() is shared
+    assert MARTe2Application().factory.parent is shared
+    assert mfactory.parent is shared
+    assert MFactory().create('Message') is shared.create('Message') is MARTe2Message
+    with ThreadPoolExecutor(8) as pool:
+        created = list(pool.map(shared.create, ['IOGAM', 'EndGAM', 'GAMDataSource'] * 8))
+    assert created[:3] == created[3:6]
+    assert created[0] is IOGAM
+
+    with pytest.raises(TypeError):
+        shared.registerBlock('UserGAM', IOGAM, shared.classes)
+    with pytest.raises(TypeError):
+        shared.unregisterBlock('IOGAM')
+
+    # Registering into a child factory leaves the shared one unchanged
+    first = Factory(parent=shared)
+    second = Factory(parent=shared)
+    first.registerBlock('UserGAM', ConstantGAM, first.classes)
+    first.registerBlock('IOGAM', ConstantGAM, first.classes)
+    first.unregisterBlock('SSMGAM')
+    assert first.create('UserGAM') is ConstantGAM
+    assert first.create('IOGAM') is ConstantGAM
+    assert first.create('MuxGAM') is MuxGAM
+    with pytest.raises(ValueError):
+        first.create('SSMGAM')
+    assert 'UserGAM' in first.names() and 'SSMGAM' not in first.names()
+    assert first.getAll().count(ConstantGAM) == 3
+    with pytest.raises(ValueError):
+        second.create('UserGAM')
+    import pickle
+    assert pickle.loads(pickle.dumps(shared)) is shared
+    assert second.create('IOGAM') is IOGAM
+    assert second.create('SSMGAM') is SSMGAM
+    assert shared.create('IOGAM') is IOGAM
+
+    first.unloadAll()
+    assert first.getAll() == []
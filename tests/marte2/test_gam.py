@@ -1,4 +1,5 @@
 import pytest
+import copy
 
 from martepy.marte2.gam import MARTe2GAM
 from martepy.functions.gam_functions import getAlias
@@ -45,3 +46,25 @@ def test_gam(configuration_name, class_name, input_signals, output_signals, name
     second_gam.input_signals = []
 
     assert not second_gam == test_obj
+
+def test_gam_equality():
+    from martepy.marte2.gams.iogam import IOGAM
+    from martepy.marte2.datasources import SDNSubscriber
+    signal = ('A', {'MARTeConfig': {'DataSource': 'DDB0', 'Type': 'uint32'}})
+    first = IOGAM('GAM1', [signal], [signal])
+    second = IOGAM('GAM1', [copy.deepcopy(signal)], [copy.deepcopy(signal)])
+    assert first == second and hash(first) == hash(second)
+    assert first != IOGAM('GAM2', [signal], [signal])
+    assert {first: 1}[second] == 1
+
+    # Editing signals in place keeps the hash and is seen by equality
+    second.output_signals[0][1]['MARTeConfig']['Type'] = 'float32'
+    assert first != second and hash(first) == hash(second)
+
+    # Attributes which are not serialized do not change equality
+    second = IOGAM('GAM1', [signal], [signal])
+    second.note = 'unserialized'
+    assert first == second
+    subscriber = SDNSubscriber('Sub')
+    other = SDNSubscriber('Sub', class_name='Other')
+    assert subscriber == other and hash(subscriber) == hash(other)
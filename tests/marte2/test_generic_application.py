@@ -69,6 +69,121 @@ def test_application(setup_simple_app):
 
     assert comp_text == text
 
+def test_application_to_file(setup_simple_app, tmp_path):
+    import io
+    from martepy.marte2.configwriting import FileConfigWriter
+    app = setup_simple_app
+    with open(os.path.join(top_lvl, 'tests','functions','simple_logger.cfg'), 'r') as comparison_file:
+        comp_text = comparison_file.read()
+
+    handle = io.StringIO()
+    assert app.writeToConfig(out=handle) is None
+    assert handle.getvalue() == comp_text
+
+    path = str(tmp_path / 'simple_logger.cfg')
+    with FileConfigWriter(path, buffer_lines=7) as writer:
+        app.writeToConfig(out=writer)
+    with open(path, 'r') as written_file:
+        assert written_file.read() == comp_text
+
+def test_incremental_export(setup_simple_app):
+    app = setup_simple_app
+    with open(os.path.join(top_lvl, 'tests','functions','simple_logger.cfg'), 'r') as comparison_file:
+        comp_text = comparison_file.read()
+    assert app.writeToConfig() == comp_text
+    functions = app.functions
+    # Nothing changed so the functions are not gathered again
+    assert app.writeToConfig() == comp_text
+    assert app.functions is functions
+
+    # Adding a function to a thread is noticed without marking anything
+    thread = app.states[0].threads.objects[0]
+    empty_io = IOGAM('EmptyIO', [], [])
+    thread.functions += [empty_io]
+    assert app.writeToConfig() == comp_text
+    assert empty_io not in thread.functions
+
+    # Editing the DataSource of a signal in place is noticed without marking the GAM dirty
+    timer = [a for a in app.functions if getname(a) == 'GAMTimer'][0]
+    ddb = [a for a in app.additional_datasources if getname(a) == 'DDB1'][0]
+    ddb2 = GAMDataSource('DDB2')
+    app.add(additional_datasources=[ddb2])
+    for output_signal in timer.output_signals:
+        output_signal[1]['MARTeConfig']['DataSource'] = 'DDB2'
+    app.writeToConfig()
+    assert ddb not in app.additional_datasources
+    assert ddb2 in app.additional_datasources
+    assert timer in app.functions
+
+    # As is marking it dirty
+    for output_signal in timer.output_signals:
+        output_signal[1]['MARTeConfig']['DataSource'] = 'LoggerDataSource'
+    app.markDirty(timer)
+    app.writeToConfig()
+    assert ddb2 not in app.additional_datasources
+
+def errorSignal(name, datasource, type_='uint32', **extra):
+    return (name, {'MARTeConfig': dict({'DataSource': datasource, 'Type': type_}, **extra)})
+
+def test_only_errors():
+    app = MARTe2Application()
+    app.objects = [MARTe2ReferenceContainer('+Obj'), MARTe2ReferenceContainer('+Obj')]
+    ddb = GAMDataSource('DDB1')
+    ddb.input_signals = [errorSignal('A', 'DDB1'), errorSignal('A', 'DDB1'), errorSignal('Unread', 'DDB1')]
+    ddb.output_signals = [errorSignal('A', 'DDB1'), errorSignal('B', 'DDB1'), errorSignal('B', 'DDB1'),
+                          errorSignal('Unwritten', 'DDB1')]
+    app.additional_datasources = [ddb, GAMDataSource('+DDB1'), FileWriter(configuration_name='Logger')]
+    gam1 = IOGAM('GAM1', [errorSignal('A', 'DDB1'), errorSignal('A', 'DDB1')],
+                 [errorSignal('B', 'DDB1'), errorSignal('C', 'DDB1', Alias='B')])
+    gam1b = IOGAM('GAM1', [errorSignal('A', 'DDB1')], [errorSignal('D', 'DDB1'), errorSignal('D', 'DDB1', Alias='E')])
+    gam2 = IOGAM('GAM2', [errorSignal('X', 'Missing'), errorSignal('Y', 'DDB1')], [errorSignal('L', 'Logger', 'float64')])
+    gam3 = IOGAM('GAM3', [errorSignal('A', 'DDB1', 'float32')], [errorSignal('L2', 'Logger'), errorSignal('M', 'DDB1', 'uint8')])
+    app.functions = [gam1, gam1b, gam2, gam3]
+    threads = [[MARTe2RealTimeThread(configuration_name='Thread1', functions=[gam1, gam2]),
+                MARTe2RealTimeThread(configuration_name='Thread1', functions=[gam3])],
+               [MARTe2RealTimeThread(configuration_name='Thread3', functions=[gam1b])],
+               [MARTe2RealTimeThread(configuration_name='Empty', functions=[])]]
+    app.states = [MARTe2RealTimeState(configuration_name=name, threads=MARTe2ReferenceContainer(
+                      configuration_name='Threads', objects=objects))
+                  for name, objects in zip(['State1', '+State1', 'Idle'], threads)]
+
+    # Unread is consumed once for each state running functions
+    assert [' '.join(str(error).split()) for error in app.onlyErrors()] == [
+        'Two objects/interfaces exist in the configuration with the same name.',
+        'Cannot have same root name of input signal repeated within function: GAM1',
+        'Multiple producers of alias within function: GAM1',
+        'Two functions with the same name exist - this can happen if you have two functions in the same state or across states which are non-identical but identical in name.',
+        'Cannot have same root name of output signal repeated within function: GAM1',
+        'Input/output size mismatch: 4 bytes in, 8 bytes out in IOGAM function: GAM1',
+        'Input/output size mismatch: 4 bytes in, 5 bytes out in IOGAM function: GAM3',
+        'Cannot have same root name of input signal repeated within datasource: DDB1',
+        'Cannot have same root name of output signal repeated within datasource: DDB1',
+        'Two datasources with the same name exist - this can happen if you have two datasources in the same state or across states which are non-identical but identical in name.',
+        'No producer found for signal Y in datasource DDB1',
+        'No producer found for signal Unread in datasource DDB1',
+        'No producer found for signal Unread in datasource DDB1',
+        'No datasource Missing found yet consumed by signal X',
+        'datasource Missing not found for consumed signal X',
+        'Multiple threads with the same name in state: State1, with name: Thread1',
+        'Multiple states with the same name: State1',
+        'Multiple writers to FileWriter Logger',
+    ]
+
+    # Checking the functions in worker processes finds the same errors in the same order
+    errors = [str(error) for error in app.onlyErrors()]
+    assert [str(error) for error in app.onlyErrors(workers=2)] == errors
+
+    # A type without a known size is reported rather than failing the check
+    unknown = IOGAM('GAM4', [errorSignal('A', 'DDB1', 'Unknown')], [errorSignal('N', 'DDB1')])
+    app.functions = [unknown]
+    app.states[0].threads.objects[0].functions = [unknown]
+    errors = [str(error) for error in app.onlyErrors()]
+    assert 'Unsupported type: Unknown' in errors
+    assert not [error for error in errors if error.startswith('Input/output size mismatch')]
+
+    # An application with no functions is checked without starting any workers
+    assert MARTe2Application().onlyErrors(workers=2) == []
+
 def test_app_functions(setup_simple_app):
     app = setup_simple_app
     app.sanitize()
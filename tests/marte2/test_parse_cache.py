@@ -0,0 +1,93 @@
+import os
+import pytest
+
+from martepy.marte2 import parse_cache
+from martepy.marte2.parse_cache import ParseCache
+from martepy.marte2.reader import readApplication, buildTree
+
+cfg_file = os.path.abspath(os.path.join(os.path.dirname(__file__), 'RTApp-2-10.cfg'))
+
+class CountingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, content):
+        self.calls += 1
+        return buildTree(content)
+
+def test_cache_hit(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    read_func = CountingReader()
+    app = readApplication(cfg_file, read_func=read_func, cache=cache)[0]
+    assert read_func.calls == 1
+    assert len(cache.entries()) == 1
+    cached = readApplication(cfg_file, read_func=read_func, cache=cache)
+    assert read_func.calls == 1
+    assert cached[0].writeToConfig() == app.writeToConfig()
+    assert cached[0] is not app
+    assert len(cached) == 5
+    # The factories of cached applications are still the shared one
+    from martepy.marte2.factory import sharedFactory
+    assert cached[0].factory.parent is sharedFactory()
+
+def test_cache_factory(tmp_path):
+    from martepy.marte2.factory import Factory, sharedFactory
+    cache = ParseCache(str(tmp_path))
+    read_func = CountingReader()
+    readApplication(cfg_file, read_func=read_func, cache=cache)
+    # Another factory may create other classes so it does not use the cache
+    factory = Factory(parent=sharedFactory())
+    readApplication(cfg_file, read_func=read_func, cache=cache, factory=factory)
+    assert read_func.calls == 2
+    assert len(cache.entries()) == 1
+
+def test_cache_key(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path))
+    key = cache.key('content', buildTree)
+    assert key == cache.key('content', buildTree)
+    assert key != cache.key('content changed', buildTree)
+    assert key != cache.key('content', CountingReader)
+    monkeypatch.setattr(parse_cache, 'VERSION', 'another')
+    assert key != cache.key('content', buildTree)
+    # Source checkouts share a version, a change to the reader or parser changes the key
+    key = cache.key('content', buildTree)
+    monkeypatch.setattr(parse_cache, 'SOURCES_DIGEST', 'edited')
+    assert key != cache.key('content', buildTree)
+
+def test_cache_eviction(tmp_path):
+    cache = ParseCache(str(tmp_path), max_bytes=10 ** 9)
+    for index in range(3):
+        cache.put(f'key{index}', 'x' * 1000)
+        # Make the use order explicit rather than relying on timestamp resolution
+        os.utime(os.path.join(str(tmp_path), f'key{index}.pickle'), (index, index))
+    assert cache.get('key0') == 'x' * 1000
+    cache.max_bytes = 2500
+    cache.evict()
+    assert cache.get('key1') is None
+    assert cache.get('key0') is not None
+    assert cache.get('key2') is not None
+    assert [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')] == []
+    cache.clear()
+    assert cache.entries() == []
+
+def test_cache_corrupt(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    with open(os.path.join(str(tmp_path), 'bad.pickle'), 'wb') as f:
+        f.write(b'not a pickle')
+    assert cache.get('bad') is None
+    assert not os.path.exists(os.path.join(str(tmp_path), 'bad.pickle'))
+    assert cache.get('missing') is None
+
+class FailsToLoad:
+    def __reduce__(self):
+        return (int, ('not a number',))
+
+def test_cache_unpicklable(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    # A result which cannot be pickled is not cached
+    cache.put('lambda', lambda: None)
+    assert os.listdir(str(tmp_path)) == []
+    # Any failure to load an entry is a miss
+    cache.put('fails', FailsToLoad())
+    assert cache.get('fails') is None
+    assert os.listdir(str(tmp_path)) == []
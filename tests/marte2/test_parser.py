@@ -0,0 +1,171 @@
+import glob
+import io
+import os
+import sys
+import pytest
+
+from martepy.marte2.reader import buildTree, readApplication, readApplicationText, streamFile
+from martepy.marte2.parser import parseTree, streamTree, tokenize, ConfigParseError, TreeNode
+from martepy.marte2.parser import CompactTreeNode
+
+test_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+def test_same_tree_as_buildtree():
+    files = glob.glob(os.path.join(test_dir, '**', '*.cfg'), recursive=True)
+    assert files
+    for cfg_file in files:
+        with open(cfg_file, 'r') as f:
+            content = f.read()
+        assert str(parseTree(content)) == str(buildTree(content))
+
+def test_same_tree_as_buildtree_written():
+    # The configurations martepy writes back out, as test_topython does for advtest.cfg
+    files = glob.glob(os.path.join(test_dir, '**', '*.cfg'), recursive=True)
+    files = [cfg_file for cfg_file in files if not os.path.basename(cfg_file).startswith('new_')]
+    assert files
+    for cfg_file in files:
+        with open(cfg_file, 'r') as f:
+            content = f.read()
+        app, state_machine, http_browser, _, interfaces = readApplicationText(content)
+        if state_machine is not None:
+            app.add(externals=[state_machine])
+        if http_browser is not None:
+            app.add(externals=[http_browser])
+        app.objects += interfaces
+        written = app.writeToConfig()
+        assert str(parseTree(written)) == str(buildTree(written))
+
+def test_trailing_comment():
+    assert tokenize('T = x // trailing') == [('T', 'x', '', '', '', '')]
+    assert tokenize('T = x /* trailing */ ') == [('T', 'x', '', '', '', '')]
+    node = parseTree('+A = { B = 1 } // trailing').children[0]
+    assert node.name == '+A'
+    assert node.parameters == {'B': '1'}
+
+def test_read_application():
+    cfg_file = os.path.join(test_dir, 'marte2', 'RTApp-2-10.cfg')
+    app = readApplication(cfg_file, read_func=parseTree)[0]
+    expected = readApplication(cfg_file)[0]
+    assert app.writeToConfig() == expected.writeToConfig()
+
+def test_same_line_values():
+    root = parseTree('+A = { Class = X +B = { Class = Y Other = Z } }')
+    node = root.children[0]
+    assert node.name == '+A'
+    assert node.parameters == {'Class': 'X'}
+    assert node.children[0].name == '+B'
+    assert node.children[0].parameters == {'Class': 'Y', 'Other': 'Z'}
+
+def test_comments_and_strings():
+    content = '''+A = { // comment
+        /* block
+           comment */
+        Alias = "http://host//path" // trailing
+        Empty =
+        +C = {}
+    }'''
+    node = parseTree(content).children[0]
+    assert node.parameters == {'Alias': '"http://host//path"', 'Empty': ''}
+    assert node.children[0].name == '+C'
+    assert node.children[0].children == []
+
+def test_vectors():
+    content = '''+A = {
+        Vector = {1 2 3}
+        Default = (float32) { 0.1, 0.2 }
+        Matrix = {
+            { 1 2 }
+            { 3 4 }
+        }
+    }'''
+    node = parseTree(content).children[0]
+    assert node.parameters['Vector'] == '{1 2 3}'
+    assert node.parameters['Default'] == '(float32) { 0.1, 0.2 }'
+    assert node.parameters['Matrix'] == '{ { 1 2 } { 3 4 } }'
+
+def test_tokenize():
+    tokens = tokenize('Type = uint32\n}')
+    assert tokens == [('Type', 'uint32', '', '', '', ''), ('', '', '', '', '', '}')]
+
+def test_node_class():
+    class OtherNode(TreeNode):
+        pass
+    root = parseTree('+A = { Class = X }', node_class=OtherNode)
+    assert isinstance(root.children[0], OtherNode)
+
+@pytest.mark.parametrize('content, message', [
+    ('+A = {\n Class = X\n}\n}', 'Unmatched "}" (line 4)'),
+    ('+A = {\n Class = X\n', "Unterminated section '+A' (line 3)"),
+    ('+A = {\n V = {\n 1 2\n', "Unterminated vector 'V' (line 4)"),
+    ('+A = {\n Class = X\n "value"\n}', 'Expected "name = value" at \'"value"\' (line 3)'),
+])
+def test_errors(content, message):
+    with pytest.raises(ConfigParseError) as excinfo:
+        parseTree(content)
+    assert str(excinfo.value) == message
+
+def test_stream_tree():
+    cfg_file = os.path.join(test_dir, 'marte2', 'RTApp-2-10.cfg')
+    with open(cfg_file, 'r') as f:
+        content = f.read()
+    root = parseTree(content)
+    app = next(a for a in root.children if a.parameters['Class'] == 'RealTimeApplication')
+    functions = next(a for a in app.children if a.name == '+Functions')
+    expected = [str(a) for a in functions.children]
+    # Small chunks split strings, comments and assignments between reads
+    for chunk_size in (5, 64, 4096):
+        with open(cfg_file, 'r') as f:
+            nodes = list(streamTree(f, chunk_size))
+        assert [str(a) for a in nodes if a.parent.name == '+Functions'] == expected
+        streamed_app = next(a for a in nodes if a.name == app.name)
+        assert streamed_app.children == []
+        assert streamed_app.parameters == app.parameters
+        assert [a.name for a in nodes if a.parent.name == 'root'] == [a.name for a in root.children]
+
+def test_stream_file():
+    cfg_file = os.path.join(test_dir, 'marte2', 'RTApp-2-10.cfg')
+    names = [a.name for a in streamFile(cfg_file, chunk_size=100)]
+    assert '+States' in names
+    assert '+Scheduler' in names
+
+def test_stream_errors():
+    with pytest.raises(ConfigParseError) as excinfo:
+        list(streamTree(io.StringIO('+A = {\n Class = X\n}\n}\n'), 4))
+    assert str(excinfo.value) == 'Unmatched "}" (line 4)'
+
+def test_compact_tree_node():
+    node = CompactTreeNode('reader')
+    node.addParameter(''.join(['Ty', 'pe']), ''.join(['float', '64']))
+    key, value = next(iter(node.parameters.items()))
+    assert key is sys.intern('Type')
+    assert value is sys.intern('float64')
+    with pytest.raises(AttributeError):
+        node.key = ''
+    first = CompactTreeNode('+A', node)
+    first.addParameter('Class', 'IOGAM')
+    node.addChild(first)
+    assert node.getChild('+A') is first
+    assert node.getChildByClass('IOGAM') is first
+    second = CompactTreeNode('+B', node)
+    second.addParameter('Class', 'IOGAM')
+    node.addChild(second)
+    assert node.getChild('+B') is second
+    assert node.getChildByClass('IOGAM') is first
+    # Replacing children directly is picked up on the next lookup
+    node.children = [second]
+    assert node.getChild('+A') is None
+    assert node.getChildByClass('IOGAM') is second
+    # Duplicated names return the first as a scan would
+    node.children = [first, second, CompactTreeNode('+A', node)]
+    assert node.getChild('+A') is first
+    assert node.getChild('+C') is None
+    assert str(node) == 'reader\n\tType = float64\n\t+A\n\t\tClass = IOGAM\n\t+B\n\t\tClass = IOGAM\n\t+A\n'
+    # Changing the children in place is picked up as well
+    node.children[0] = second
+    assert node.getChild('+A').parent is node
+    assert node.getChild('+B') is second
+    node.children.remove(second)
+    assert node.getChildByClass('IOGAM') is second
+    del node.children[:]
+    assert node.getChild('+B') is None
+    assert str(parseTree('+A = { Class = X }')) == str(parseTree('+A = { Class = X }', TreeNode))
@@ -1,8 +1,10 @@
 import os
+import subprocess
+import sys
 import pdb
 import pytest
 
-from martepy.marte2.reader import readApplication, UnrecognisedParameterException
+from martepy.marte2.reader import readApplication, readApplicationText, UnrecognisedParameterException
 from martepy.marte2.reader import TreeNode, getParameters, setParameters, handleChildObjects, createBasicStateMachine, createHttpBrowser
 from martepy.marte2.factory import Factory as mpyFactory
 from martepy.marte2.objects.configuration_database import MARTe2ConfigurationDatabase
@@ -74,3 +76,58 @@ def test_handle_obj():
     msg = MARTe2Message(parent.name, parent.parameters['Destination'].strip('"'), parent.parameters['Function'].strip('"'),
                   MARTe2ConfigurationDatabase(objects={}), parent.parameters['Mode'], 0)
     handleChildObjects(msg, parent, mfactory)
+
+def test_missing_sections():
+    text = '''
+$App = {
+    Class = RealTimeApplication
+    +Functions = {
+        Class = ReferenceContainer
+    }
+    +Data = {
+        Class = ReferenceContainer
+    }
+    +States = {
+        Class = ReferenceContainer
+    }
+}
+'''
+    with pytest.raises(ValueError) as excinfo:
+        readApplicationText(text)
+    assert str(excinfo.value) == 'RealTimeApplication $App has no +Scheduler section'
+    with pytest.raises(ValueError) as excinfo:
+        readApplicationText(text.replace('+States', '+Other'))
+    assert str(excinfo.value) == 'RealTimeApplication $App has no +States section'
+    with pytest.raises(ValueError) as excinfo:
+        readApplicationText(text.replace('RealTimeApplication', 'ReferenceContainer'))
+    assert str(excinfo.value) == 'No RealTimeApplication found in the configuration'
+
+def test_reader_without_qt():
+    # Reading and writing a config must work on machines without Qt installed
+    script = '''
+import sys
+class BlockQt:
+    def find_spec(self, name, path, target=None):
+        if name.split('.')[0] in ('PyQt5', 'qtpy', 'nodeeditor'):
+            raise ImportError(name)
+sys.meta_path.insert(0, BlockQt())
+from martepy.marte2.reader import readApplication
+import martepy.marte2.gams, martepy.marte2.datasources
+app = readApplication(sys.argv[1])[0]
+assert app.writeToConfig()
+'''
+    cfg_file = os.path.abspath(os.path.join(os.path.dirname(__file__), 'RTApp-2-10.cfg'))
+    subprocess.run([sys.executable, '-c', script, cfg_file], check=True, cwd=main_dir)
+
+def test_qt_reexports():
+    # The Qt widgets moved to *_qt modules can still be imported from their old modules
+    from martepy.marte2.gams.message_gam import EventsWindow
+    from martepy.marte2.gams.message_gam_qt import EventsWindow as QtEventsWindow
+    from martepy.marte2.gams.simulink_gam import DefineParametersDialog
+    from martepy.marte2.gams.simulink_gam_qt import DefineParametersDialog as QtDialog
+    from martepy.marte2.interfaces import tcpmessageproxy, tcpmessageproxy_qt
+    assert EventsWindow is QtEventsWindow
+    assert DefineParametersDialog is QtDialog
+    assert tcpmessageproxy.PortDialog is tcpmessageproxy_qt.PortDialog
+    with pytest.raises(AttributeError):
+        tcpmessageproxy.Missing
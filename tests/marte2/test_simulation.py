@@ -1,7 +1,13 @@
 import os
+import re
 
+import pytest
+
+from martepy.marte2.datasources.files.file_datasources import RFileWriter
+from martepy.marte2.generic_application import LogOptions, MARTe2Exception
+from martepy.functions.extra_functions import getname
 from martepy.marte2.reader import readApplication
-from martepy.frameworks.simulation_frameworkv2 import SimulationGenerator
+from martepy.frameworks.simulation_frameworkv2 import SimulationGenerator, buildMany, buildSimulation
 
 
 def test_simulation():
@@ -21,3 +27,167 @@ def test_simulation():
         app.loadTypeLibrary(type_dir)
         sim_generator = SimulationGenerator(app)
         sim_generator.build()
+
+def test_simulation_copy_on_write():
+    test_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frameworks', 'simulation_framework'))
+    type_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'type_db'))
+    for test_file in ['external_input_one_thread.cfg', 'multistatethread_complextype_timer.cfg']:
+        app = readApplication(os.path.join(test_dir, test_file))[0]
+        app.loadTypeLibrary(type_dir)
+        original = app.writeToConfig()
+        copied = SimulationGenerator(app, copy_on_write=False).build().writeToConfig()
+        generator = SimulationGenerator(app)
+        simulation = generator.build()
+        assert simulation.writeToConfig() == copied
+        # Building the simulation leaves the original application as it was
+        assert app.writeToConfig() == original
+
+        rewritten = generator._rewrittenFunctions()
+        assert rewritten
+        for function in app.functions:
+            assert (function in simulation.functions) == (function not in rewritten)
+
+def test_build_many(tmp_path):
+    test_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frameworks', 'simulation_framework'))
+    type_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'type_db'))
+    apps, expected = [], []
+    for test_file in ['external_input_one_thread.cfg', 'multiple_states.cfg', 'multistatethread_complextype_timer.cfg']:
+        app = readApplication(os.path.join(test_dir, test_file))[0]
+        app.loadTypeLibrary(type_dir)
+        apps.append(app)
+        expected.append(SimulationGenerator(app).build().writeToConfig())
+    type_db = apps[0].type_db
+    for workers in (None, 2):
+        paths = [str(tmp_path / f'{workers}_{index}.cfg') for index in range(len(apps))]
+        results = buildMany(apps, paths, workers=workers)
+        assert [result.path for result in results] == paths
+        for result, text in zip(results, expected):
+            assert result.error is None
+            assert result.seconds > 0
+            with open(result.path) as config_file:
+                assert config_file.read().strip() == text.strip()
+        # The applications given are left as they were
+        assert all(app.type_db is not None and app.factory is not None for app in apps)
+
+    broken = readApplication(os.path.join(test_dir, 'multiple_states.cfg'))[0]
+    broken.states[0].threads.objects[0].functions[0].input_signals = None
+    results = buildMany([apps[0], broken], [str(tmp_path / 'good.cfg'), str(tmp_path / 'bad.cfg')],
+                        type_db=type_db)
+    assert results[0].error is None
+    assert results[1].error.startswith('TypeError')
+    # No partial configuration is left behind
+    assert os.path.exists(results[0].path) and not os.path.exists(results[1].path)
+    with pytest.raises(ValueError):
+        buildMany(apps, [])
+    # Outside of buildMany an application is built with its own type database and factory
+    result = buildSimulation(apps[2], str(tmp_path / 'single.cfg'))
+    assert result.error is None
+    with open(result.path) as config_file:
+        assert config_file.read().strip() == expected[2].strip()
+
+def test_build_many_type_dbs(tmp_path):
+    test_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frameworks', 'simulation_framework'))
+    type_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'type_db'))
+    # Only the second application has the type library its complex type is in
+    plain = readApplication(os.path.join(test_dir, 'external_input_one_thread.cfg'))[0]
+    complex_app = readApplication(os.path.join(test_dir, 'multistatethread_complextype_timer.cfg'))[0]
+    complex_app.loadTypeLibrary(type_dir)
+    apps = [plain, complex_app]
+    expected = [SimulationGenerator(app).build().writeToConfig() for app in apps]
+    for workers in (None, 2):
+        paths = [str(tmp_path / f'{workers}_{index}.cfg') for index in range(len(apps))]
+        results = buildMany(apps, paths, workers=workers)
+        for result, text in zip(results, expected):
+            assert result.error is None
+            with open(result.path) as config_file:
+                assert config_file.read().strip() == text.strip()
+        # Given a type database it is used for every application
+        results = buildMany(apps, paths, workers=workers, type_db=plain.type_db)
+        assert results[0].error is None
+        assert results[1].error.startswith('TypeException')
+        assert not os.path.exists(paths[1])
+
+def test_simulation_incremental():
+    test_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frameworks', 'simulation_framework'))
+    app = readApplication(os.path.join(test_dir, 'multiple_states.cfg'))[0]
+    generator = SimulationGenerator(app)
+    first = generator.build()
+    cached = dict(generator._state_cache)
+    assert cached
+
+    # Renaming a function changes no signal, so every state reuses its constants
+    function = app.states[0].threads.objects[0].functions[-1]
+    function.configuration_name += 'Renamed'
+    generator.configure(app)
+    simulation = generator.build()
+    assert simulation.writeToConfig() == SimulationGenerator(app).build().writeToConfig()
+    for name, entry in generator._state_cache.items():
+        assert entry[1] is cached[name][1]
+        # A copy is inserted rather than the cached function itself
+        inserted = [a for a in simulation.states[name[0]].threads.objects[0].functions
+                    if a.configuration_name == entry[1].configuration_name]
+        assert len(inserted) == bool(entry[1].output_signals)
+        assert all(a is not entry[1] for a in inserted)
+
+    # Editing the constants of earlier simulations changes nothing built later
+    for built in (first, simulation):
+        for state in built.states:
+            for gam in state.threads.objects[0].functions:
+                if gam.configuration_name.startswith(('+missingsignals', '+missingiosignals')):
+                    for signal in gam.input_signals + gam.output_signals:
+                        signal[1]['MARTeConfig']['Alias'] = 'Edited'
+                        signal[1]['MARTeConfig']['Default'] = '7'
+    function.configuration_name += 'Again'
+    generator.configure(app)
+    assert generator.build().writeToConfig() == SimulationGenerator(app).build().writeToConfig()
+
+    # A new signal is logged, so the constants of the states missing it are built again while
+    # the state producing it keeps its own
+    function.output_signals.append(('Extra', {'MARTeConfig': {
+        'DataSource': function.output_signals[0][1]['MARTeConfig']['DataSource'],
+        'Type': 'uint32'}}))
+    generator.configure(app)
+    assert generator.build().writeToConfig() == SimulationGenerator(app).build().writeToConfig()
+    producing = (0, getname(app.states[0]))
+    assert generator._state_cache[producing][1] is cached[producing][1]
+    assert all(entry[1] is not cached[name][1] for name, entry in generator._state_cache.items()
+               if name != producing)
+
+    # Nothing is kept between builds without copy on write
+    generator = SimulationGenerator(app, copy_on_write=False)
+    generator.build()
+    assert not generator._state_cache
+
+def test_simulation_log_options():
+    test_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frameworks', 'simulation_framework'))
+    app = readApplication(os.path.join(test_dir, 'simple_one_thread_constant.cfg'))[0]
+    expected = SimulationGenerator(app).build()
+    generator = SimulationGenerator(app)
+    generator.log_options = LogOptions(include=['newsignal*', 'state'],
+                                       exclude=[re.compile(r'newsignal1')],
+                                       decimation={'newsignal[2-5]': 5}, fileformat='binary')
+    simulation = generator.build()
+    writers = {writer.configuration_name: writer for writer in
+               simulation.additional_datasources if isinstance(writer, RFileWriter)}
+    assert [signal[0] for signal in writers['LoggingFileWriter'].input_signals] == ['state', 'newsignal']
+    assert writers['LoggingFileWriter'].filename == 'output.bin'
+    assert writers['LoggingFileWriter'].numberofbuffers == 1000
+    decimated = writers['LoggingFileWriter5']
+    assert [signal[0] for signal in decimated.input_signals] == ['Trigger', 'newsignal2', 'newsignal3', 'newsignal4', 'newsignal5']
+    assert decimated.storeontrigger and decimated.fileformat == 'binary'
+    assert decimated.filename == 'output_5.bin' and decimated.numberofbuffers == 200
+    # The trigger is computed from the timer's counter, which the simulation reads for it
+    functions = {function.configuration_name: function for function in simulation.functions}
+    assert '(uint32)5' in functions['+LogDecimation5'].expression
+    assert [signal[0] for signal in functions['+TimerHandler'].input_signals] == ['Time', 'Counter']
+    assert [signal[0] for signal in functions['+ToLogGAM5'].input_signals][0] == 'LogTrigger5'
+    assert [str(error) for error in simulation.onlyErrors()] == [str(error) for error in expected.onlyErrors()]
+
+    with pytest.raises(ValueError):
+        LogOptions(fileformat='hdf5')
+    with pytest.raises(ValueError):
+        LogOptions(decimation={'*': 0})
+    # Decimating needs a cycle counter
+    with pytest.raises(MARTe2Exception):
+        readApplication(os.path.join(test_dir, 'simple_one_thread_constant.cfg'))[0].buildLog(
+            LogOptions(decimation={'*': 2}))